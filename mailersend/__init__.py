@@ -4,69 +4,119 @@ MailerSend Python SDK
 A comprehensive Python SDK for the MailerSend API.
 """
 
-from .client import MailerSendClient
+from typing import TYPE_CHECKING
 
-# Import all builders for better UX - users can import everything from main module
-from .builders.email import EmailBuilder
-from .builders.activity import ActivityBuilder, SingleActivityBuilder
-from .builders.analytics import AnalyticsBuilder
-from .builders.domains import DomainsBuilder
-from .builders.identities import IdentityBuilder
-from .builders.inbound import InboundBuilder
-from .builders.messages import MessagesBuilder
-from .builders.schedules import SchedulesBuilder
-from .builders.recipients import RecipientsBuilder
-from .builders.templates import TemplatesBuilder
-from .builders.tokens import TokensBuilder
-from .builders.smtp_users import SmtpUsersBuilder
-from .builders.webhooks import WebhooksBuilder
-from .builders.email_verification import EmailVerificationBuilder
-from .builders.users import UsersBuilder
-from .builders.sms_messages import SmsMessagesBuilder
-from .builders.sms_numbers import SmsNumbersBuilder
-from .builders.sms_activity import SmsActivityBuilder
-from .builders.sms_sending import SmsSendingBuilder
-from .builders.sms_recipients import SmsRecipientsBuilder
-from .builders.sms_webhooks import SmsWebhooksBuilder
-from .builders.sms_inbounds import SmsInboundsBuilder
-from .builders.dmarc_monitoring import DmarcMonitoringBuilder
-from .resources.email import Email
-from .resources.activity import Activity
-from .resources.analytics import Analytics
-from .resources.domains import Domains
-from .models.email import (
-    EmailContact,
-    EmailAttachment,
-    EmailPersonalization,
-    EmailRequest,
-    EmailTrackingSettings,
-    EmailHeader,
-)
-from .models.activity import (
-    ActivityRecipient,
-    ActivityEmail,
-    Activity as ActivityModel,
-    ActivityQueryParams,
-    SingleActivityRequest,
-)
-from .models.analytics import (
-    AnalyticsRequest,
-)
-from .exceptions import (
-    MailerSendError,
-    AuthenticationError,
-    RateLimitExceeded,
-    ResourceNotFoundError,
-    BadRequestError,
-    ServerError,
-    ValidationError,
-)
+from .utils.lazy import lazy_exports
+
+# Exports are imported on first access (see ``lazy_exports`` at the bottom);
+# these imports only inform type checkers and IDEs.
+if TYPE_CHECKING:
+    from .client import MailerSendClient
+    from .async_client import AsyncMailerSendClient
+    from .bulk import BulkSender, BulkSendResult, BulkStatusPoller, BulkStatus
+    from .pagination import Paginator, AsyncPaginator, paginate
+    from .rate_limit import RateLimiter, RateLimitBackend, LocalBackend, FileBackend
+    from .retry import RetryPolicy, retry_budget
+    from .idempotency import IdempotencyStore
+    from .hooks import RequestEvent, RequestHooks
+    from .metrics import MetricsCollector
+    from .middleware import APIRequest, Middleware, MiddlewareChain
+    from .compression import RequestCompression
+    from .outbox import Outbox, OutboxDrainer
+    from .attachments import AttachmentFile
+
+    # Import all builders for better UX - users can import everything from main module
+    from .builders.email import EmailBuilder
+    from .builders.activity import ActivityBuilder, SingleActivityBuilder
+    from .builders.analytics import AnalyticsBuilder
+    from .builders.domains import DomainsBuilder
+    from .builders.identities import IdentityBuilder
+    from .builders.inbound import InboundBuilder
+    from .builders.messages import MessagesBuilder
+    from .builders.schedules import SchedulesBuilder
+    from .builders.recipients import RecipientsBuilder
+    from .builders.templates import TemplatesBuilder
+    from .builders.tokens import TokensBuilder
+    from .builders.smtp_users import SmtpUsersBuilder
+    from .builders.webhooks import WebhooksBuilder
+    from .builders.email_verification import EmailVerificationBuilder
+    from .builders.users import UsersBuilder
+    from .builders.sms_messages import SmsMessagesBuilder
+    from .builders.sms_numbers import SmsNumbersBuilder
+    from .builders.sms_activity import SmsActivityBuilder
+    from .builders.sms_sending import SmsSendingBuilder
+    from .builders.sms_recipients import SmsRecipientsBuilder
+    from .builders.sms_webhooks import SmsWebhooksBuilder
+    from .builders.sms_inbounds import SmsInboundsBuilder
+    from .builders.dmarc_monitoring import DmarcMonitoringBuilder
+    from .resources.email import Email
+    from .resources.activity import Activity
+    from .resources.analytics import Analytics
+    from .resources.domains import Domains
+    from .models.email import (
+        EmailContact,
+        EmailAttachment,
+        EmailPersonalization,
+        EmailRequest,
+        EmailTrackingSettings,
+        EmailHeader,
+    )
+    from .models.activity import (
+        ActivityRecipient,
+        ActivityEmail,
+        Activity as ActivityModel,
+        ActivityQueryParams,
+        SingleActivityRequest,
+    )
+    from .models.analytics import (
+        AnalyticsRequest,
+    )
+    from .exceptions import (
+        MailerSendError,
+        AuthenticationError,
+        RateLimitExceeded,
+        ResourceNotFoundError,
+        BadRequestError,
+        ServerError,
+        ValidationError,
+    )
 
 __version__ = "2.0.0"
 
 __all__ = [
     # Core client
     "MailerSendClient",
+    "AsyncMailerSendClient",
+    # Bulk helpers
+    "BulkSender",
+    "BulkSendResult",
+    "BulkStatusPoller",
+    "BulkStatus",
+    # Pagination
+    "Paginator",
+    "AsyncPaginator",
+    "paginate",
+    # Rate limiting
+    "RateLimiter",
+    "RateLimitBackend",
+    "LocalBackend",
+    "FileBackend",
+    # Retries
+    "RetryPolicy",
+    "retry_budget",
+    "IdempotencyStore",
+    "RequestEvent",
+    "RequestHooks",
+    "MetricsCollector",
+    "APIRequest",
+    "Middleware",
+    "MiddlewareChain",
+    "RequestCompression",
+    # Durable sending
+    "Outbox",
+    "OutboxDrainer",
+    # Attachments
+    "AttachmentFile",
     # Builders - All available from main module for better UX
     "EmailBuilder",
     "ActivityBuilder",
@@ -121,3 +171,101 @@ __all__ = [
     "ServerError",
     "ValidationError",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".client": ("MailerSendClient",),
+        ".async_client": ("AsyncMailerSendClient",),
+        ".bulk": (
+            "BulkSender",
+            "BulkSendResult",
+            "BulkStatusPoller",
+            "BulkStatus",
+        ),
+        ".pagination": (
+            "Paginator",
+            "AsyncPaginator",
+            "paginate",
+        ),
+        ".rate_limit": (
+            "RateLimiter",
+            "RateLimitBackend",
+            "LocalBackend",
+            "FileBackend",
+        ),
+        ".retry": (
+            "RetryPolicy",
+            "retry_budget",
+        ),
+        ".idempotency": ("IdempotencyStore",),
+        ".hooks": (
+            "RequestEvent",
+            "RequestHooks",
+        ),
+        ".metrics": ("MetricsCollector",),
+        ".middleware": (
+            "APIRequest",
+            "Middleware",
+            "MiddlewareChain",
+        ),
+        ".compression": ("RequestCompression",),
+        ".outbox": ("Outbox", "OutboxDrainer"),
+        ".attachments": ("AttachmentFile",),
+        ".builders.email": ("EmailBuilder",),
+        ".builders.activity": (
+            "ActivityBuilder",
+            "SingleActivityBuilder",
+        ),
+        ".builders.analytics": ("AnalyticsBuilder",),
+        ".builders.domains": ("DomainsBuilder",),
+        ".builders.identities": ("IdentityBuilder",),
+        ".builders.inbound": ("InboundBuilder",),
+        ".builders.messages": ("MessagesBuilder",),
+        ".builders.schedules": ("SchedulesBuilder",),
+        ".builders.recipients": ("RecipientsBuilder",),
+        ".builders.templates": ("TemplatesBuilder",),
+        ".builders.tokens": ("TokensBuilder",),
+        ".builders.smtp_users": ("SmtpUsersBuilder",),
+        ".builders.webhooks": ("WebhooksBuilder",),
+        ".builders.email_verification": ("EmailVerificationBuilder",),
+        ".builders.users": ("UsersBuilder",),
+        ".builders.sms_messages": ("SmsMessagesBuilder",),
+        ".builders.sms_numbers": ("SmsNumbersBuilder",),
+        ".builders.sms_activity": ("SmsActivityBuilder",),
+        ".builders.sms_sending": ("SmsSendingBuilder",),
+        ".builders.sms_recipients": ("SmsRecipientsBuilder",),
+        ".builders.sms_webhooks": ("SmsWebhooksBuilder",),
+        ".builders.sms_inbounds": ("SmsInboundsBuilder",),
+        ".builders.dmarc_monitoring": ("DmarcMonitoringBuilder",),
+        ".resources.email": ("Email",),
+        ".resources.activity": ("Activity",),
+        ".resources.analytics": ("Analytics",),
+        ".resources.domains": ("Domains",),
+        ".models.email": (
+            "EmailContact",
+            "EmailAttachment",
+            "EmailPersonalization",
+            "EmailRequest",
+            "EmailTrackingSettings",
+            "EmailHeader",
+        ),
+        ".models.activity": (
+            "ActivityRecipient",
+            "ActivityEmail",
+            ("Activity", "ActivityModel"),
+            "ActivityQueryParams",
+            "SingleActivityRequest",
+        ),
+        ".models.analytics": ("AnalyticsRequest",),
+        ".exceptions": (
+            "MailerSendError",
+            "AuthenticationError",
+            "RateLimitExceeded",
+            "ResourceNotFoundError",
+            "BadRequestError",
+            "ServerError",
+            "ValidationError",
+        ),
+    },
+)
@@ -0,0 +1,131 @@
+"""
+Connection pooling for the synchronous client.
+
+``PooledHTTPAdapter`` is a ``requests`` adapter whose pool size, blocking
+behaviour and TCP keep-alive can be tuned, and which reports how its
+connection pools are used. A client shared by many threads should have
+``pool_maxsize`` at least as large as the number of threads; otherwise
+connections beyond the pool size are closed after each request ("connection
+pool is full, discarding connection") and every reuse pays a new TLS
+handshake.
+"""
+
+import socket
+from typing import Any, Dict, List, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from .constants import (
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    TCP_KEEPALIVE_COUNT,
+    TCP_KEEPALIVE_IDLE,
+    TCP_KEEPALIVE_INTERVAL,
+)
+
+
+def keepalive_socket_options(
+    idle: int = TCP_KEEPALIVE_IDLE,
+    interval: int = TCP_KEEPALIVE_INTERVAL,
+    count: int = TCP_KEEPALIVE_COUNT,
+) -> List[Tuple[int, int, int]]:
+    """
+    Socket options enabling TCP keep-alive probes on pooled connections.
+
+    Probes keep idle connections open through NAT gateways and load
+    balancers, so they can be reused instead of re-established. Options the
+    platform does not support are left out.
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    for name, value in (
+        ("TCP_KEEPIDLE", idle),
+        ("TCP_KEEPALIVE", idle),  # macOS name for TCP_KEEPIDLE
+        ("TCP_KEEPINTVL", interval),
+        ("TCP_KEEPCNT", count),
+    ):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with configurable pooling, keep-alive and pool statistics."""
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["tcp_keepalive"]
+
+    def __init__(
+        self,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        pool_block: bool = False,
+        tcp_keepalive: bool = False,
+        max_retries: int = 0,
+    ):
+        """
+        Initialize the adapter.
+
+        Args:
+            pool_connections: Number of per-host pools kept (distinct hosts)
+            pool_maxsize: Maximum connections kept open per host
+            pool_block: Wait for a free connection when all ``pool_maxsize``
+                       are busy instead of opening a throwaway one
+            tcp_keepalive: Enable TCP keep-alive probes on connections
+            max_retries: Retries performed by urllib3 itself
+        """
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be at least 1")
+
+        self.tcp_keepalive = tcp_keepalive
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=max_retries,
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.tcp_keepalive:
+            pool_kwargs.setdefault("socket_options", keepalive_socket_options())
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Describe the configuration and current use of the connection pools.
+
+        For every host pool, ``connections_opened`` counts connections
+        created so far, ``idle_connections`` those waiting for reuse, and
+        ``requests`` the requests served.
+        """
+        pools: List[Dict[str, Any]] = []
+        manager = self.poolmanager
+        for key in list(manager.pools.keys()):
+            pool = manager.pools.get(key)
+            if pool is None:
+                continue
+            pools.append(
+                {
+                    "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                    "connections_opened": pool.num_connections,
+                    "idle_connections": _idle_connections(pool),
+                    "requests": pool.num_requests,
+                }
+            )
+
+        return {
+            "pool_connections": self._pool_connections,
+            "pool_maxsize": self._pool_maxsize,
+            "pool_block": self._pool_block,
+            "tcp_keepalive": self.tcp_keepalive,
+            "pools": pools,
+        }
+
+
+def _idle_connections(pool) -> Optional[int]:
+    """Number of connections sitting in a urllib3 pool, ready for reuse."""
+    queue = getattr(pool, "pool", None)
+    if queue is None:
+        return None
+    with queue.mutex:
+        return sum(1 for conn in queue.queue if conn is not None)
@@ -0,0 +1,653 @@
+"""
+Asyncio client for the MailerSend API.
+
+The asynchronous client exposes the same resources as ``MailerSendClient``
+(``client.emails``, ``client.activities``, ``client.sms_sending``...) but every
+resource method returns an awaitable. Requests are built by the regular
+synchronous resource classes, so request models, validation and the
+``APIResponse`` container are shared between both clients; only the transport
+differs.
+
+Requires the optional ``httpx`` dependency::
+
+    pip install "mailersend[async]"
+"""
+
+import asyncio
+import functools
+import logging
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+from urllib.parse import urljoin
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None
+
+from requests.structures import CaseInsensitiveDict
+
+from . import resources
+from .client import BaseClient
+from .compression import CompressedStream
+from .constants import (
+    ACTIVITY_MAX_RANGE_SECONDS,
+    DEFAULT_BASE_URL,
+    DEFAULT_TIMEOUT,
+    IDEMPOTENCY_HEADER,
+)
+from .exceptions import MailerSendError
+from .logging import get_logger, RequestLogger
+from .models.base import APIResponse, BaseModel
+from .pagination import AsyncPaginator
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, current_policy
+from .idempotency import IdempotencyStore, resolve_idempotency_key
+from .hooks import RequestEvent, RequestHooks
+from .middleware import APIRequest, Middleware, MiddlewareChain
+from .serialization import JSON_BACKEND, StreamingBody, dumps
+from .utils.headers import user_agent
+from .models.email import EmailRequest
+from .resources.base import BaseResource
+from .resources.email import Email, EmailSendResult, completed_sends
+from .resources.activity import Activity, export_windows, ordered_unique
+
+
+class _CapturedRequest(Exception):
+    """Carries the request a synchronous resource method tried to send."""
+
+    def __init__(self, call: Dict[str, Any]):
+        self.call = call
+        super().__init__("request captured")
+
+
+class _RequestRecorder:
+    """
+    Stand-in client handed to synchronous resources.
+
+    Instead of performing I/O, ``request`` raises the arguments it was called
+    with so the asyncio client can send them on its own transport.
+    """
+
+    def __init__(self, client: Optional["AsyncMailerSendClient"] = None):
+        self._client = client
+
+    @property
+    def trust_server_data(self) -> bool:
+        """The asyncio client's setting, read by ``_create_response``."""
+        return self._client is not None and self._client.trust_server_data
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        raise _CapturedRequest(
+            {
+                "method": method,
+                "path": path,
+                "params": params,
+                "body": body,
+                "headers": headers,
+            }
+        )
+
+
+class AsyncResource:
+    """
+    Awaitable view over a synchronous resource class.
+
+    Every public method of the wrapped resource becomes a coroutine function
+    with the same signature. The synchronous method runs up to its single
+    ``client.request`` call (validation, payload building, logging), the
+    request is sent asynchronously and the response is wrapped with the
+    resource's ``_create_response``.
+
+    Methods that post-process the raw HTTP response in a way
+    ``_create_response`` cannot express are overridden in subclasses (see
+    ``AsyncEmail.send``).
+    """
+
+    RESOURCE_CLASS: Type[BaseResource] = BaseResource
+
+    def __init__(self, client: "AsyncMailerSendClient"):
+        self._client = client
+        self._resource = self.RESOURCE_CLASS(_RequestRecorder(client), client.logger)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_resource":
+            raise AttributeError(name)
+        attribute = getattr(self._resource, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        async def method(*args, **kwargs) -> APIResponse:
+            response = await self._send(attribute, *args, **kwargs)
+            return self._resource._create_response(response, method=name)
+
+        # Cache the coroutine function so the wrapper is only built once
+        setattr(self, name, method)
+        return method
+
+    async def _send(self, method: Callable[..., Any], *args, **kwargs):
+        """Run a synchronous resource method and send the request it builds."""
+        try:
+            method(*args, **kwargs)
+        except _CapturedRequest as captured:
+            call = captured.call
+        else:
+            raise MailerSendError(
+                f"{type(self._resource).__name__}.{method.__name__} "
+                "did not issue a request"
+            )
+        # Sent outside the handler, so API errors are not chained to the capture
+        return await self._client.request(**call)
+
+    def paginate(
+        self,
+        list_method: Union[str, Callable[..., Awaitable[APIResponse]]],
+        request: Optional[BaseModel] = None,
+        prefetch: bool = True,
+        max_in_flight: int = 1,
+        model_class: Optional[Type[BaseModel]] = None,
+        trusted: Optional[bool] = None,
+    ) -> AsyncPaginator:
+        """
+        Iterate lazily over every item of one of this resource's list methods.
+
+        Args:
+            list_method: Name of a ``list_*`` method or the awaitable method itself
+            request: List request for the first page (defaults are used if omitted)
+            prefetch: Fetch the next page concurrently with consuming the current one
+            max_in_flight: Maximum number of pages fetched concurrently once the
+                          last page is known
+            model_class: Model to build each item as (raw dicts if omitted)
+            trusted: Build items without validation (defaults to the client's
+                    ``trust_server_data`` setting)
+
+        Returns:
+            AsyncPaginator to be consumed with ``async for``
+        """
+        if isinstance(list_method, str):
+            list_method = getattr(self, list_method)
+        if trusted is None:
+            trusted = self._client.trust_server_data
+        return AsyncPaginator(
+            list_method,
+            request,
+            prefetch=prefetch,
+            max_in_flight=max_in_flight,
+            model_class=model_class,
+            trusted=trusted,
+        )
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(dir(self._resource)))
+
+
+class AsyncEmail(AsyncResource):
+    """Asyncio counterpart of the ``Email`` resource."""
+
+    RESOURCE_CLASS = Email
+
+    async def send(
+        self, email: EmailRequest, idempotency_key: Optional[str] = None
+    ) -> APIResponse:
+        """
+        Send a single email.
+
+        Args:
+            email: A fully-validated EmailRequest object
+            idempotency_key: Key identifying this send (derived from the
+                            email content if omitted)
+
+        Returns:
+            APIResponse with email ID and metadata
+        """
+        response = await self._send(
+            self._resource.send, email, idempotency_key=idempotency_key
+        )
+
+        # Create custom data with email ID from headers
+        email_data = {"id": response.headers.get("x-message-id")}
+
+        return self._resource._create_response(response, email_data)
+
+    async def send_many(
+        self, emails: Iterable[EmailRequest], max_in_flight: int = 8
+    ) -> AsyncIterator[EmailSendResult]:
+        """
+        Send emails one request each, with up to ``max_in_flight`` in flight.
+
+        See ``Email.send_many``; use with ``async for``.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        pending: Dict[asyncio.Future, Tuple[int, EmailRequest]] = {}
+        try:
+            for index, email in enumerate(emails):
+                if len(pending) >= max_in_flight:
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for result in completed_sends(done, pending):
+                        yield result
+                pending[asyncio.ensure_future(self.send(email))] = (index, email)
+
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for result in completed_sends(done, pending):
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+class AsyncActivity(AsyncResource):
+    """Asyncio counterpart of the ``Activity`` resource."""
+
+    RESOURCE_CLASS = Activity
+
+    async def export(
+        self,
+        domain_id: str,
+        date_from: int,
+        date_to: int,
+        events: Optional[Iterable[str]] = None,
+        limit: int = 100,
+        max_in_flight: int = 4,
+        window: int = ACTIVITY_MAX_RANGE_SECONDS,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream every activity record of a domain over an arbitrary date range.
+
+        See ``Activity.export``; use with ``async for``.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        events = list(events) if events is not None else None
+        requests = [
+            Activity._export_request(domain_id, start, end, events, limit)
+            for start, end in export_windows(date_from, date_to, window)
+        ]
+
+        async def fetch_window(request) -> List[Dict[str, Any]]:
+            return [record async for record in self.paginate(self.get, request)]
+
+        pending: Deque[asyncio.Future] = deque()
+        seen: Set[str] = set()
+        try:
+            for request in requests:
+                pending.append(asyncio.ensure_future(fetch_window(request)))
+                if len(pending) < max_in_flight:
+                    continue
+                records, seen = ordered_unique(await pending.popleft(), seen)
+                for record in records:
+                    yield record
+
+            while pending:
+                records, seen = ordered_unique(await pending.popleft(), seen)
+                for record in records:
+                    yield record
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+@functools.lru_cache(maxsize=None)
+def _async_resource(resource_class: Type[BaseResource]) -> Type[AsyncResource]:
+    """Build an ``AsyncResource`` subclass wrapping ``resource_class``."""
+    return type(
+        f"Async{resource_class.__name__}",
+        (AsyncResource,),
+        {
+            "RESOURCE_CLASS": resource_class,
+            "__doc__": f"Asyncio counterpart of the ``{resource_class.__name__}`` "
+            "resource.",
+        },
+    )
+
+
+_ASYNC_RESOURCES: Dict[Type[BaseResource], Type[AsyncResource]] = {
+    Email: AsyncEmail,
+    Activity: AsyncActivity,
+}
+
+
+def __getattr__(name: str) -> Any:
+    # Wrappers of the remaining resources are built on first use
+    if name.startswith("Async") and name[5:] in resources.__all__:
+        return _async_resource(getattr(resources, name[5:]))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class AsyncMailerSendClient(BaseClient):
+    """
+    Asyncio client for the MailerSend API.
+
+    Mirrors ``MailerSendClient``: the same resources are available under the
+    same attribute names, but resource methods must be awaited. Connections
+    are pooled by a shared ``httpx.AsyncClient``, so a single event loop can
+    keep many requests in flight.
+
+    Examples:
+        >>> async with AsyncMailerSendClient() as client:
+        ...     response = await client.emails.send(email_request)
+
+        >>> # Fan out many sends on one event loop
+        >>> async with AsyncMailerSendClient(max_connections=200) as client:
+        ...     responses = await asyncio.gather(
+        ...         *(client.emails.send(email) for email in emails)
+        ...     )
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: int = DEFAULT_TIMEOUT,
+        max_retries: int = 3,
+        debug: bool = False,
+        logger: Optional[logging.Logger] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotency_store: Optional[IdempotencyStore] = None,
+        hooks: Optional[Sequence[RequestHooks]] = None,
+        middleware: Optional[Sequence[Middleware]] = None,
+        trust_server_data: bool = False,
+        user_agent_products: Optional[Sequence[str]] = None,
+    ) -> None:
+        """
+        Initialize the asyncio MailerSend client.
+
+        Args:
+            api_key: Your MailerSend API key. If not provided, will try to read
+                    from MAILERSEND_API_KEY environment variable
+            base_url: Base URL for API requests
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries for failed requests
+            debug: Enable detailed debug logging
+            logger: Custom logger instance
+            max_connections: Maximum number of concurrent connections in the pool
+            max_keepalive_connections: Maximum number of idle connections kept
+                    alive for reuse
+            keepalive_expiry: Seconds an idle connection is kept for reuse
+            http_client: Pre-configured ``httpx.AsyncClient`` to use instead of
+                    creating one (the caller remains responsible for closing it)
+            rate_limiter: Client-side rate limiter that paces outgoing requests
+                    (may be shared with other clients, sync or async)
+            retry_policy: Backoff and retry budget for transient failures
+                    (overrides max_retries)
+            idempotency_store: Record of completed send requests; duplicate
+                    submissions are answered from it without a request
+            hooks: Instrumentation hooks told about every request attempt,
+                    such as a ``MetricsCollector``
+            middleware: Layers every request attempt passes through, in order
+                    (see ``client.middleware`` to change them later)
+            trust_server_data: Build response models without validating the
+                    API data (see ``BaseModel.construct_trusted``)
+            user_agent_products: Product tokens appended to the User-Agent
+                    header, such as ``["my-app/1.4"]``
+
+        Raises:
+            ImportError: If httpx is not installed
+            ValueError: If no API key is provided and MAILERSEND_API_KEY
+                       environment variable is not set
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncMailerSendClient requires httpx. "
+                'Install it with: pip install "mailersend[async]"'
+            )
+
+        self.api_key = self._resolve_api_key(api_key)
+        self.base_url = base_url
+        self.timeout = timeout
+        self.debug = debug
+        self.logger = logger or get_logger(debug=debug)
+        self.request_logger = RequestLogger(self.logger)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self.idempotency_store = idempotency_store
+        self.hooks = list(hooks or ())
+        self.middleware = MiddlewareChain(middleware)
+        self.trust_server_data = trust_server_data
+        self.user_agent = user_agent(user_agent_products or ())
+
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "User-Agent": self.user_agent,
+        }
+
+        self.logger.info("MailerSend async client initialized successfully")
+        if debug:
+            self.logger.info("🐛 Debug mode enabled - detailed logging active")
+
+    async def __aenter__(self) -> "AsyncMailerSendClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _build_resource(self, resource_class: Type[BaseResource]) -> AsyncResource:
+        """Wrap ``resource_class`` in its asyncio counterpart."""
+        wrapper = _ASYNC_RESOURCES.get(resource_class)
+        if wrapper is None:
+            wrapper = _async_resource(resource_class)
+        return wrapper(self)
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool if this client created it."""
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> "httpx.Response":
+        """
+        Make an HTTP request to the MailerSend API.
+
+        Transient failures are retried according to ``retry_policy``, the
+        client's policy adjusted by any enclosing ``retry_budget`` block.
+        Send requests carry an ``Idempotency-Key`` header that stays the same
+        across retries.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            path: API endpoint path
+            params: Query parameters
+            body: Request body data
+            retry_policy: Retry policy for this call only
+            headers: Extra request headers
+
+        Returns:
+            Response object
+
+        Raises:
+            AuthenticationError: If authentication fails
+            ResourceNotFoundError: If the requested resource is not found
+            RateLimitExceeded: If API rate limits are exceeded
+            BadRequestError: If the request was malformed
+            ServerError: If a server error occurs
+            MailerSendError: For other API errors
+        """
+        url = urljoin(self.base_url, path)
+
+        # Start request logging
+        request_id = self.request_logger.start_request(method, url, params, body)
+
+        try:
+            headers = CaseInsensitiveDict(headers or {})
+            idempotency_key = resolve_idempotency_key(method, path, body, headers)
+            if idempotency_key is not None:
+                headers[IDEMPOTENCY_HEADER] = idempotency_key
+                cached = self._completed_response(idempotency_key, request_id)
+                if cached is not None:
+                    return cached
+
+            retry = (retry_policy or current_policy(self.retry_policy)).start(
+                method, keyed=idempotency_key is not None
+            )
+            event = None
+            if self.hooks:
+                event = RequestEvent(request_id, method, path, retry.started)
+
+            while True:
+                if self.rate_limiter is not None:
+                    delay = self.rate_limiter.reserve()
+                    self._log_throttle(delay, request_id)
+                    await asyncio.sleep(delay)
+
+                if event is not None:
+                    self._begin_attempt(event, retry.attempt)
+
+                try:
+                    request = APIRequest(
+                        method, url, path, params, body, headers, self.timeout
+                    )
+                    if self.middleware:
+                        send = self.middleware.async_handler(self._send)
+                        response = await send(request)
+                    else:
+                        response = await self._send(request)
+                except httpx.HTTPError as e:
+                    if event is not None:
+                        self._end_attempt(event, request, error=e)
+                    delay = None
+                    if isinstance(e, httpx.TransportError):
+                        delay = retry.delay_for_error(
+                            reached_server=not isinstance(
+                                e, (httpx.ConnectError, httpx.ConnectTimeout)
+                            )
+                        )
+                    if delay is None:
+                        self.request_logger.log_error(e)
+                        raise MailerSendError(f"Request failed: {str(e)}")
+                else:
+                    # Log response details
+                    self.request_logger.log_response(response)
+                    if event is not None:
+                        self._end_attempt(event, request, response=response)
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.update(response.status_code, response.headers)
+
+                    # Handle different response status codes
+                    if 200 <= response.status_code < 300:
+                        if (
+                            idempotency_key is not None
+                            and self.idempotency_store is not None
+                        ):
+                            self.idempotency_store.put(idempotency_key, response)
+                        return response
+
+                    delay = retry.delay_for_response(
+                        response.status_code, response.headers
+                    )
+                    if delay is None:
+                        self._raise_for_status(response, request_id)
+
+                if event is not None:
+                    event.retry_delay = delay
+                    self._emit("on_retry", event)
+                self.request_logger.log_retry(retry.attempt, round(delay, 3))
+                await asyncio.sleep(delay)
+        finally:
+            self.request_logger.end_request()
+
+    async def _send(self, request: APIRequest) -> "httpx.Response":
+        """Send one attempt over httpx; the end of the middleware chain."""
+        body = request.body
+        headers = {**self.headers, **request.headers}
+        if isinstance(body, StreamingBody):
+            # httpx streams sync iterables only from its sync client
+            headers["Content-Length"] = str(len(body))
+            body = body.aiter_bytes()
+        elif isinstance(body, CompressedStream):
+            body = body.aiter_bytes()
+        elif body is not None and not isinstance(body, (bytes, bytearray)):
+            # Kept on the request so hooks see the size of the body as sent
+            body = request.body = dumps(body)
+        return await self.http_client.request(
+            request.method,
+            request.url,
+            params=request.params,
+            content=body,
+            headers=headers,
+            timeout=request.timeout,
+        )
+
+    def get_debug_info(self) -> Dict[str, Any]:
+        """Get current debug and configuration information."""
+        return {
+            "debug_enabled": self.debug,
+            "base_url": self.base_url,
+            "timeout": self.timeout,
+            "user_agent": self.user_agent,
+            "logger_level": self.logger.level,
+            "rate_limiter": self.rate_limiter.snapshot() if self.rate_limiter else None,
+            "retry_policy": repr(self.retry_policy),
+            "middleware": self.middleware.names(),
+            "json_backend": JSON_BACKEND,
+            "compression": self._compression_stats(),
+            "connection_pool": self._pool_stats(),
+        }
+
+    def _pool_stats(self) -> Optional[Dict[str, Any]]:
+        """Connection pool limits and use, when the transport exposes them."""
+        # httpx has no public pool API; read httpcore's pool when present
+        pool = getattr(getattr(self.http_client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is None:
+            return None
+        return {
+            "max_connections": getattr(pool, "_max_connections", None),
+            "max_keepalive_connections": getattr(
+                pool, "_max_keepalive_connections", None
+            ),
+            "connections": len(connections),
+            "idle_connections": sum(1 for conn in connections if conn.is_idle()),
+        }
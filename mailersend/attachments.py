@@ -0,0 +1,114 @@
+"""
+File attachments that are read only while the request is sent.
+
+``AttachmentFile`` keeps a reference to a file instead of its base64 text.
+When an email is sent, its request body is streamed: the file is
+memory-mapped and base64-encoded chunk by chunk straight into the body, so a
+large attachment is never held in memory in full, neither as bytes nor as a
+string. The encoded text is only built as a whole where a complete copy is
+required, such as ``model_dump()`` or storing the email in an ``Outbox``.
+
+Examples:
+    >>> attachment = EmailAttachment(
+    ...     content=AttachmentFile("report.pdf"), filename="report.pdf",
+    ...     disposition="attachment",
+    ... )
+"""
+
+import binascii
+import mmap
+import os
+from pathlib import Path
+from typing import Iterator, Union
+
+from .constants import ATTACHMENT_CHUNK_SIZE
+from .exceptions import ValidationError
+
+
+class AttachmentFile:
+    """
+    Reference to a file sent base64-encoded as attachment content.
+
+    The file is checked when the reference is created and read every time
+    the email is encoded, so it must still exist, unchanged in size, when
+    the email is sent.
+    """
+
+    __slots__ = ("path", "size", "mtime_ns")
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Reference a file.
+
+        Args:
+            path: Path of the file to attach
+
+        Raises:
+            OSError: If the file does not exist or cannot be read
+        """
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as file:
+            stat = os.fstat(file.fileno())
+        self.size = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+
+    @property
+    def encoded_size(self) -> int:
+        """Length of the base64 text of the file."""
+        return (self.size + 2) // 3 * 4
+
+    def iter_base64(self, chunk_size: int = ATTACHMENT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Yield the base64 encoding of the file in chunks.
+
+        Args:
+            chunk_size: Bytes of the file encoded per chunk; a multiple of 3
+
+        Yields:
+            ASCII base64 chunks which concatenate to the encoded file
+
+        Raises:
+            ValidationError: If the file size changed since it was referenced
+        """
+        if chunk_size <= 0 or chunk_size % 3:
+            raise ValueError("chunk_size must be a positive multiple of 3")
+
+        with open(self.path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size != self.size:
+                raise ValidationError(
+                    f"Attachment file {self.path} changed size from {self.size} "
+                    f"to {size} bytes after it was attached"
+                )
+            # Empty files cannot be mapped
+            if not size:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as data:
+                    for start in range(0, size, chunk_size):
+                        yield binascii.b2a_base64(
+                            data[start : start + chunk_size], newline=False
+                        )
+
+    def fingerprint(self) -> bytes:
+        """Identify the file and its version without reading it."""
+        return f"{self.path}\0{self.size}\0{self.mtime_ns}".encode()
+
+    def read_base64(self) -> str:
+        """Read and encode the whole file."""
+        return b"".join(self.iter_base64()).decode("ascii")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AttachmentFile):
+            return NotImplemented
+        return (self.path, self.size, self.mtime_ns) == (
+            other.path,
+            other.size,
+            other.mtime_ns,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.path, self.size, self.mtime_ns))
+
+    def __repr__(self) -> str:
+        return f"AttachmentFile({self.path!r}, size={self.size})"
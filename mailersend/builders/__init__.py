@@ -5,28 +5,33 @@ The builder pattern provides a fluent, chainable API for constructing
 complex email requests with intelligent defaults and validation.
 """
 
-from .email import EmailBuilder
-from .activity import ActivityBuilder, SingleActivityBuilder
-from .analytics import AnalyticsBuilder
-from .domains import DomainsBuilder
-from .identities import IdentityBuilder
-from .inbound import InboundBuilder
-from .messages import MessagesBuilder
-from .schedules import SchedulesBuilder
-from .recipients import RecipientsBuilder
-from .templates import TemplatesBuilder
-from .tokens import TokensBuilder
-from .webhooks import WebhooksBuilder
-from .email_verification import EmailVerificationBuilder
-from .users import UsersBuilder
-from .sms_messages import SmsMessagesBuilder
-from .sms_numbers import SmsNumbersBuilder
-from .sms_activity import SmsActivityBuilder
-from .sms_sending import SmsSendingBuilder
-from .sms_recipients import SmsRecipientsBuilder
-from .sms_webhooks import SmsWebhooksBuilder
-from .sms_inbounds import SmsInboundsBuilder
-from .dmarc_monitoring import DmarcMonitoringBuilder
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .email import EmailBuilder
+    from .activity import ActivityBuilder, SingleActivityBuilder
+    from .analytics import AnalyticsBuilder
+    from .domains import DomainsBuilder
+    from .identities import IdentityBuilder
+    from .inbound import InboundBuilder
+    from .messages import MessagesBuilder
+    from .schedules import SchedulesBuilder
+    from .recipients import RecipientsBuilder
+    from .templates import TemplatesBuilder
+    from .tokens import TokensBuilder
+    from .webhooks import WebhooksBuilder
+    from .email_verification import EmailVerificationBuilder
+    from .users import UsersBuilder
+    from .sms_messages import SmsMessagesBuilder
+    from .sms_numbers import SmsNumbersBuilder
+    from .sms_activity import SmsActivityBuilder
+    from .sms_sending import SmsSendingBuilder
+    from .sms_recipients import SmsRecipientsBuilder
+    from .sms_webhooks import SmsWebhooksBuilder
+    from .sms_inbounds import SmsInboundsBuilder
+    from .dmarc_monitoring import DmarcMonitoringBuilder
 
 __all__ = [
     "EmailBuilder",
@@ -53,3 +58,34 @@ __all__ = [
     "SmsInboundsBuilder",
     "DmarcMonitoringBuilder",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".email": ("EmailBuilder",),
+        ".activity": (
+            "ActivityBuilder",
+            "SingleActivityBuilder",
+        ),
+        ".analytics": ("AnalyticsBuilder",),
+        ".domains": ("DomainsBuilder",),
+        ".identities": ("IdentityBuilder",),
+        ".inbound": ("InboundBuilder",),
+        ".messages": ("MessagesBuilder",),
+        ".schedules": ("SchedulesBuilder",),
+        ".recipients": ("RecipientsBuilder",),
+        ".templates": ("TemplatesBuilder",),
+        ".tokens": ("TokensBuilder",),
+        ".webhooks": ("WebhooksBuilder",),
+        ".email_verification": ("EmailVerificationBuilder",),
+        ".users": ("UsersBuilder",),
+        ".sms_messages": ("SmsMessagesBuilder",),
+        ".sms_numbers": ("SmsNumbersBuilder",),
+        ".sms_activity": ("SmsActivityBuilder",),
+        ".sms_sending": ("SmsSendingBuilder",),
+        ".sms_recipients": ("SmsRecipientsBuilder",),
+        ".sms_webhooks": ("SmsWebhooksBuilder",),
+        ".sms_inbounds": ("SmsInboundsBuilder",),
+        ".dmarc_monitoring": ("DmarcMonitoringBuilder",),
+    },
+)
@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union
 
+from ..attachments import AttachmentFile
 from ..models.email import (
     EmailRequest,
     EmailContact,
@@ -356,6 +357,9 @@ class EmailBuilder:
         """
         Attach a file to the email.
 
+        The file is not read here: it is base64-encoded into the request
+        body while the email is sent, so it must still exist then.
+
         Args:
             file_path: Path to file to attach
             filename: Optional custom filename (defaults to actual filename)
@@ -372,14 +376,13 @@ class EmailBuilder:
             if not path.exists():
                 raise ValidationError(f"File not found: {file_path}")
 
-            # Read and encode file content
-            content = base64.b64encode(path.read_bytes()).decode("utf-8")
-
             # Use provided filename or extract from path
             final_filename = filename or path.name
 
             attachment = EmailAttachment(
-                content=content, filename=final_filename, disposition=disposition
+                content=AttachmentFile(path),
+                filename=final_filename,
+                disposition=disposition,
             )
 
             self._attachments.append(attachment)
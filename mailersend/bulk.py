@@ -0,0 +1,419 @@
+"""Helpers for large bulk email sends."""
+
+import heapq
+import logging
+import time
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextvars import copy_context
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .constants import (
+    BULK_EMAIL_MAX_BYTES,
+    BULK_EMAIL_MAX_EMAILS,
+    BULK_EMAIL_TERMINAL_STATES,
+)
+from .exceptions import (
+    AuthenticationError,
+    BadRequestError,
+    MailerSendError,
+    ResourceNotFoundError,
+    ValidationError,
+)
+from .logging import get_logger
+from .models.base import APIResponse
+from .models.email import EmailRequest
+from .serialization import (
+    EncodedModels,
+    StreamingBody,
+    bodies_array,
+    model_body,
+)
+
+
+class BulkChunkError:
+    """A chunk of emails that could not be submitted."""
+
+    def __init__(self, chunk_index: int, email_count: int, error: Exception):
+        self.chunk_index = chunk_index
+        self.email_count = email_count
+        self.error = error
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkChunkError(chunk_index={self.chunk_index}, "
+            f"email_count={self.email_count}, error={self.error!r})"
+        )
+
+
+class BulkSendResult:
+    """
+    Aggregate handle for a chunked bulk send.
+
+    Collects the ``bulk_email_id`` of every accepted chunk, in submission
+    order, together with any chunks that failed.
+    """
+
+    def __init__(self):
+        self.responses: Dict[int, APIResponse] = {}
+        self.errors: List[BulkChunkError] = []
+        self.chunk_count = 0
+        self.email_count = 0
+
+    @property
+    def bulk_email_ids(self) -> List[str]:
+        """IDs of the accepted bulk requests, ordered by chunk."""
+        return [
+            self.responses[index].get("bulk_email_id")
+            for index in sorted(self.responses)
+        ]
+
+    @property
+    def success(self) -> bool:
+        """Whether every chunk was accepted."""
+        return not self.errors
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkSendResult(chunks={self.chunk_count}, emails={self.email_count}, "
+            f"accepted={len(self.responses)}, failed={len(self.errors)})"
+        )
+
+
+class BulkSender:
+    """
+    Split an arbitrarily large stream of emails into bulk-email requests.
+
+    Emails are consumed lazily from any iterable (including generators) and
+    grouped into chunks that respect both the per-request email count and the
+    serialized request size. Chunks are submitted concurrently through
+    ``Email.send_bulk``; at most ``max_in_flight`` chunks are held in memory
+    at a time.
+
+    Examples:
+        >>> sender = BulkSender(client, max_in_flight=4)
+        >>> result = sender.send(email_request_generator())
+        >>> result.bulk_email_ids
+        ['614d8c0a...', '614d8c0b...']
+    """
+
+    def __init__(
+        self,
+        client,
+        max_emails_per_request: int = BULK_EMAIL_MAX_EMAILS,
+        max_request_bytes: int = BULK_EMAIL_MAX_BYTES,
+        max_in_flight: int = 4,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize the bulk sender.
+
+        Args:
+            client: The MailerSendClient instance
+            max_emails_per_request: Maximum number of emails per bulk request
+            max_request_bytes: Maximum serialized size of a bulk request body
+            max_in_flight: Maximum number of chunks submitted concurrently
+            logger: Custom logger instance
+        """
+        if max_emails_per_request < 1:
+            raise ValueError("max_emails_per_request must be at least 1")
+        # Room for the "[" and "]" of the array plus at least one byte
+        if max_request_bytes < 3:
+            raise ValueError("max_request_bytes must be at least 3")
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        self.client = client
+        self.max_emails_per_request = max_emails_per_request
+        self.max_request_bytes = max_request_bytes
+        self.max_in_flight = max_in_flight
+        self.logger = logger or get_logger()
+
+    def iter_chunks(
+        self, emails: Iterable[EmailRequest]
+    ) -> Iterator[List[EmailRequest]]:
+        """
+        Group emails into API-compliant chunks.
+
+        Args:
+            emails: Any iterable of EmailRequest objects
+
+        Yields:
+            Lists of emails that fit into a single bulk request
+
+        Raises:
+            ValidationError: If a single email exceeds ``max_request_bytes``
+        """
+        for chunk, error in self._iter_chunks(emails):
+            if error is not None:
+                raise error
+            yield chunk
+
+    def send(self, emails: Iterable[EmailRequest]) -> BulkSendResult:
+        """
+        Send all emails, chunked and submitted concurrently.
+
+        A chunk that fails to submit, or an email too large to fit in any
+        bulk request, is recorded in ``BulkSendResult.errors`` and does not
+        stop the remaining chunks.
+
+        Args:
+            emails: Any iterable of EmailRequest objects
+
+        Returns:
+            BulkSendResult with every bulk_email_id and per-chunk errors
+        """
+        result = BulkSendResult()
+        pending: Dict[Future, Tuple[int, int]] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            try:
+                for index, (chunk, error) in enumerate(self._iter_chunks(emails)):
+                    result.chunk_count += 1
+                    result.email_count += len(chunk)
+
+                    if error is not None:
+                        self.logger.warning("Bulk chunk %d rejected: %s", index, error)
+                        result.errors.append(BulkChunkError(index, len(chunk), error))
+                        continue
+
+                    if len(pending) >= self.max_in_flight:
+                        self._collect(pending, result, FIRST_COMPLETED)
+
+                    self.logger.debug(
+                        "Submitting bulk chunk %d with %d emails", index, len(chunk)
+                    )
+                    future = executor.submit(
+                        copy_context().run, self.client.emails.send_bulk, chunk
+                    )
+                    pending[future] = (index, len(chunk))
+            finally:
+                self._collect(pending, result)
+
+        return result
+
+    def _iter_chunks(
+        self, emails: Iterable[EmailRequest]
+    ) -> Iterator[Tuple[List[EmailRequest], Optional[ValidationError]]]:
+        """
+        Yield ``(chunk, error)`` pairs; oversized emails come alone with an error.
+
+        Each email is encoded once; accepted chunks carry their encoded body
+        as ``EncodedModels``, so ``send_bulk`` does not encode them again.
+        """
+        chunk: List[EmailRequest] = []
+        bodies: List[Union[bytes, StreamingBody]] = []
+        # Size of the JSON array wrapping the chunk: "[" + "]"
+        chunk_bytes = 2
+
+        for email in emails:
+            body = model_body(email)
+            email_bytes = len(body)
+            if email_bytes + 2 > self.max_request_bytes:
+                yield (
+                    [email],
+                    ValidationError(
+                        f"Email of {email_bytes} bytes exceeds the bulk request size "
+                        f"limit of {self.max_request_bytes} bytes"
+                    ),
+                )
+                continue
+
+            # Account for the "," separator when the chunk is not empty
+            added_bytes = email_bytes + (1 if chunk else 0)
+            if chunk and (
+                len(chunk) >= self.max_emails_per_request
+                or chunk_bytes + added_bytes > self.max_request_bytes
+            ):
+                yield EncodedModels(chunk, bodies_array(bodies)), None
+                chunk, bodies, chunk_bytes = [], [], 2
+                added_bytes = email_bytes
+
+            chunk.append(email)
+            bodies.append(body)
+            chunk_bytes += added_bytes
+
+        if chunk:
+            yield EncodedModels(chunk, bodies_array(bodies)), None
+
+    def _collect(
+        self,
+        pending: Dict[Future, Tuple[int, int]],
+        result: BulkSendResult,
+        return_when: str = ALL_COMPLETED,
+    ) -> None:
+        """Move finished chunk futures from ``pending`` into ``result``."""
+        if not pending:
+            return
+
+        done, _ = wait(pending, return_when=return_when)
+        for future in done:
+            index, email_count = pending.pop(future)
+            error = future.exception()
+            if error is None:
+                result.responses[index] = future.result()
+            else:
+                self.logger.warning("Bulk chunk %d failed: %s", index, error)
+                result.errors.append(BulkChunkError(index, email_count, error))
+
+
+class BulkStatus:
+    """Final outcome of watching a single bulk email request."""
+
+    def __init__(
+        self,
+        bulk_email_id: str,
+        response: Optional[APIResponse] = None,
+        error: Optional[Exception] = None,
+        polls: int = 0,
+        timed_out: bool = False,
+    ):
+        self.bulk_email_id = bulk_email_id
+        self.response = response
+        self.error = error
+        self.polls = polls
+        self.timed_out = timed_out
+
+    @property
+    def state(self) -> Optional[str]:
+        """Last state reported by the API, if any."""
+        if self.response is None:
+            return None
+        data = self.response.get("data") or {}
+        return data.get("state")
+
+    @property
+    def success(self) -> bool:
+        """Whether the bulk request reached the ``completed`` state."""
+        return self.state == "completed"
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkStatus(bulk_email_id={self.bulk_email_id!r}, state={self.state!r}, "
+            f"polls={self.polls}, timed_out={self.timed_out}, error={self.error!r})"
+        )
+
+
+class BulkStatusPoller:
+    """
+    Watch many bulk email requests until they finish.
+
+    Each bulk request is polled on its own exponential backoff schedule,
+    starting at ``initial_delay`` and growing by ``multiplier`` up to
+    ``max_delay``, so long-running jobs cost few status requests while short
+    ones are still noticed quickly. A job stops being polled as soon as it
+    reaches a terminal state.
+
+    Transient failures (rate limiting, server and network errors) are treated
+    like a non-terminal poll and backed off; permanent errors such as an
+    unknown bulk ID end the job immediately.
+
+    Examples:
+        >>> poller = BulkStatusPoller(client, max_delay=30)
+        >>> for status in poller.watch(result.bulk_email_ids):
+        ...     print(status.bulk_email_id, status.state)
+    """
+
+    PERMANENT_ERRORS = (AuthenticationError, ResourceNotFoundError, BadRequestError)
+
+    def __init__(
+        self,
+        client,
+        initial_delay: float = 1.0,
+        max_delay: float = 60.0,
+        multiplier: float = 2.0,
+        max_wait: Optional[float] = None,
+        terminal_states: Iterable[str] = BULK_EMAIL_TERMINAL_STATES,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize the poller.
+
+        Args:
+            client: The MailerSendClient instance
+            initial_delay: Seconds between the first and second poll of a job
+            max_delay: Upper bound for the delay between polls of a job
+            multiplier: Factor applied to a job's delay after each poll
+            max_wait: Give up on a job after this many seconds (None waits forever)
+            terminal_states: Bulk states after which a job is no longer polled
+            logger: Custom logger instance
+        """
+        if initial_delay < 0 or max_delay < initial_delay:
+            raise ValueError("Delays must satisfy 0 <= initial_delay <= max_delay")
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+
+        self.client = client
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.max_wait = max_wait
+        self.terminal_states = frozenset(terminal_states)
+        self.logger = logger or get_logger()
+
+    def watch(self, bulk_email_ids: Iterable[str]) -> Iterator[BulkStatus]:
+        """
+        Poll the given bulk requests and yield each one as it finishes.
+
+        Results are yielded in completion order, not input order.
+
+        Args:
+            bulk_email_ids: IDs returned by ``Email.send_bulk`` / ``BulkSender``
+
+        Yields:
+            BulkStatus for every bulk request
+        """
+        started = time.monotonic()
+        # (next poll time, tie-breaker, bulk_email_id, current delay, polls)
+        schedule = [
+            (started, order, bulk_email_id, self.initial_delay, 0)
+            for order, bulk_email_id in enumerate(dict.fromkeys(bulk_email_ids))
+        ]
+        heapq.heapify(schedule)
+
+        while schedule:
+            due, order, bulk_email_id, delay, polls = heapq.heappop(schedule)
+
+            wait_for = due - time.monotonic()
+            if wait_for > 0:
+                time.sleep(wait_for)
+
+            polls += 1
+            response = None
+            try:
+                response = self.client.emails.get_bulk_status(bulk_email_id)
+            except self.PERMANENT_ERRORS as e:
+                yield BulkStatus(bulk_email_id, error=e, polls=polls)
+                continue
+            except MailerSendError as e:
+                self.logger.debug(
+                    "Bulk status poll for %s failed: %s", bulk_email_id, e
+                )
+            else:
+                status = BulkStatus(bulk_email_id, response=response, polls=polls)
+                if status.state in self.terminal_states:
+                    yield status
+                    continue
+
+            now = time.monotonic()
+            if self.max_wait is not None and now - started + delay > self.max_wait:
+                yield BulkStatus(
+                    bulk_email_id, response=response, polls=polls, timed_out=True
+                )
+                continue
+
+            heapq.heappush(
+                schedule,
+                (
+                    now + delay,
+                    order,
+                    bulk_email_id,
+                    min(delay * self.multiplier, self.max_delay),
+                    polls,
+                ),
+            )
@@ -1,13 +1,22 @@
 import logging
 import os
-from typing import Optional, Dict, Any, Type, cast, Union
+import time
+from typing import Optional, Dict, Any, Type, cast, Union, Sequence
 from urllib.parse import urljoin
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-
-from .constants import DEFAULT_BASE_URL, DEFAULT_TIMEOUT, USER_AGENT
+from requests.structures import CaseInsensitiveDict
+from urllib3.exceptions import NewConnectionError
+
+from . import resources
+from .adapters import PooledHTTPAdapter
+from .constants import (
+    DEFAULT_BASE_URL,
+    DEFAULT_TIMEOUT,
+    IDEMPOTENCY_HEADER,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+)
 from .exceptions import (
     MailerSendError,
     AuthenticationError,
@@ -16,34 +25,243 @@ from .exceptions import (
     BadRequestError,
     ServerError,
 )
-from .resources.email import Email
-from .resources.activity import Activity
-from .resources.analytics import Analytics
-from .resources.domains import Domains
-from .resources.identities import IdentitiesResource
-from .resources.inbound import InboundResource
-from .resources.templates import Templates
-from .resources.tokens import Tokens
-from .resources.webhooks import Webhooks
-from .resources.email_verification import EmailVerification
-from .resources.users import Users
-from .resources.messages import Messages
-from .resources.recipients import Recipients
-from .resources.schedules import Schedules
-from .resources.smtp_users import SmtpUsers
-from .resources.sms_activity import SmsActivity
-from .resources.sms_inbounds import SmsInbounds
-from .resources.sms_messages import SmsMessages
-from .resources.sms_numbers import SmsNumbers
-from .resources.sms_recipients import SmsRecipients
-from .resources.sms_sending import SmsSending
-from .resources.sms_webhooks import SmsWebhooks
-from .resources.other import Other
-from .resources.dmarc_monitoring import DmarcMonitoring
 from .logging import get_logger, RequestLogger
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, current_policy
+from .idempotency import IdempotencyStore, resolve_idempotency_key
+from .hooks import RequestEvent, RequestHooks, payload_size
+from .middleware import APIRequest, Middleware, MiddlewareChain
+from .compression import CompressedStream, RequestCompression
+from .serialization import JSON_BACKEND, StreamingBody, dumps
+from .utils.headers import parse_int_header, user_agent
 
 
-class MailerSendClient:
+class LazyResource:
+    """
+    Client attribute holding a resource, created on first access.
+
+    Works like ``functools.cached_property``: the resource class is looked up
+    in ``mailersend.resources`` (importing only its module) and passed to the
+    client's ``_build_resource``; the result replaces the descriptor on the
+    instance.
+    """
+
+    def __init__(self, class_name: str):
+        self.class_name = class_name
+        self.attribute = class_name
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attribute = name
+
+    def __get__(self, client: Optional["BaseClient"], owner: Optional[type] = None):
+        if client is None:
+            return self
+        resource = client._build_resource(getattr(resources, self.class_name))
+        client.__dict__[self.attribute] = resource
+        return resource
+
+
+class BaseClient:
+    """
+    Behaviour shared by the synchronous and asyncio MailerSend clients.
+
+    Subclasses are expected to set ``logger`` and ``debug``.
+    """
+
+    logger: logging.Logger
+    debug: bool
+    idempotency_store: Optional[IdempotencyStore] = None
+    hooks: Sequence[RequestHooks] = ()
+    middleware: MiddlewareChain
+    trust_server_data: bool = False
+
+    # Resources are built on first access, so a client that only sends
+    # emails never imports the other resources and their models
+    emails = LazyResource("Email")
+    activities = LazyResource("Activity")
+    analytics = LazyResource("Analytics")
+    domains = LazyResource("Domains")
+    identities = LazyResource("IdentitiesResource")
+    inbound = LazyResource("InboundResource")
+    templates = LazyResource("Templates")
+    tokens = LazyResource("Tokens")
+    webhooks = LazyResource("Webhooks")
+    email_verification = LazyResource("EmailVerification")
+    users = LazyResource("Users")
+    messages = LazyResource("Messages")
+    recipients = LazyResource("Recipients")
+    schedules = LazyResource("Schedules")
+    sms_messages = LazyResource("SmsMessages")
+    smtp_users = LazyResource("SmtpUsers")
+    sms_sending = LazyResource("SmsSending")
+    sms_numbers = LazyResource("SmsNumbers")
+    sms_activity = LazyResource("SmsActivity")
+    sms_inbounds = LazyResource("SmsInbounds")
+    sms_recipients = LazyResource("SmsRecipients")
+    sms_webhooks = LazyResource("SmsWebhooks")
+    api_quota = LazyResource("Other")
+    dmarc_monitoring = LazyResource("DmarcMonitoring")
+
+    def _build_resource(self, resource_class: Type[Any]) -> Any:
+        """Create this client's instance of ``resource_class``."""
+        return resource_class(self)
+
+    @staticmethod
+    def _resolve_api_key(api_key: Optional[str]) -> str:
+        """Return the explicit API key or fall back to MAILERSEND_API_KEY."""
+        # Try to get API key from environment variable first, then from parameter
+        resolved_api_key = api_key or os.getenv("MAILERSEND_API_KEY")
+
+        if not resolved_api_key:
+            raise ValueError(
+                "API key is required. Either pass it as 'api_key' parameter or "
+                "set the 'MAILERSEND_API_KEY' environment variable."
+            )
+
+        return resolved_api_key
+
+    def _raise_for_status(self, response: requests.Response, request_id: str) -> None:
+        """
+        Raise the SDK exception matching an unsuccessful response.
+
+        Shared with the asyncio client so both map status codes identically.
+        """
+        # Handle error responses
+        error_message = self._get_error_message(response)
+
+        # Log the error details before raising
+        self.logger.error(
+            "API error %s: %s",
+            response.status_code,
+            error_message,
+            extra={"request_id": request_id},
+        )
+
+        if response.status_code == 401:
+            raise AuthenticationError(error_message, response)
+        elif response.status_code == 404:
+            raise ResourceNotFoundError(error_message, response)
+        elif response.status_code == 429:
+            # Log rate limit details
+            retry_after = response.headers.get("retry-after")
+            remaining = response.headers.get("x-apiquota-remaining")
+            self.logger.warning(
+                "⚠️ Rate limit exceeded. Retry after: %ss, Remaining: %s",
+                retry_after,
+                remaining,
+                extra={"request_id": request_id},
+            )
+            raise RateLimitExceeded(error_message, response)
+        elif 400 <= response.status_code < 500:
+            raise BadRequestError(error_message, response)
+        elif 500 <= response.status_code < 600:
+            raise ServerError(error_message, response)
+        else:
+            raise MailerSendError(error_message, response)
+
+    def _log_throttle(self, delay: float, request_id: str) -> None:
+        """Log time a request spent waiting on the client-side rate limiter."""
+        if delay > 0:
+            self.logger.debug(
+                "⏳ Rate limiter delayed request by %.3fs",
+                delay,
+                extra={"request_id": request_id},
+            )
+
+    def _completed_response(self, idempotency_key: str, request_id: str):
+        """Return the stored response of an already completed send, if any."""
+        if self.idempotency_store is None:
+            return None
+        response = self.idempotency_store.get(idempotency_key)
+        if response is not None:
+            self.logger.info(
+                "♻️ Idempotency key %s already completed, returning the stored response",
+                idempotency_key,
+                extra={"request_id": request_id},
+            )
+        return response
+
+    def _emit(self, name: str, event: RequestEvent) -> None:
+        """Call hook method ``name`` on every hook; a failing hook is skipped."""
+        for hook in self.hooks:
+            try:
+                getattr(hook, name)(event)
+            except Exception:
+                self.logger.warning(
+                    "Request hook %r failed in %s", hook, name, exc_info=True
+                )
+
+    def _begin_attempt(self, event: RequestEvent, attempt: int) -> None:
+        """Reset ``event`` for a new attempt and announce it to the hooks."""
+        event.attempt = attempt
+        event.attempt_started = time.monotonic()
+        event.status_code = event.duration = event.error = event.retry_delay = None
+        event.bytes_sent = event.bytes_received = event.quota_remaining = None
+        self._emit("on_request_start", event)
+
+    def _end_attempt(
+        self,
+        event: RequestEvent,
+        request: APIRequest,
+        response=None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Record the outcome of an attempt on ``event`` and report it."""
+        event.duration = time.monotonic() - event.attempt_started
+        if response is None:
+            event.error = error
+            self._emit("on_error", event)
+            return
+
+        # Read from the request as sent, never from the transport: httpx
+        # cannot return the content of a streamed request body
+        event.status_code = response.status_code
+        event.bytes_sent = payload_size(request.body)
+        event.bytes_received = payload_size(getattr(response, "content", None))
+        event.quota_remaining = parse_int_header(
+            response.headers, "x-apiquota-remaining"
+        )
+        self._emit("on_response", event)
+
+    def _compression_stats(self) -> Optional[Dict[str, Any]]:
+        """Statistics of the request compression layer, if one is installed."""
+        for middleware in self.middleware:
+            if isinstance(middleware, RequestCompression):
+                return middleware.stats()
+        return None
+
+    def _get_error_message(self, response: requests.Response) -> str:
+        """Extract error message from response."""
+        try:
+            error_data = response.json()
+            if isinstance(error_data, dict):
+                message = error_data.get("message", "Unknown error")
+                errors = error_data.get("errors", {})
+                if errors:
+                    error_details = "; ".join(
+                        f"{key}: {', '.join(msgs)}" for key, msgs in errors.items()
+                    )
+                    return f"{message}: {error_details}"
+                return message
+        except Exception:
+            pass
+
+        return f"Error {response.status_code}: {response.text}"
+
+    def enable_debug(self):
+        """Enable debug logging for this client instance."""
+        self.debug = True
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.info("🐛 Debug mode enabled")
+
+    def disable_debug(self):
+        """Disable debug logging for this client instance."""
+        self.debug = False
+        self.logger.setLevel(logging.WARNING)
+        self.logger.info("Debug mode disabled")
+
+
+class MailerSendClient(BaseClient):
     """
     Main client for the MailerSend API.
 
@@ -60,6 +278,12 @@ class MailerSendClient:
 
         >>> # Enable debug logging for detailed request/response info
         >>> client = MailerSendClient(debug=True)
+
+        >>> # Pace requests to stay under the API rate limits
+        >>> client = MailerSendClient(rate_limiter=RateLimiter())
+
+        >>> # Share one client between 64 sender threads
+        >>> client = MailerSendClient(pool_maxsize=64, tcp_keepalive=True)
     """
 
     def __init__(
@@ -70,6 +294,17 @@ class MailerSendClient:
         max_retries: int = 3,
         debug: bool = False,
         logger: Optional[logging.Logger] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotency_store: Optional[IdempotencyStore] = None,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        pool_block: bool = False,
+        tcp_keepalive: bool = False,
+        hooks: Optional[Sequence[RequestHooks]] = None,
+        middleware: Optional[Sequence[Middleware]] = None,
+        trust_server_data: bool = False,
+        user_agent_products: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Initialize the MailerSend client.
@@ -82,36 +317,53 @@ class MailerSendClient:
             max_retries: Maximum number of retries for failed requests
             debug: Enable detailed debug logging
             logger: Custom logger instance
+            rate_limiter: Client-side rate limiter that paces outgoing requests
+                    (may be shared between clients)
+            retry_policy: Backoff and retry budget for transient failures
+                    (overrides max_retries)
+            idempotency_store: Record of completed send requests; duplicate
+                    submissions are answered from it without a request
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum connections kept open per host; size it to
+                    the number of threads sharing the client
+            pool_block: Wait for a pooled connection when all are busy instead
+                    of opening one that is discarded afterwards
+            tcp_keepalive: Send TCP keep-alive probes on idle connections
+            hooks: Instrumentation hooks told about every request attempt,
+                    such as a ``MetricsCollector``
+            middleware: Layers every request attempt passes through, in order
+                    (see ``client.middleware`` to change them later)
+            trust_server_data: Build response models without validating the
+                    API data (see ``BaseModel.construct_trusted``)
+            user_agent_products: Product tokens appended to the User-Agent
+                    header, such as ``["my-app/1.4"]``
 
         Raises:
             ValueError: If no API key is provided and MAILERSEND_API_KEY
                        environment variable is not set
         """
-        # Try to get API key from environment variable first, then from parameter
-        resolved_api_key = api_key or os.getenv("MAILERSEND_API_KEY")
-
-        if not resolved_api_key:
-            raise ValueError(
-                "API key is required. Either pass it as 'api_key' parameter or "
-                "set the 'MAILERSEND_API_KEY' environment variable."
-            )
-
-        self.api_key = resolved_api_key
+        self.api_key = self._resolve_api_key(api_key)
         self.base_url = base_url
         self.timeout = timeout
         self.debug = debug
         self.logger = logger or get_logger(debug=debug)
         self.request_logger = RequestLogger(self.logger)
-
-        # Initialize session with retry logic
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self.idempotency_store = idempotency_store
+        self.hooks = list(hooks or ())
+        self.middleware = MiddlewareChain(middleware)
+        self.trust_server_data = trust_server_data
+        self.user_agent = user_agent(user_agent_products or ())
+
+        # Initialize session; retries are handled by ``request`` itself
         self.session = requests.Session()
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=0.3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
+        adapter = PooledHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            tcp_keepalive=tcp_keepalive,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
 
@@ -121,36 +373,10 @@ class MailerSendClient:
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json",
                 "Accept": "application/json",
-                "User-Agent": USER_AGENT,
+                "User-Agent": self.user_agent,
             }
         )
 
-        # Initialize resources
-        self.emails = Email(self)
-        self.activities = Activity(self)
-        self.analytics = Analytics(self)
-        self.domains = Domains(self)
-        self.identities = IdentitiesResource(self)
-        self.inbound = InboundResource(self)
-        self.templates = Templates(self)
-        self.tokens = Tokens(self)
-        self.webhooks = Webhooks(self)
-        self.email_verification = EmailVerification(self)
-        self.users = Users(self)
-        self.messages = Messages(self)
-        self.recipients = Recipients(self)
-        self.schedules = Schedules(self)
-        self.sms_messages = SmsMessages(self)
-        self.smtp_users = SmtpUsers(self)
-        self.sms_sending = SmsSending(self)
-        self.sms_numbers = SmsNumbers(self)
-        self.sms_activity = SmsActivity(self)
-        self.sms_inbounds = SmsInbounds(self)
-        self.sms_recipients = SmsRecipients(self)
-        self.sms_webhooks = SmsWebhooks(self)
-        self.api_quota = Other(self)
-        self.dmarc_monitoring = DmarcMonitoring(self)
-
         self.logger.info("MailerSend client initialized successfully")
         if debug:
             self.logger.info("🐛 Debug mode enabled - detailed logging active")
@@ -161,15 +387,24 @@ class MailerSendClient:
         path: str,
         params: Optional[Dict[str, Any]] = None,
         body: Optional[Dict[str, Any]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        headers: Optional[Dict[str, str]] = None,
     ) -> requests.Response:
         """
         Make an HTTP request to the MailerSend API.
 
+        Transient failures are retried according to ``retry_policy``, the
+        client's policy adjusted by any enclosing ``retry_budget`` block.
+        Send requests carry an ``Idempotency-Key`` header that stays the same
+        across retries.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             path: API endpoint path
             params: Query parameters
             body: Request body data
+            retry_policy: Retry policy for this call only
+            headers: Extra request headers
 
         Returns:
             Response object
@@ -188,79 +423,96 @@ class MailerSendClient:
         request_id = self.request_logger.start_request(method, url, params, body)
 
         try:
-            response = self.session.request(
-                method=method, url=url, params=params, json=body, timeout=self.timeout
-            )
-
-            # Log response details
-            self.request_logger.log_response(response)
-
-            # Handle different response status codes
-            if 200 <= response.status_code < 300:
-                return response
-
-            # Handle error responses
-            error_message = self._get_error_message(response)
-
-            # Log the error details before raising
-            self.logger.error(
-                f"API error {response.status_code}: {error_message}",
-                extra={"request_id": request_id},
+            headers = CaseInsensitiveDict(headers or {})
+            idempotency_key = resolve_idempotency_key(method, path, body, headers)
+            if idempotency_key is not None:
+                headers[IDEMPOTENCY_HEADER] = idempotency_key
+                cached = self._completed_response(idempotency_key, request_id)
+                if cached is not None:
+                    return cached
+
+            retry = (retry_policy or current_policy(self.retry_policy)).start(
+                method, keyed=idempotency_key is not None
             )
-
-            if response.status_code == 401:
-                raise AuthenticationError(error_message, response)
-            elif response.status_code == 404:
-                raise ResourceNotFoundError(error_message, response)
-            elif response.status_code == 429:
-                # Log rate limit details
-                retry_after = response.headers.get("retry-after")
-                remaining = response.headers.get("x-apiquota-remaining")
-                self.logger.warning(
-                    f"⚠️ Rate limit exceeded. Retry after: {retry_after}s, Remaining: {remaining}",
-                    extra={"request_id": request_id},
-                )
-                raise RateLimitExceeded(error_message, response)
-            elif 400 <= response.status_code < 500:
-                raise BadRequestError(error_message, response)
-            elif 500 <= response.status_code < 600:
-                raise ServerError(error_message, response)
-            else:
-                raise MailerSendError(error_message, response)
-
-        except requests.RequestException as e:
-            self.request_logger.log_error(e)
-            raise MailerSendError(f"Request failed: {str(e)}")
-
-    def _get_error_message(self, response: requests.Response) -> str:
-        """Extract error message from response."""
-        try:
-            error_data = response.json()
-            if isinstance(error_data, dict):
-                message = error_data.get("message", "Unknown error")
-                errors = error_data.get("errors", {})
-                if errors:
-                    error_details = "; ".join(
-                        f"{key}: {', '.join(msgs)}" for key, msgs in errors.items()
+            event = None
+            if self.hooks:
+                event = RequestEvent(request_id, method, path, retry.started)
+
+            while True:
+                try:
+                    if self.rate_limiter is not None:
+                        self._log_throttle(self.rate_limiter.acquire(), request_id)
+                    if event is not None:
+                        self._begin_attempt(event, retry.attempt)
+
+                    request = APIRequest(
+                        method, url, path, params, body, headers, self.timeout
                     )
-                    return f"{message}: {error_details}"
-                return message
-        except Exception:
-            pass
-
-        return f"Error {response.status_code}: {response.text}"
-
-    def enable_debug(self):
-        """Enable debug logging for this client instance."""
-        self.debug = True
-        self.logger.setLevel(logging.DEBUG)
-        self.logger.info("🐛 Debug mode enabled")
+                    if self.middleware:
+                        response = self.middleware.handler(self._send)(request)
+                    else:
+                        response = self._send(request)
+                except requests.RequestException as e:
+                    if event is not None:
+                        self._end_attempt(event, request, error=e)
+                    delay = retry.delay_for_error(reached_server=_reached_server(e))
+                    if delay is None:
+                        self.request_logger.log_error(e)
+                        raise MailerSendError(f"Request failed: {str(e)}")
+                else:
+                    # Log response details
+                    self.request_logger.log_response(response)
+                    if event is not None:
+                        self._end_attempt(event, request, response=response)
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.update(response.status_code, response.headers)
+
+                    # Handle different response status codes
+                    if 200 <= response.status_code < 300:
+                        if (
+                            idempotency_key is not None
+                            and self.idempotency_store is not None
+                        ):
+                            self.idempotency_store.put(idempotency_key, response)
+                        return response
+
+                    delay = retry.delay_for_response(
+                        response.status_code, response.headers
+                    )
+                    if delay is None:
+                        self._raise_for_status(response, request_id)
+
+                if event is not None:
+                    event.retry_delay = delay
+                    self._emit("on_retry", event)
+                self.request_logger.log_retry(retry.attempt, round(delay, 3))
+                time.sleep(delay)
+        finally:
+            self.request_logger.end_request()
+
+    def _send(self, request: APIRequest) -> requests.Response:
+        """Send one attempt over the session; the end of the middleware chain."""
+        body = request.body
+        if body is not None and not isinstance(
+            body, (bytes, bytearray, StreamingBody, CompressedStream)
+        ):
+            # Kept on the request so hooks see the size of the body as sent
+            body = request.body = dumps(body)
+        return self.session.request(
+            method=request.method,
+            url=request.url,
+            params=request.params,
+            data=body,
+            headers=request.headers,
+            timeout=request.timeout,
+        )
 
-    def disable_debug(self):
-        """Disable debug logging for this client instance."""
-        self.debug = False
-        self.logger.setLevel(logging.WARNING)
-        self.logger.info("Debug mode disabled")
+    def _pool_stats(self) -> Optional[Dict[str, Any]]:
+        """Connection pool statistics of the adapter serving the API."""
+        adapter = self.session.get_adapter(self.base_url)
+        if isinstance(adapter, PooledHTTPAdapter):
+            return adapter.pool_stats()
+        return None
 
     def get_debug_info(self) -> Dict[str, Any]:
         """Get current debug and configuration information."""
@@ -268,7 +520,23 @@ class MailerSendClient:
             "debug_enabled": self.debug,
             "base_url": self.base_url,
             "timeout": self.timeout,
-            "user_agent": USER_AGENT,
+            "user_agent": self.user_agent,
             "logger_level": self.logger.level,
             "session_adapters": list(self.session.adapters.keys()),
+            "connection_pool": self._pool_stats(),
+            "rate_limiter": self.rate_limiter.snapshot() if self.rate_limiter else None,
+            "retry_policy": repr(self.retry_policy),
+            "middleware": self.middleware.names(),
+            "json_backend": JSON_BACKEND,
+            "compression": self._compression_stats(),
         }
+
+
+def _reached_server(error: requests.RequestException) -> bool:
+    """Whether a failed request may have been received by the server."""
+    if isinstance(error, requests.ConnectTimeout):
+        return False
+    if isinstance(error, requests.ConnectionError) and error.args:
+        reason = getattr(error.args[0], "reason", None)
+        return not isinstance(reason, NewConnectionError)
+    return True
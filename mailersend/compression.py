@@ -0,0 +1,180 @@
+"""
+Compression of large request bodies.
+
+``RequestCompression`` is a middleware layer that gzip- or deflate-encodes
+request bodies above a size threshold and sets ``Content-Encoding``. It is
+opt-in: add it to a client's middleware chain. Bulk email bodies, which
+repeat the same HTML across recipients, typically shrink by 80-95%.
+
+Bodies with streamed file attachments are compressed chunk by chunk while
+they are sent. Their compressed size is only known at the end, so they go
+out with chunked transfer encoding instead of a ``Content-Length`` header.
+
+Examples:
+    >>> client = MailerSendClient(middleware=[RequestCompression()])
+    >>> client.emails.send_bulk(emails)
+    >>> client.get_debug_info()["compression"]["ratio"]
+    0.09
+"""
+
+import threading
+import zlib
+from typing import Any, AsyncIterator, Callable, Dict, Iterator
+
+from .constants import COMPRESSION_LEVEL, COMPRESSION_THRESHOLD
+from .middleware import APIRequest, Middleware
+from .serialization import StreamingBody, dumps
+
+ENCODINGS = ("gzip", "deflate")
+
+
+class CompressedStream:
+    """
+    A ``StreamingBody`` compressed while it is sent.
+
+    Iterating yields the compressed body in chunks; like the body it wraps,
+    it can be iterated once per attempt. It has no ``len()``, so HTTP
+    clients send it with chunked transfer encoding.
+    """
+
+    __slots__ = ("body", "_compressor", "_on_complete")
+
+    def __init__(
+        self,
+        body: StreamingBody,
+        compressor: Callable[[], Any],
+        on_complete: Callable[[int, int], None],
+    ):
+        """
+        Args:
+            body: The streamed body to compress
+            compressor: Factory of a fresh ``zlib`` compression object
+            on_complete: Called with the original and compressed sizes each
+                        time the body has been streamed in full
+        """
+        self.body = body
+        self._compressor = compressor
+        self._on_complete = on_complete
+
+    def __iter__(self) -> Iterator[bytes]:
+        compressor = self._compressor()
+        size = 0
+        for chunk in self.body:
+            data = compressor.compress(chunk)
+            if data:
+                size += len(data)
+                yield data
+        data = compressor.flush()
+        size += len(data)
+        yield data
+        self._on_complete(len(self.body), size)
+
+    async def aiter_bytes(self) -> AsyncIterator[bytes]:
+        """Yield the compressed body in chunks, for async HTTP clients."""
+        for chunk in self:
+            yield chunk
+
+    def __repr__(self) -> str:
+        return f"CompressedStream({self.body!r})"
+
+
+class RequestCompression(Middleware):
+    """Middleware compressing request bodies of at least ``threshold`` bytes."""
+
+    name = "compression"
+
+    def __init__(
+        self,
+        threshold: int = COMPRESSION_THRESHOLD,
+        level: int = COMPRESSION_LEVEL,
+        encoding: str = "gzip",
+    ):
+        """
+        Initialize the compression layer.
+
+        Args:
+            threshold: Smallest encoded body, in bytes, that is compressed
+            level: zlib compression level, from 1 (fastest) to 9 (smallest)
+            encoding: ``"gzip"`` or ``"deflate"``
+        """
+        if encoding not in ENCODINGS:
+            raise ValueError(f"encoding must be one of {ENCODINGS}")
+        if not 1 <= level <= 9:
+            raise ValueError("level must be between 1 and 9")
+        if threshold < 0:
+            raise ValueError("threshold must not be negative")
+
+        self.threshold = threshold
+        self.level = level
+        self.encoding = encoding
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._bytes_in = 0
+        self._bytes_out = 0
+
+    def on_request(self, request: APIRequest) -> APIRequest:
+        body = request.body
+        if body is None or "Content-Encoding" in request.headers:
+            return request
+        if isinstance(body, StreamingBody):
+            if len(body) < self.threshold:
+                return request
+            request.body = CompressedStream(body, self._compressor, self._record)
+            # The request headers may be shared between retries; never mutate them
+            request.headers = request.headers.copy()
+            request.headers["Content-Encoding"] = self.encoding
+            return request
+        if not isinstance(body, (bytes, bytearray)):
+            body = dumps(body)
+        if len(body) < self.threshold:
+            return request
+
+        compressed = self.compress(body)
+        if len(compressed) >= len(body):
+            return request
+
+        request.body = compressed
+        # The request headers may be shared between retries; never mutate them
+        request.headers = request.headers.copy()
+        request.headers["Content-Encoding"] = self.encoding
+        self._record(len(body), len(compressed))
+        return request
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress ``data`` with the configured encoding and level."""
+        compressor = self._compressor()
+        return compressor.compress(data) + compressor.flush()
+
+    def _compressor(self) -> Any:
+        """Create a compression object for the configured encoding and level."""
+        # wbits: 16 + 15 selects the gzip container, 15 the zlib one
+        wbits = 31 if self.encoding == "gzip" else 15
+        return zlib.compressobj(self.level, zlib.DEFLATED, wbits)
+
+    def _record(self, bytes_in: int, bytes_out: int) -> None:
+        """Count one compressed request in the statistics."""
+        with self._lock:
+            self._requests += 1
+            self._bytes_in += bytes_in
+            self._bytes_out += bytes_out
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Describe the settings and the effect of compression so far.
+
+        ``ratio`` is compressed size over original size for the compressed
+        requests (None before any request was compressed).
+        """
+        with self._lock:
+            ratio = (
+                round(self._bytes_out / self._bytes_in, 4) if self._bytes_in else None
+            )
+            return {
+                "encoding": self.encoding,
+                "level": self.level,
+                "threshold": self.threshold,
+                "requests_compressed": self._requests,
+                "bytes_before": self._bytes_in,
+                "bytes_after": self._bytes_out,
+                "ratio": ratio,
+            }
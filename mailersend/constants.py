@@ -1,18 +1,62 @@
-import platform
-import sys
-
 # Base API information
 API_VERSION = "v1"
 DEFAULT_BASE_URL = f"https://api.mailersend.com/{API_VERSION}/"
 DEFAULT_TIMEOUT = 30  # seconds
 
+# Connection pooling (requests defaults: 10 host pools of 10 connections)
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 10
+TCP_KEEPALIVE_IDLE = 60  # seconds before the first keep-alive probe
+TCP_KEEPALIVE_INTERVAL = 15  # seconds between probes
+TCP_KEEPALIVE_COUNT = 4  # unanswered probes before the connection is dropped
+
+# Retry behaviour for transient failures
+RETRY_BASE_DELAY = 0.5  # seconds
+RETRY_MAX_DELAY = 30.0  # seconds
+RETRY_MAX_TOTAL_TIME = 120.0  # seconds per call, including retries
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+# Idempotency keys for send requests
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+IDEMPOTENT_SEND_PATHS = frozenset({"email", "bulk-email", "sms"})
+IDEMPOTENCY_STORE_TTL = 600  # seconds
+IDEMPOTENCY_STORE_SIZE = 10_000
+
+# Client-side rate limiter defaults (general API limit: 60 requests/minute)
+RATE_LIMIT_PER_SECOND = 1.0
+RATE_LIMIT_BURST = 10
+
+# Request body compression (opt-in)
+COMPRESSION_THRESHOLD = 16 * 1024
+COMPRESSION_LEVEL = 6
+
+# Durable outbox for email sends
+OUTBOX_RETRY_DELAY = 5.0  # seconds before the first retry of a failed send
+OUTBOX_MAX_RETRY_DELAY = 300.0  # seconds
+OUTBOX_MAX_ATTEMPTS = 10
+OUTBOX_LEASE = 300.0  # seconds a claimed row is hidden from other drainers
+
+# File attachments are base64-encoded in chunks of this many bytes of input
+# (a multiple of 3, so chunks encode without padding)
+ATTACHMENT_CHUNK_SIZE = 3 * 256 * 1024
+
+# Longest date range accepted by the activity endpoint
+ACTIVITY_MAX_RANGE_SECONDS = 7 * 24 * 60 * 60
+
+# Bulk email request limits
+BULK_EMAIL_MAX_EMAILS = 500
+BULK_EMAIL_MAX_BYTES = 25 * 1024 * 1024
+BULK_EMAIL_TERMINAL_STATES = frozenset({"completed", "failed"})
+
 # Package info for user agent
 PACKAGE_NAME = "mailersend-python"
 __version__ = "2.0.3"
 
-USER_AGENT = (
-    f"{PACKAGE_NAME}/{__version__} "
-    f"(Python/{platform.python_version()}; "
-    f"OS/{platform.system()} {platform.release()}; "
-    f"Impl/{platform.python_implementation()})"
-)
+
+def __getattr__(name: str):
+    # USER_AGENT is built on first use; see utils.headers.user_agent
+    if name == "USER_AGENT":
+        from .utils.headers import user_agent
+
+        return user_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,135 @@
+"""
+Instrumentation hooks around API requests.
+
+A ``RequestHooks`` subclass passed to a client is told about every attempt
+the client makes: when it starts, the response it got, network errors, and
+retries. Each call carries one ``RequestEvent`` that is updated as the call
+progresses, so a hook can correlate the stages of a call by identity.
+
+Examples:
+    >>> class Timing(RequestHooks):
+    ...     def on_response(self, event):
+    ...         print(event.endpoint, event.status_code, event.duration)
+
+    >>> client = MailerSendClient(hooks=[Timing()])
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Optional
+
+from .serialization import StreamingBody
+
+# Path segments made only of lowercase words, such as ``smtp-users``, name
+# collections and actions; anything else (IDs, emails, IPs) is a parameter
+_STATIC_SEGMENT = re.compile(r"[a-z]+(?:[-_][a-z]+)*")
+
+
+@lru_cache(maxsize=1024)
+def endpoint_template(path: str) -> str:
+    """
+    Collapse the parameters of an API path into placeholders.
+
+    Examples:
+        >>> endpoint_template("domains/7nxe3yjmeq28vp0k/smtp-users")
+        'domains/{id}/smtp-users'
+    """
+    path = path.split("?", 1)[0].strip("/")
+    return "/".join(
+        segment if _STATIC_SEGMENT.fullmatch(segment) else "{id}"
+        for segment in path.split("/")
+    )
+
+
+class RequestEvent:
+    """
+    State of one API call as seen by hooks.
+
+    Attributes set when the attempt starts:
+        request_id, method, path, endpoint, attempt (0 for the first try)
+
+    Attributes set when the attempt ends:
+        status_code, duration (seconds the attempt took), bytes_sent,
+        bytes_received, quota_remaining, error (network failure, if any)
+
+    ``retry_delay`` is set before a retry; ``elapsed`` covers the whole call.
+    """
+
+    __slots__ = (
+        "request_id",
+        "method",
+        "path",
+        "endpoint",
+        "attempt",
+        "started",
+        "attempt_started",
+        "status_code",
+        "duration",
+        "bytes_sent",
+        "bytes_received",
+        "quota_remaining",
+        "error",
+        "retry_delay",
+    )
+
+    def __init__(self, request_id: str, method: str, path: str, started: float):
+        self.request_id = request_id
+        self.method = method.upper()
+        self.path = path
+        self.endpoint = endpoint_template(path)
+        self.attempt = 0
+        self.started = started
+        self.attempt_started = started
+        self.status_code: Optional[int] = None
+        self.duration: Optional[float] = None
+        self.bytes_sent: Optional[int] = None
+        self.bytes_received: Optional[int] = None
+        self.quota_remaining: Optional[int] = None
+        self.error: Optional[Exception] = None
+        self.retry_delay: Optional[float] = None
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        """Seconds from the start of the call to the end of the last attempt."""
+        if self.duration is None:
+            return None
+        return self.attempt_started + self.duration - self.started
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestEvent({self.method} {self.endpoint}, attempt={self.attempt}, "
+            f"status_code={self.status_code})"
+        )
+
+
+class RequestHooks:
+    """
+    Base class for request instrumentation.
+
+    Override the methods of interest; all of them do nothing by default.
+    Hooks run synchronously on the calling thread (or event loop), so they
+    should be quick. Exceptions raised by a hook are logged and ignored.
+    """
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """Called before every attempt is sent."""
+
+    def on_response(self, event: RequestEvent) -> None:
+        """Called for every response received, successful or not."""
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Called when an attempt fails without a response."""
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """Called when attempt ``event.attempt`` failed and will be retried."""
+
+
+def payload_size(payload: Any) -> Optional[int]:
+    """Length in bytes of a request or response body, if known."""
+    if isinstance(payload, (bytes, bytearray)):
+        return len(payload)
+    if isinstance(payload, str):
+        return len(payload.encode())
+    if isinstance(payload, StreamingBody):
+        return len(payload)
+    return None
@@ -0,0 +1,135 @@
+"""
+Idempotency keys for send requests.
+
+Every request that sends a message (``POST email``, ``POST bulk-email`` and
+``POST sms``) carries an ``Idempotency-Key`` header. Unless the caller
+supplies one, the key is derived from the request content, so it stays the
+same across SDK retries and across resubmissions of the same message by an
+application's own retry layer.
+
+An optional ``IdempotencyStore`` remembers the responses of recently
+completed keys; a client configured with one answers a duplicate submission
+from the store without touching the network.
+
+Examples:
+    >>> client = MailerSendClient(idempotency_store=IdempotencyStore(ttl=600))
+    >>> client.emails.send(email)
+    >>> client.emails.send(email)  # answered locally, not sent twice
+
+    >>> client.emails.send(email, idempotency_key=f"welcome-{user.id}")
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from .constants import (
+    IDEMPOTENCY_HEADER,
+    IDEMPOTENCY_STORE_SIZE,
+    IDEMPOTENCY_STORE_TTL,
+    IDEMPOTENT_SEND_PATHS,
+)
+from .serialization import StreamingBody
+
+
+def idempotency_key_for(method: str, path: str, body: Any) -> str:
+    """Derive a stable idempotency key from the content of a request."""
+    digest = hashlib.sha256(f"{method.upper()} {path.strip('/')}\n".encode())
+    if isinstance(body, (bytes, bytearray)):
+        # Pre-encoded bodies are produced deterministically from their model
+        digest.update(body)
+    elif isinstance(body, StreamingBody):
+        # Attached files are identified rather than read, so they are only
+        # read and encoded once, while the body is sent
+        for part in body.parts:
+            digest.update(part if isinstance(part, bytes) else part.fingerprint())
+    else:
+        digest.update(
+            json.dumps(
+                body, sort_keys=True, separators=(",", ":"), default=str
+            ).encode()
+        )
+    return f"ms-{digest.hexdigest()[:40]}"
+
+
+def resolve_idempotency_key(
+    method: str, path: str, body: Any, headers: Optional[dict]
+) -> Optional[str]:
+    """
+    Return the idempotency key a request should carry, if any.
+
+    An ``Idempotency-Key`` header set by the caller always wins; otherwise
+    a key is derived for send requests.
+    """
+    for name, value in (headers or {}).items():
+        if name.lower() == IDEMPOTENCY_HEADER.lower():
+            return value
+    if method.upper() == "POST" and path.strip("/") in IDEMPOTENT_SEND_PATHS:
+        return idempotency_key_for(method, path, body)
+    return None
+
+
+class IdempotencyStore:
+    """
+    Thread-safe record of recently completed idempotency keys.
+
+    Holds at most ``max_size`` successful responses, each for ``ttl``
+    seconds; the least recently stored entries are evicted first.
+    """
+
+    def __init__(
+        self, ttl: float = IDEMPOTENCY_STORE_TTL, max_size: int = IDEMPOTENCY_STORE_SIZE
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            ttl: Seconds a completed key is remembered
+            max_size: Maximum number of keys remembered
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the stored response for ``key``, or None if unknown or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, response = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            return response
+
+    def put(self, key: str, response: Any) -> None:
+        """Remember the response of a completed request."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        """Forget ``key``, allowing the request to be sent again."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget every key."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -1,7 +1,10 @@
 import logging
 import json
+import re
 import time
 import uuid
+from contextvars import ContextVar, Token
+from functools import lru_cache
 from typing import Optional, Dict, Any, Set
 
 # Sensitive fields that should be redacted in logs
@@ -17,6 +20,99 @@ SENSITIVE_FIELDS = {
     "bearer",
 }
 
+# Base64 strings longer than this (attachment content) are cut short in logs
+# instead of being copied whole; other text is always logged in full
+LOG_MAX_STRING_LENGTH = 1024
+
+REDACTED = "[REDACTED]"
+
+# Every sensitive pattern in free text, matched in a single pass
+_SENSITIVE_TEXT = re.compile(r'(Bearer )[^\s]+|("api_key":\s*)"[^"]*"')
+_BASE64 = re.compile(r"[A-Za-z0-9+/]+={0,2}")
+
+
+@lru_cache(maxsize=4096)
+def _is_sensitive_key(key: str) -> bool:
+    """Whether values under ``key`` must be redacted (cached per key name)."""
+    key_lower = key.lower()
+    return any(sensitive in key_lower for sensitive in SENSITIVE_FIELDS)
+
+
+def _redact_match(match: "re.Match[str]") -> str:
+    if match.group(1):
+        return f"{match.group(1)}{REDACTED}"
+    return f'{match.group(2)}"{REDACTED}"'
+
+
+def _redact_string(text: str, max_length: int) -> str:
+    if len(text) > max_length and _BASE64.fullmatch(text):
+        text = f"{text[:64]}...[base64 {len(text)} chars truncated]"
+    return _SENSITIVE_TEXT.sub(_redact_match, text)
+
+
+def redact(value: Any, max_length: int = LOG_MAX_STRING_LENGTH) -> Any:
+    """
+    Return a copy of ``value`` that is safe to log.
+
+    Walks dicts, lists and tuples once: values under sensitive keys are
+    replaced with ``[REDACTED]``, bearer tokens and API keys in strings are
+    masked, and base64 strings longer than ``max_length`` (attachment
+    content) are truncated rather than copied.
+    """
+    if isinstance(value, str):
+        return _redact_string(value, max_length)
+    if isinstance(value, dict):
+        return {
+            key: (REDACTED if _is_sensitive_key(str(key)) else redact(item, max_length))
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [redact(item, max_length) for item in value]
+    if isinstance(value, (bytes, bytearray)):
+        return f"[{len(value)} bytes]"
+    return value
+
+
+def _decode_body(body: bytes) -> Any:
+    """Decode a pre-encoded JSON request body for logging."""
+    try:
+        return json.loads(body)
+    except ValueError:
+        return body
+
+
+class RequestContext:
+    """
+    State of one API call, from its first attempt to its final response.
+
+    The active context is held in a ``ContextVar``, so concurrent calls on a
+    shared client (from threads or asyncio tasks) each see their own.
+    """
+
+    __slots__ = ("request_id", "method", "url", "start_time", "_token")
+
+    def __init__(self, method: str, url: str):
+        self.request_id = uuid.uuid4().hex[:8]
+        self.method = method
+        self.url = url
+        self.start_time = time.time()
+        self._token: Optional[Token] = None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the call started."""
+        return time.time() - self.start_time
+
+
+_current_request: ContextVar[Optional[RequestContext]] = ContextVar(
+    "mailersend_request", default=None
+)
+
+
+def current_request() -> Optional[RequestContext]:
+    """Return the context of the API call running in this thread or task."""
+    return _current_request.get()
+
 
 class DebugFilter(logging.Filter):
     """Filter that adds request context to log records."""
@@ -24,7 +120,8 @@ class DebugFilter(logging.Filter):
     def filter(self, record):
         # Add request ID if not present
         if not hasattr(record, "request_id"):
-            record.request_id = getattr(self, "_current_request_id", "unknown")
+            context = _current_request.get()
+            record.request_id = context.request_id if context else "unknown"
         return True
 
 
@@ -36,49 +133,35 @@ class SensitiveDataFormatter(logging.Formatter):
         record_copy = logging.makeLogRecord(record.__dict__)
 
         # Sanitize the message if it contains structured data
-        if hasattr(record_copy, "args") and record_copy.args:
+        if isinstance(record_copy.args, dict):
+            # A lone mapping argument is stored unwrapped by LogRecord
+            record_copy.args = redact(record_copy.args)
+        elif record_copy.args:
             record_copy.args = tuple(
-                self._sanitize_value(arg) if isinstance(arg, (dict, str)) else arg
-                for arg in record_copy.args
+                self._sanitize_arg(arg) for arg in record_copy.args
             )
 
         return super().format(record_copy)
 
+    def _sanitize_arg(self, arg: Any) -> Any:
+        """Sanitize one message argument."""
+        if isinstance(arg, str):
+            # Text arguments are often bodies already redacted and rendered
+            # by RequestLogger; truncating them would hide the whole body
+            return self._sanitize_string(arg)
+        return redact(arg)
+
     def _sanitize_value(self, value):
         """Sanitize sensitive data from values."""
-        if isinstance(value, dict):
-            return self._sanitize_dict(value)
-        elif isinstance(value, str):
-            return self._sanitize_string(value)
-        return value
+        return redact(value)
 
     def _sanitize_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Recursively sanitize dictionary data."""
-        if not isinstance(data, dict):
-            return data
-
-        sanitized = {}
-        for key, value in data.items():
-            key_lower = key.lower()
-            if any(sensitive in key_lower for sensitive in SENSITIVE_FIELDS):
-                sanitized[key] = "[REDACTED]"
-            elif isinstance(value, dict):
-                sanitized[key] = self._sanitize_dict(value)
-            elif isinstance(value, list):
-                sanitized[key] = [self._sanitize_value(item) for item in value]
-            else:
-                sanitized[key] = value
-        return sanitized
+        return redact(data) if isinstance(data, dict) else data
 
     def _sanitize_string(self, text: str) -> str:
         """Sanitize bearer tokens and other sensitive patterns in strings."""
-        import re
-
-        # Redact Bearer tokens
-        text = re.sub(r"Bearer [^\s]+", "Bearer [REDACTED]", text)
-        # Redact other common patterns
-        text = re.sub(r'"api_key":\s*"[^"]*"', '"api_key": "[REDACTED]"', text)
-        return text
+        return _SENSITIVE_TEXT.sub(_redact_match, text)
 
 
 def get_logger(name: Optional[str] = None, debug: bool = False) -> logging.Logger:
@@ -155,12 +238,27 @@ def setup_debug_logging():
 
 
 class RequestLogger:
-    """Helper class for logging API requests with context and timing."""
+    """
+    Helper class for logging API requests with context and timing.
+
+    A single instance is shared by all calls of a client; the per-call state
+    lives in the ``RequestContext`` of the calling thread or task.
+    """
 
     def __init__(self, logger: logging.Logger):
         self.logger = logger
-        self.request_id = None
-        self.start_time = None
+
+    @property
+    def request_id(self) -> Optional[str]:
+        """ID of the call running in this thread or task."""
+        context = _current_request.get()
+        return context.request_id if context else None
+
+    @property
+    def start_time(self) -> Optional[float]:
+        """Start time of the call running in this thread or task."""
+        context = _current_request.get()
+        return context.start_time if context else None
 
     def start_request(
         self,
@@ -169,50 +267,71 @@ class RequestLogger:
         params: Optional[Dict] = None,
         body: Optional[Dict] = None,
     ) -> str:
-        """Start logging a new request."""
-        self.request_id = str(uuid.uuid4())[:8]
-        self.start_time = time.time()
-
-        # Update the filter with current request ID
-        for handler in self.logger.handlers:
-            for filter_obj in handler.filters:
-                if isinstance(filter_obj, DebugFilter):
-                    filter_obj._current_request_id = self.request_id
-
-        self.logger.info(
-            f"🚀 Starting {method} request to {url}",
-            extra={"request_id": self.request_id},
-        )
-
-        if params:
-            sanitized_params = SensitiveDataFormatter()._sanitize_dict(params)
-            self.logger.debug(
-                f"📋 Query params: {json.dumps(sanitized_params, indent=2)}",
-                extra={"request_id": self.request_id},
+        """Start logging a new request and make it the current context."""
+        context = RequestContext(method, url)
+        context._token = _current_request.set(context)
+
+        # Messages are only built when their level is enabled, so a client
+        # with logging switched off pays nothing beyond these checks
+        logger = self.logger
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "🚀 Starting %s request to %s",
+                method,
+                url,
+                extra={"request_id": context.request_id},
             )
 
-        if body:
-            sanitized_body = SensitiveDataFormatter()._sanitize_dict(body)
-            self.logger.debug(
-                f"📦 Request body: {json.dumps(sanitized_body, indent=2)}",
-                extra={"request_id": self.request_id},
-            )
+        if (params or body) and logger.isEnabledFor(logging.DEBUG):
+            if params:
+                logger.debug(
+                    "📋 Query params: %s",
+                    json.dumps(redact(params), indent=2, default=str),
+                    extra={"request_id": context.request_id},
+                )
+            if isinstance(body, (bytes, bytearray)):
+                body = _decode_body(body)
+            if body:
+                logger.debug(
+                    "📦 Request body: %s",
+                    json.dumps(redact(body), indent=2, default=str),
+                    extra={"request_id": context.request_id},
+                )
+
+        return context.request_id
 
-        return self.request_id
+    def end_request(self):
+        """Leave the context opened by the matching ``start_request``."""
+        context = _current_request.get()
+        if context is not None and context._token is not None:
+            _current_request.reset(context._token)
+            context._token = None
 
     def log_response(self, response, duration: Optional[float] = None):
         """Log the response details."""
-        if duration is None and self.start_time:
-            duration = time.time() - self.start_time
+        logger = self.logger
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        context = _current_request.get()
+        request_id = context.request_id if context else None
+        if duration is None and context is not None:
+            duration = context.elapsed
 
         status_emoji = "✅" if 200 <= response.status_code < 300 else "❌"
         duration_str = f" ({duration:.3f}s)" if duration else ""
 
-        self.logger.info(
-            f"{status_emoji} Response {response.status_code}{duration_str}",
-            extra={"request_id": self.request_id},
+        logger.info(
+            "%s Response %s%s",
+            status_emoji,
+            response.status_code,
+            duration_str,
+            extra={"request_id": request_id},
         )
 
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
         # Log important headers
         important_headers = {
             "x-request-id": response.headers.get("x-request-id"),
@@ -223,34 +342,39 @@ class RequestLogger:
         filtered_headers = {k: v for k, v in important_headers.items() if v is not None}
 
         if filtered_headers:
-            self.logger.debug(
-                f"📄 Response headers: {json.dumps(filtered_headers, indent=2)}",
-                extra={"request_id": self.request_id},
+            logger.debug(
+                "📄 Response headers: %s",
+                json.dumps(filtered_headers, indent=2),
+                extra={"request_id": request_id},
             )
 
-        # Log response body for errors or debug level
-        if response.status_code >= 400 or self.logger.isEnabledFor(logging.DEBUG):
-            try:
-                response_data = response.json()
-                self.logger.debug(
-                    f"📥 Response body: {json.dumps(response_data, indent=2)}",
-                    extra={"request_id": self.request_id},
-                )
-            except Exception:
-                self.logger.debug(
-                    f"📥 Response body (text): {response.text[:500]}...",
-                    extra={"request_id": self.request_id},
-                )
+        # Log response body
+        try:
+            response_data = response.json()
+            logger.debug(
+                "📥 Response body: %s",
+                json.dumps(redact(response_data), indent=2, default=str),
+                extra={"request_id": request_id},
+            )
+        except Exception:
+            logger.debug(
+                "📥 Response body (text): %s...",
+                response.text[:500],
+                extra={"request_id": request_id},
+            )
 
     def log_error(self, error: Exception):
         """Log request errors."""
         self.logger.error(
-            f"💥 Request failed: {str(error)}", extra={"request_id": self.request_id}
+            "💥 Request failed: %s", error, extra={"request_id": self.request_id}
         )
 
     def log_retry(self, attempt: int, delay: float):
         """Log retry attempts."""
-        self.logger.warning(
-            f"🔄 Retrying request (attempt {attempt}) after {delay}s delay",
-            extra={"request_id": self.request_id},
-        )
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(
+                "🔄 Retrying request (attempt %s) after %ss delay",
+                attempt,
+                delay,
+                extra={"request_id": self.request_id},
+            )
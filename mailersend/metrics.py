@@ -0,0 +1,196 @@
+"""
+In-process metrics for API requests.
+
+``MetricsCollector`` is a ``RequestHooks`` implementation that aggregates
+per-endpoint request counts, status codes, retries, network errors, bytes
+transferred, latency histograms and the last reported API quota. It needs
+no external collector: read it with ``snapshot()`` or expose
+``to_prometheus()`` from an existing HTTP endpoint.
+
+Examples:
+    >>> metrics = MetricsCollector()
+    >>> client = MailerSendClient(hooks=[metrics])
+    >>> client.emails.send(email)
+    >>> metrics.snapshot()["endpoints"]["POST email"]["status_codes"]
+    {'202': 1}
+"""
+
+import bisect
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .hooks import RequestEvent, RequestHooks
+
+# Upper bounds, in seconds, of the latency histogram buckets
+DEFAULT_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class EndpointMetrics:
+    """Counters for one method and endpoint template."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.requests = 0
+        self.retries = 0
+        self.errors = 0
+        self.status_codes: Dict[int, int] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency_sum = 0.0
+        # One count per bucket plus the overflow (+Inf) bucket
+        self.latency_counts = [0] * (len(buckets) + 1)
+        self.quota_remaining: Optional[int] = None
+
+    def to_dict(self, buckets: Sequence[float]) -> Dict[str, Any]:
+        cumulative = 0
+        histogram = {}
+        for bound, count in zip(list(buckets) + ["+Inf"], self.latency_counts):
+            cumulative += count
+            histogram[str(bound)] = cumulative
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "errors": self.errors,
+            "status_codes": {
+                str(code): count for code, count in sorted(self.status_codes.items())
+            },
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency_seconds": {
+                "count": cumulative,
+                "sum": round(self.latency_sum, 6),
+                "buckets": histogram,
+            },
+            "quota_remaining": self.quota_remaining,
+        }
+
+
+class MetricsCollector(RequestHooks):
+    """Thread-safe aggregator of request metrics, keyed by method and endpoint."""
+
+    def __init__(self, latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Initialize the collector.
+
+        Args:
+            latency_buckets: Upper bounds of the latency histogram, in seconds
+        """
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self._endpoints: Dict[Tuple[str, str], EndpointMetrics] = {}
+        self._quota_remaining: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _metrics_for(self, event: RequestEvent) -> EndpointMetrics:
+        key = (event.method, event.endpoint)
+        metrics = self._endpoints.get(key)
+        if metrics is None:
+            metrics = self._endpoints[key] = EndpointMetrics(self.latency_buckets)
+        return metrics
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._metrics_for(event).requests += 1
+
+    def on_response(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._metrics_for(event)
+            code = event.status_code
+            metrics.status_codes[code] = metrics.status_codes.get(code, 0) + 1
+            self._record_transfer(metrics, event)
+            if event.quota_remaining is not None:
+                metrics.quota_remaining = event.quota_remaining
+                self._quota_remaining = event.quota_remaining
+
+    def on_error(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._metrics_for(event)
+            metrics.errors += 1
+            self._record_transfer(metrics, event)
+
+    def on_retry(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._metrics_for(event).retries += 1
+
+    def _record_transfer(self, metrics: EndpointMetrics, event: RequestEvent):
+        metrics.bytes_sent += event.bytes_sent or 0
+        metrics.bytes_received += event.bytes_received or 0
+        if event.duration is not None:
+            metrics.latency_sum += event.duration
+            index = bisect.bisect_left(self.latency_buckets, event.duration)
+            metrics.latency_counts[index] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the current metrics as plain data.
+
+        Endpoints are keyed ``"<METHOD> <endpoint template>"``; histogram
+        buckets are cumulative, as in Prometheus.
+        """
+        with self._lock:
+            return {
+                "quota_remaining": self._quota_remaining,
+                "endpoints": {
+                    f"{method} {endpoint}": metrics.to_dict(self.latency_buckets)
+                    for (method, endpoint), metrics in sorted(self._endpoints.items())
+                },
+            }
+
+    def reset(self) -> None:
+        """Discard everything collected so far."""
+        with self._lock:
+            self._endpoints.clear()
+            self._quota_remaining = None
+
+    def to_prometheus(self, prefix: str = "mailersend") -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> str:
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            return metric
+
+        endpoints = [
+            (_labels(key), data) for key, data in snapshot["endpoints"].items()
+        ]
+
+        metric = family("requests_total", "counter", "Request attempts sent.")
+        for labels, data in endpoints:
+            lines.append(f"{metric}{{{labels}}} {data['requests']}")
+
+        metric = family("responses_total", "counter", "Responses by status code.")
+        for labels, data in endpoints:
+            for code, count in data["status_codes"].items():
+                lines.append(f'{metric}{{{labels},status="{code}"}} {count}')
+
+        for name, help_text in (
+            ("retries", "Retries performed."),
+            ("errors", "Attempts that failed without a response."),
+            ("bytes_sent", "Request body bytes sent."),
+            ("bytes_received", "Response body bytes received."),
+        ):
+            metric = family(f"{name}_total", "counter", help_text)
+            for labels, data in endpoints:
+                lines.append(f"{metric}{{{labels}}} {data[name]}")
+
+        metric = family(
+            "request_duration_seconds", "histogram", "Duration of request attempts."
+        )
+        for labels, data in endpoints:
+            latency = data["latency_seconds"]
+            for bound, count in latency["buckets"].items():
+                lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f"{metric}_sum{{{labels}}} {latency['sum']}")
+            lines.append(f"{metric}_count{{{labels}}} {latency['count']}")
+
+        if snapshot["quota_remaining"] is not None:
+            metric = family("quota_remaining", "gauge", "Daily API quota remaining.")
+            lines.append(f"{metric} {snapshot['quota_remaining']}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _labels(key: str) -> str:
+    method, endpoint = key.split(" ", 1)
+    return f'method="{method}",endpoint="{endpoint}"'
@@ -0,0 +1,269 @@
+"""
+Middleware pipeline for outgoing API requests.
+
+Every attempt a client sends passes through its ``MiddlewareChain``, in
+order, before reaching the HTTP transport; responses travel back through the
+chain in reverse. Layers can be added, reordered and removed at runtime by
+name, and a client without middleware sends directly, paying nothing.
+
+A layer that only rewrites requests or responses overrides ``on_request``
+and ``on_response``, and then works with both the synchronous and the
+asyncio client. A layer that needs to control the call (short-circuit it,
+time it, retry it) overrides ``__call__`` and ``call_async`` instead.
+
+Examples:
+    >>> class TraceHeader(Middleware):
+    ...     def on_request(self, request):
+    ...         request.headers["X-Trace-Id"] = current_trace_id()
+    ...         return request
+
+    >>> client = MailerSendClient(middleware=[TraceHeader()])
+    >>> client.middleware.add(ResponseCache(), name="cache", before="TraceHeader")
+    >>> client.middleware.remove("cache")
+"""
+
+import threading
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from requests.structures import CaseInsensitiveDict
+
+
+class APIRequest:
+    """
+    A single request attempt as seen by middleware.
+
+    ``body`` is the JSON-serializable payload, or ``bytes`` once a layer has
+    encoded it itself (in which case it should also set ``Content-Type``).
+    Email bodies with attached files arrive as a ``StreamingBody``, which
+    is read while it is sent; ``RequestCompression`` replaces it with a
+    ``CompressedStream`` that is compressed while it is sent.
+    All attributes may be replaced or modified in place.
+    """
+
+    __slots__ = ("method", "url", "path", "params", "body", "headers", "timeout")
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Any = None,
+        headers: Optional[CaseInsensitiveDict] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.method = method
+        self.url = url
+        self.path = path
+        self.params = params
+        self.body = body
+        self.headers = headers if headers is not None else CaseInsensitiveDict()
+        self.timeout = timeout
+
+    def __repr__(self) -> str:
+        return f"APIRequest({self.method} {self.url})"
+
+
+Handler = Callable[[APIRequest], Any]
+AsyncHandler = Callable[[APIRequest], Awaitable[Any]]
+
+
+class Middleware:
+    """
+    Base class for a layer of the request pipeline.
+
+    ``name`` identifies the layer in its chain; it defaults to the class name.
+    """
+
+    name: Optional[str] = None
+
+    def on_request(self, request: APIRequest) -> APIRequest:
+        """Inspect or rewrite a request before it is passed on."""
+        return request
+
+    def on_response(self, request: APIRequest, response: Any) -> Any:
+        """Inspect or replace the response coming back from the next layer."""
+        return response
+
+    def __call__(self, request: APIRequest, call_next: Handler) -> Any:
+        """Handle a request from the synchronous client."""
+        request = self.on_request(request)
+        return self.on_response(request, call_next(request))
+
+    async def call_async(self, request: APIRequest, call_next: AsyncHandler) -> Any:
+        """Handle a request from the asyncio client."""
+        request = self.on_request(request)
+        return self.on_response(request, await call_next(request))
+
+
+class MiddlewareChain:
+    """
+    Ordered, named collection of middleware.
+
+    The first layer sees each request first and its response last.
+    Changes are thread-safe and take effect for the next request.
+    """
+
+    def __init__(self, middleware: Optional[Iterable[Middleware]] = None):
+        self._layers: List[Tuple[str, Middleware]] = []
+        self._lock = threading.Lock()
+        # (layers, send, handler) of the last pipeline built for each client kind
+        self._sync: Optional[Tuple[list, Handler, Handler]] = None
+        self._async: Optional[Tuple[list, AsyncHandler, AsyncHandler]] = None
+        for layer in middleware or ():
+            self.add(layer)
+
+    def add(
+        self,
+        middleware: Middleware,
+        name: Optional[str] = None,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+    ) -> None:
+        """
+        Register a layer.
+
+        Args:
+            middleware: The layer to add
+            name: Name to register it under (defaults to ``middleware.name``
+                  or its class name); must be unique within the chain
+            before: Insert in front of the layer with this name
+            after: Insert behind the layer with this name (at the end of the
+                   chain when neither ``before`` nor ``after`` is given)
+
+        Raises:
+            ValueError: If the name is taken or the anchor does not exist
+        """
+        name = name or middleware.name or type(middleware).__name__
+        with self._lock:
+            if any(existing == name for existing, _ in self._layers):
+                raise ValueError(f"Middleware {name!r} is already registered")
+            layers = list(self._layers)
+            layers.insert(self._position(layers, before, after), (name, middleware))
+            self._replace(layers)
+
+    def remove(self, name: str) -> Middleware:
+        """
+        Unregister the layer called ``name`` and return it.
+
+        Raises:
+            KeyError: If no layer has that name
+        """
+        with self._lock:
+            index = self._index(self._layers, name)
+            layers = list(self._layers)
+            _, middleware = layers.pop(index)
+            self._replace(layers)
+            return middleware
+
+    def move(
+        self, name: str, before: Optional[str] = None, after: Optional[str] = None
+    ) -> None:
+        """Move the layer called ``name`` in front of or behind another layer."""
+        with self._lock:
+            layers = list(self._layers)
+            entry = layers.pop(self._index(layers, name))
+            layers.insert(self._position(layers, before, after), entry)
+            self._replace(layers)
+
+    def get(self, name: str) -> Middleware:
+        """Return the layer called ``name``."""
+        layers = self._layers
+        return layers[self._index(layers, name)][1]
+
+    def names(self) -> List[str]:
+        """Names of the layers, in the order requests pass through them."""
+        return [name for name, _ in self._layers]
+
+    def __contains__(self, name: object) -> bool:
+        return any(existing == name for existing, _ in self._layers)
+
+    def __iter__(self) -> Iterator[Middleware]:
+        return iter([middleware for _, middleware in self._layers])
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    def __repr__(self) -> str:
+        return f"MiddlewareChain({self.names()})"
+
+    def handler(self, send: Handler) -> Handler:
+        """Return ``send`` wrapped in every layer of the chain."""
+        layers = self._layers
+        cached = self._sync
+        if cached is not None and cached[0] is layers and cached[1] == send:
+            return cached[2]
+
+        handler = send
+        for _, middleware in reversed(layers):
+            handler = _bind(middleware, handler)
+        self._sync = (layers, send, handler)
+        return handler
+
+    def async_handler(self, send: AsyncHandler) -> AsyncHandler:
+        """Return the coroutine function ``send`` wrapped in every layer."""
+        layers = self._layers
+        cached = self._async
+        if cached is not None and cached[0] is layers and cached[1] == send:
+            return cached[2]
+
+        handler = send
+        for _, middleware in reversed(layers):
+            handler = _bind_async(middleware, handler)
+        self._async = (layers, send, handler)
+        return handler
+
+    def _replace(self, layers: List[Tuple[str, Middleware]]) -> None:
+        # The list is replaced rather than mutated, so a request in flight
+        # keeps the pipeline it started with, and cached pipelines built from
+        # the old list no longer match
+        self._layers = layers
+
+    @staticmethod
+    def _index(layers: List[Tuple[str, Middleware]], name: str) -> int:
+        for index, (existing, _) in enumerate(layers):
+            if existing == name:
+                return index
+        raise KeyError(f"No middleware named {name!r}")
+
+    @classmethod
+    def _position(
+        cls,
+        layers: List[Tuple[str, Middleware]],
+        before: Optional[str],
+        after: Optional[str],
+    ) -> int:
+        if before is not None and after is not None:
+            raise ValueError("Pass either before or after, not both")
+        try:
+            if before is not None:
+                return cls._index(layers, before)
+            if after is not None:
+                return cls._index(layers, after) + 1
+        except KeyError as e:
+            raise ValueError(str(e.args[0])) from None
+        return len(layers)
+
+
+def _bind(middleware: Middleware, call_next: Handler) -> Handler:
+    def handle(request: APIRequest) -> Any:
+        return middleware(request, call_next)
+
+    return handle
+
+
+def _bind_async(middleware: Middleware, call_next: AsyncHandler) -> AsyncHandler:
+    async def handle(request: APIRequest) -> Any:
+        return await middleware.call_async(request, call_next)
+
+    return handle
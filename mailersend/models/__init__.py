@@ -2,173 +2,178 @@
 Data models used for communicating with the MailerSend API.
 """
 
-from .base import BaseModel
-from .email import (
-    EmailContact,
-    EmailAttachment,
-    EmailPersonalization,
-    EmailRequest,
-    EmailTrackingSettings,
-    EmailHeader,
-)
-from .activity import (
-    ActivityRecipient,
-    ActivityEmail,
-    Activity,
-    ActivityQueryParams,
-    ActivityRequest,
-    SingleActivityRequest,
-)
-from .analytics import (
-    AnalyticsRequest,
-)
-from .domains import (
-    DomainListRequest,
-    DomainCreateRequest,
-    DomainDeleteRequest,
-    DomainGetRequest,
-    DomainUpdateSettingsRequest,
-    DomainRecipientsRequest,
-    DomainDnsRecordsRequest,
-    DomainVerificationRequest,
-    DomainSettings,
-)
-from .identities import (
-    IdentityListRequest,
-    IdentityCreateRequest,
-    IdentityGetRequest,
-    IdentityGetByEmailRequest,
-    IdentityUpdateRequest,
-    IdentityUpdateByEmailRequest,
-    IdentityDeleteRequest,
-    IdentityDeleteByEmailRequest,
-)
-from .inbound import (
-    InboundListRequest,
-    InboundGetRequest,
-    InboundCreateRequest,
-    InboundUpdateRequest,
-    InboundDeleteRequest,
-    InboundFilter,
-    InboundFilterGroup,
-    InboundForward,
-)
-from .messages import (
-    MessagesListRequest,
-    MessageGetRequest,
-)
-from .schedules import (
-    SchedulesListRequest,
-    ScheduleGetRequest,
-    ScheduleDeleteRequest,
-)
-from .recipients import (
-    RecipientsListRequest,
-    RecipientGetRequest,
-    RecipientDeleteRequest,
-    SuppressionListRequest,
-    SuppressionAddRequest,
-    SuppressionDeleteRequest,
-)
-from .templates import (
-    TemplatesListRequest,
-    TemplateGetRequest,
-    TemplateDeleteRequest,
-)
-from .tokens import (
-    TOKEN_SCOPES,
-    TokenStatus,
-    TokensListRequest,
-    TokenGetRequest,
-    TokenCreateRequest,
-    TokenUpdateRequest,
-    TokenUpdateNameRequest,
-    TokenDeleteRequest,
-)
-from .webhooks import (
-    WebhooksListRequest,
-    WebhookGetRequest,
-    WebhookCreateRequest,
-    WebhookUpdateRequest,
-    WebhookDeleteRequest,
-)
-from .email_verification import (
-    EmailVerifyRequest,
-    EmailVerifyAsyncRequest,
-    EmailVerificationAsyncStatusRequest,
-    EmailVerificationListsRequest,
-    EmailVerificationGetRequest,
-    EmailVerificationCreateRequest,
-    EmailVerificationVerifyRequest,
-    EmailVerificationResultsRequest,
-)
-from .users import (
-    User,
-    UserDomain,
-    UserTemplate,
-    UserInvite,
-    UserInviteData,
-    UsersListRequest,
-    UserGetRequest,
-    UserInviteRequest,
-    UserUpdateRequest,
-    UserDeleteRequest,
-    InvitesListRequest,
-    InviteGetRequest,
-    InviteResendRequest,
-    InviteCancelRequest,
-)
-from .sms_sending import SmsPersonalization, SmsSendRequest
-from .sms_numbers import (
-    SmsNumber,
-    SmsNumbersListRequest,
-    SmsNumberGetRequest,
-    SmsNumberUpdateRequest,
-    SmsNumberDeleteRequest,
-)
-from .sms_activity import (
-    SmsActivity,
-    SmsActivityListRequest,
-    SmsMessageGetRequest,
-    SmsMessage,
-)
-from .sms_recipients import (
-    SmsRecipientStatus,
-    SmsRecipientsListRequest,
-    SmsRecipientGetRequest,
-    SmsRecipientUpdateRequest,
-    SmsRecipient,
-    SmsRecipientDetails,
-)
-from .sms_webhooks import (
-    SmsWebhookEvent,
-    SmsWebhooksListRequest,
-    SmsWebhookGetRequest,
-    SmsWebhookCreateRequest,
-    SmsWebhookUpdateRequest,
-    SmsWebhookDeleteRequest,
-    SmsWebhook,
-)
-from .sms_inbounds import (
-    FilterComparer,
-    SmsInboundFilter,
-    SmsInboundsListRequest,
-    SmsInboundGetRequest,
-    SmsInboundCreateRequest,
-    SmsInboundUpdateRequest,
-    SmsInboundDeleteRequest,
-    SmsInbound,
-)
-from .dmarc_monitoring import (
-    DmarcMonitoringListRequest,
-    DmarcMonitoringCreateRequest,
-    DmarcMonitoringUpdateRequest,
-    DmarcMonitoringDeleteRequest,
-    DmarcMonitoringReportRequest,
-    DmarcMonitoringIpReportRequest,
-    DmarcMonitoringReportSourcesRequest,
-    DmarcMonitoringFavoriteRequest,
-)
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import BaseModel
+    from .email import (
+        EmailContact,
+        EmailAttachment,
+        EmailPersonalization,
+        EmailRequest,
+        EmailTrackingSettings,
+        EmailHeader,
+    )
+    from .activity import (
+        ActivityRecipient,
+        ActivityEmail,
+        Activity,
+        ActivityQueryParams,
+        ActivityRequest,
+        SingleActivityRequest,
+    )
+    from .analytics import (
+        AnalyticsRequest,
+    )
+    from .domains import (
+        DomainListRequest,
+        DomainCreateRequest,
+        DomainDeleteRequest,
+        DomainGetRequest,
+        DomainUpdateSettingsRequest,
+        DomainRecipientsRequest,
+        DomainDnsRecordsRequest,
+        DomainVerificationRequest,
+        DomainSettings,
+    )
+    from .identities import (
+        IdentityListRequest,
+        IdentityCreateRequest,
+        IdentityGetRequest,
+        IdentityGetByEmailRequest,
+        IdentityUpdateRequest,
+        IdentityUpdateByEmailRequest,
+        IdentityDeleteRequest,
+        IdentityDeleteByEmailRequest,
+    )
+    from .inbound import (
+        InboundListRequest,
+        InboundGetRequest,
+        InboundCreateRequest,
+        InboundUpdateRequest,
+        InboundDeleteRequest,
+        InboundFilter,
+        InboundFilterGroup,
+        InboundForward,
+    )
+    from .messages import (
+        MessagesListRequest,
+        MessageGetRequest,
+    )
+    from .schedules import (
+        SchedulesListRequest,
+        ScheduleGetRequest,
+        ScheduleDeleteRequest,
+    )
+    from .recipients import (
+        RecipientsListRequest,
+        RecipientGetRequest,
+        RecipientDeleteRequest,
+        SuppressionListRequest,
+        SuppressionAddRequest,
+        SuppressionDeleteRequest,
+    )
+    from .templates import (
+        TemplatesListRequest,
+        TemplateGetRequest,
+        TemplateDeleteRequest,
+    )
+    from .tokens import (
+        TOKEN_SCOPES,
+        TokenStatus,
+        TokensListRequest,
+        TokenGetRequest,
+        TokenCreateRequest,
+        TokenUpdateRequest,
+        TokenUpdateNameRequest,
+        TokenDeleteRequest,
+    )
+    from .webhooks import (
+        WebhooksListRequest,
+        WebhookGetRequest,
+        WebhookCreateRequest,
+        WebhookUpdateRequest,
+        WebhookDeleteRequest,
+    )
+    from .email_verification import (
+        EmailVerifyRequest,
+        EmailVerifyAsyncRequest,
+        EmailVerificationAsyncStatusRequest,
+        EmailVerificationListsRequest,
+        EmailVerificationGetRequest,
+        EmailVerificationCreateRequest,
+        EmailVerificationVerifyRequest,
+        EmailVerificationResultsRequest,
+    )
+    from .users import (
+        User,
+        UserDomain,
+        UserTemplate,
+        UserInvite,
+        UserInviteData,
+        UsersListRequest,
+        UserGetRequest,
+        UserInviteRequest,
+        UserUpdateRequest,
+        UserDeleteRequest,
+        InvitesListRequest,
+        InviteGetRequest,
+        InviteResendRequest,
+        InviteCancelRequest,
+    )
+    from .sms_sending import SmsPersonalization, SmsSendRequest
+    from .sms_numbers import (
+        SmsNumber,
+        SmsNumbersListRequest,
+        SmsNumberGetRequest,
+        SmsNumberUpdateRequest,
+        SmsNumberDeleteRequest,
+    )
+    from .sms_activity import (
+        SmsActivity,
+        SmsActivityListRequest,
+        SmsMessageGetRequest,
+        SmsMessage,
+    )
+    from .sms_recipients import (
+        SmsRecipientStatus,
+        SmsRecipientsListRequest,
+        SmsRecipientGetRequest,
+        SmsRecipientUpdateRequest,
+        SmsRecipient,
+        SmsRecipientDetails,
+    )
+    from .sms_webhooks import (
+        SmsWebhookEvent,
+        SmsWebhooksListRequest,
+        SmsWebhookGetRequest,
+        SmsWebhookCreateRequest,
+        SmsWebhookUpdateRequest,
+        SmsWebhookDeleteRequest,
+        SmsWebhook,
+    )
+    from .sms_inbounds import (
+        FilterComparer,
+        SmsInboundFilter,
+        SmsInboundsListRequest,
+        SmsInboundGetRequest,
+        SmsInboundCreateRequest,
+        SmsInboundUpdateRequest,
+        SmsInboundDeleteRequest,
+        SmsInbound,
+    )
+    from .dmarc_monitoring import (
+        DmarcMonitoringListRequest,
+        DmarcMonitoringCreateRequest,
+        DmarcMonitoringUpdateRequest,
+        DmarcMonitoringDeleteRequest,
+        DmarcMonitoringReportRequest,
+        DmarcMonitoringIpReportRequest,
+        DmarcMonitoringReportSourcesRequest,
+        DmarcMonitoringFavoriteRequest,
+    )
 
 __all__ = [
     "BaseModel",
@@ -309,3 +314,177 @@ __all__ = [
     "DmarcMonitoringReportSourcesRequest",
     "DmarcMonitoringFavoriteRequest",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".base": ("BaseModel",),
+        ".email": (
+            "EmailContact",
+            "EmailAttachment",
+            "EmailPersonalization",
+            "EmailRequest",
+            "EmailTrackingSettings",
+            "EmailHeader",
+        ),
+        ".activity": (
+            "ActivityRecipient",
+            "ActivityEmail",
+            "Activity",
+            "ActivityQueryParams",
+            "ActivityRequest",
+            "SingleActivityRequest",
+        ),
+        ".analytics": ("AnalyticsRequest",),
+        ".domains": (
+            "DomainListRequest",
+            "DomainCreateRequest",
+            "DomainDeleteRequest",
+            "DomainGetRequest",
+            "DomainUpdateSettingsRequest",
+            "DomainRecipientsRequest",
+            "DomainDnsRecordsRequest",
+            "DomainVerificationRequest",
+            "DomainSettings",
+        ),
+        ".identities": (
+            "IdentityListRequest",
+            "IdentityCreateRequest",
+            "IdentityGetRequest",
+            "IdentityGetByEmailRequest",
+            "IdentityUpdateRequest",
+            "IdentityUpdateByEmailRequest",
+            "IdentityDeleteRequest",
+            "IdentityDeleteByEmailRequest",
+        ),
+        ".inbound": (
+            "InboundListRequest",
+            "InboundGetRequest",
+            "InboundCreateRequest",
+            "InboundUpdateRequest",
+            "InboundDeleteRequest",
+            "InboundFilter",
+            "InboundFilterGroup",
+            "InboundForward",
+        ),
+        ".messages": (
+            "MessagesListRequest",
+            "MessageGetRequest",
+        ),
+        ".schedules": (
+            "SchedulesListRequest",
+            "ScheduleGetRequest",
+            "ScheduleDeleteRequest",
+        ),
+        ".recipients": (
+            "RecipientsListRequest",
+            "RecipientGetRequest",
+            "RecipientDeleteRequest",
+            "SuppressionListRequest",
+            "SuppressionAddRequest",
+            "SuppressionDeleteRequest",
+        ),
+        ".templates": (
+            "TemplatesListRequest",
+            "TemplateGetRequest",
+            "TemplateDeleteRequest",
+        ),
+        ".tokens": (
+            "TOKEN_SCOPES",
+            "TokenStatus",
+            "TokensListRequest",
+            "TokenGetRequest",
+            "TokenCreateRequest",
+            "TokenUpdateRequest",
+            "TokenUpdateNameRequest",
+            "TokenDeleteRequest",
+        ),
+        ".webhooks": (
+            "WebhooksListRequest",
+            "WebhookGetRequest",
+            "WebhookCreateRequest",
+            "WebhookUpdateRequest",
+            "WebhookDeleteRequest",
+        ),
+        ".email_verification": (
+            "EmailVerifyRequest",
+            "EmailVerifyAsyncRequest",
+            "EmailVerificationAsyncStatusRequest",
+            "EmailVerificationListsRequest",
+            "EmailVerificationGetRequest",
+            "EmailVerificationCreateRequest",
+            "EmailVerificationVerifyRequest",
+            "EmailVerificationResultsRequest",
+        ),
+        ".users": (
+            "User",
+            "UserDomain",
+            "UserTemplate",
+            "UserInvite",
+            "UserInviteData",
+            "UsersListRequest",
+            "UserGetRequest",
+            "UserInviteRequest",
+            "UserUpdateRequest",
+            "UserDeleteRequest",
+            "InvitesListRequest",
+            "InviteGetRequest",
+            "InviteResendRequest",
+            "InviteCancelRequest",
+        ),
+        ".sms_sending": (
+            "SmsPersonalization",
+            "SmsSendRequest",
+        ),
+        ".sms_numbers": (
+            "SmsNumber",
+            "SmsNumbersListRequest",
+            "SmsNumberGetRequest",
+            "SmsNumberUpdateRequest",
+            "SmsNumberDeleteRequest",
+        ),
+        ".sms_activity": (
+            "SmsActivity",
+            "SmsActivityListRequest",
+            "SmsMessageGetRequest",
+            "SmsMessage",
+        ),
+        ".sms_recipients": (
+            "SmsRecipientStatus",
+            "SmsRecipientsListRequest",
+            "SmsRecipientGetRequest",
+            "SmsRecipientUpdateRequest",
+            "SmsRecipient",
+            "SmsRecipientDetails",
+        ),
+        ".sms_webhooks": (
+            "SmsWebhookEvent",
+            "SmsWebhooksListRequest",
+            "SmsWebhookGetRequest",
+            "SmsWebhookCreateRequest",
+            "SmsWebhookUpdateRequest",
+            "SmsWebhookDeleteRequest",
+            "SmsWebhook",
+        ),
+        ".sms_inbounds": (
+            "FilterComparer",
+            "SmsInboundFilter",
+            "SmsInboundsListRequest",
+            "SmsInboundGetRequest",
+            "SmsInboundCreateRequest",
+            "SmsInboundUpdateRequest",
+            "SmsInboundDeleteRequest",
+            "SmsInbound",
+        ),
+        ".dmarc_monitoring": (
+            "DmarcMonitoringListRequest",
+            "DmarcMonitoringCreateRequest",
+            "DmarcMonitoringUpdateRequest",
+            "DmarcMonitoringDeleteRequest",
+            "DmarcMonitoringReportRequest",
+            "DmarcMonitoringIpReportRequest",
+            "DmarcMonitoringReportSourcesRequest",
+            "DmarcMonitoringFavoriteRequest",
+        ),
+    },
+)
@@ -4,6 +4,7 @@ from typing import List, Optional, Any
 from pydantic import Field, EmailStr, ConfigDict
 
 from .base import BaseModel
+from ..constants import ACTIVITY_MAX_RANGE_SECONDS
 
 
 class ActivityRecipient(BaseModel):
@@ -65,7 +66,7 @@ class ActivityQueryParams(BaseModel):
             raise ValueError("date_to must be greater than date_from")
 
         # Validate timeframe (max 7 days = 604800 seconds)
-        if (self.date_to - self.date_from) > 604800:
+        if (self.date_to - self.date_from) > ACTIVITY_MAX_RANGE_SECONDS:
             raise ValueError(
                 "Timeframe between date_from and date_to cannot exceed 7 days"
             )
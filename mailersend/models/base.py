@@ -1,9 +1,15 @@
 """Base models."""
 
-from typing import List, Dict, Any, Generic, TypeVar, Optional
+import inspect
+import typing
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, Generic, Tuple, TypeVar, Optional
 from pydantic import BaseModel as PydanticBaseModel, ConfigDict
 import json
 
+from ..serialization import loads
+
 T = TypeVar("T")
 
 
@@ -20,18 +26,179 @@ class BaseModel(PydanticBaseModel):
     model_config = ConfigDict(validate_by_name=True, extra="ignore")
 
     @classmethod
-    def from_api(cls, data: Dict[str, Any]):
+    def from_api(cls, data: Dict[str, Any], trusted: bool = False):
         """
         Create a model instance from API response data.
 
         Args:
             data: API response data dictionary
+            trusted: Skip validation and build the model with
+                    ``construct_trusted``
 
         Returns:
             Initialized model instance
         """
+        if trusted:
+            return cls.construct_trusted(data)
         return cls(**data)
 
+    @classmethod
+    def construct_trusted(cls, data: Dict[str, Any]):
+        """
+        Build a model from API data without validating it.
+
+        Like ``model_construct``, but nested models (including lists and
+        dicts of models) are built too, and fields are read by alias or by
+        name. Values are not coerced: use it only for data that comes from
+        the API, whose shape the models already describe.
+
+        Args:
+            data: API response data dictionary
+
+        Returns:
+            Model instance
+        """
+        values = {}
+        for name, keys, convert in _construction_plan(cls):
+            for key in keys:
+                if key in data:
+                    value = data[key]
+                    values[name] = value if convert is None else convert(value)
+                    break
+        return cls.model_construct(**values)
+
+
+_Converter = Optional[Callable[[Any], Any]]
+
+
+@lru_cache(maxsize=None)
+def _construction_plan(
+    cls: type,
+) -> Tuple[Tuple[str, Tuple[str, ...], _Converter], ...]:
+    """Per-field (name, input keys, converter) triples for ``construct_trusted``."""
+    plan = []
+    for name, field in cls.model_fields.items():
+        keys = (field.alias, name) if field.alias and field.alias != name else (name,)
+        plan.append((name, keys, _converter(field.annotation)))
+    return tuple(plan)
+
+
+def _converter(annotation: Any) -> _Converter:
+    """Return a function building the models inside ``annotation``, if any."""
+    if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        model = annotation
+        return lambda value: (
+            model.construct_trusted(value) if isinstance(value, dict) else value
+        )
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Union:
+        # Build the first model alternative that applies (Optional[Model] etc.)
+        for arg in args:
+            convert = _converter(arg)
+            if convert is not None:
+                return convert
+        return None
+    if origin in (list, tuple, set, frozenset) and args:
+        convert = _converter(args[0])
+        if convert is not None:
+            return lambda value: (
+                [convert(item) for item in value] if isinstance(value, list) else value
+            )
+        return None
+    if origin is dict and len(args) == 2:
+        convert = _converter(args[1])
+        if convert is not None:
+            return lambda value: (
+                {key: convert(item) for key, item in value.items()}
+                if isinstance(value, dict)
+                else value
+            )
+    return None
+
+
+def parse_models(
+    data: Any, model_class: type, trusted: bool = False, lazy: bool = False
+) -> Any:
+    """
+    Convert API response data into instances of ``model_class``.
+
+    A ``{"data": [...], "meta": ..., "links": ...}`` list response becomes a
+    ``ModelList``, a single object a model and a bare list a list of models.
+    Anything else is returned unchanged.
+
+    Args:
+        data: Decoded response body
+        model_class: Model describing one item
+        trusted: Build models with ``construct_trusted`` instead of validating
+        lazy: Build each list item on first access instead of all up front
+
+    Returns:
+        Model instance(s) or the unchanged data
+    """
+    build = model_class.construct_trusted if trusted else model_class.model_validate
+
+    def build_all(items):
+        return LazyItems(items, build) if lazy else [build(item) for item in items]
+
+    # Handle pagination results
+    if isinstance(data, dict) and isinstance(data.get("data"), list):
+        return ModelList(
+            items=build_all(data["data"]),
+            meta=data.get("meta", {}),
+            links=data.get("links", {}),
+        )
+
+    # Handle single item
+    if isinstance(data, dict):
+        return build(data)
+
+    # Handle list of items
+    if isinstance(data, list):
+        return build_all(data)
+
+    return data
+
+
+class LazyItems(Sequence):
+    """
+    Read-only sequence building each item from its raw data on first access.
+
+    Built items are cached, and their raw data released, so every item is
+    converted at most once.
+    """
+
+    __slots__ = ("_raw", "_built", "_build")
+
+    _PENDING = object()
+
+    def __init__(self, raw: List[Any], build: Callable[[Any], Any]):
+        self._raw = list(raw)
+        self._built = [self._PENDING] * len(self._raw)
+        self._build = build
+
+    def __len__(self) -> int:
+        return len(self._built)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self._built[index]
+        if item is self._PENDING:
+            item = self._built[index] = self._build(self._raw[index])
+            self._raw[index] = None
+        return item
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (LazyItems, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        built = sum(item is not self._PENDING for item in self._built)
+        return f"LazyItems({built}/{len(self)} built)"
+
 
 class HeaderDict(dict):
     """
@@ -83,12 +250,55 @@ class APIResponse:
         status_code: int,
         request_id: Optional[str] = None,
         rate_limit_remaining: Optional[int] = None,
+        content: Optional[bytes] = None,
+        model_class: Optional[type] = None,
+        trusted: bool = False,
     ):
-        self.data = data
+        """
+        Initialize the response.
+
+        Args:
+            data: Decoded response data (None to decode ``content`` lazily)
+            headers: Response headers
+            status_code: HTTP status code
+            request_id: Value of the ``x-request-id`` header
+            rate_limit_remaining: Value of the ``x-apiquota-remaining`` header
+            content: Raw JSON body, decoded on first access to ``data``
+            model_class: Default model for ``as_models``
+            trusted: Default for ``as_models(trusted=...)``
+        """
+        self._content = content if data is None else None
+        self._data = data
+        self._models = None
         self.headers = HeaderDict(headers)  # Use HeaderDict instead of regular dict
         self.status_code = status_code
         self.request_id = request_id
         self.rate_limit_remaining = rate_limit_remaining
+        self.model_class = model_class
+        self.trusted = trusted
+
+    @property
+    def data(self) -> Any:
+        """Response data, decoded from the raw body on first access."""
+        if self._content is not None:
+            content, self._content = self._content, None
+            try:
+                self._data = loads(content)
+            except ValueError:
+                # If JSON parsing fails, use empty dict
+                self._data = {}
+        return self._data
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        self._content = None
+        self._data = value
+        self._models = None
+
+    @property
+    def is_decoded(self) -> bool:
+        """Whether the body has been decoded (see ``data``)."""
+        return self._content is None
 
     def __getitem__(self, key):
         """Allow dict-like access to data and object attributes."""
@@ -116,6 +326,12 @@ class APIResponse:
     def __getattr__(self, name):
         """Allow direct access to data fields for convenience."""
         # Handle data_ prefix for explicit data field access (avoids method conflicts)
+        # Private attributes are never data fields (and may not be set yet)
+        if name.startswith("_"):
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+
         if name.startswith("data_"):
             field_name = name[5:]  # Remove 'data_' prefix
             if isinstance(self.data, dict) and field_name in self.data:
@@ -155,6 +371,50 @@ class APIResponse:
             return obj.to_dict()
         raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
+    def as_models(
+        self,
+        model_class: Optional[type] = None,
+        trusted: Optional[bool] = None,
+        lazy: bool = True,
+    ) -> Any:
+        """
+        Convert the response data into models.
+
+        Works for every list endpoint: the items of a list response are
+        returned as a ``ModelList`` that keeps the pagination metadata. The
+        result is cached, and list items are built on first access, so
+        skimming a large page only pays for the items that are read.
+
+        Args:
+            model_class: Model describing one item (e.g. ``Activity``);
+                    defaults to the resource's model, if it has one
+            trusted: Skip validation of data coming from the API; much
+                    faster for large pages (defaults to the client's
+                    ``trust_server_data`` setting)
+            lazy: Build list items on first access instead of all at once
+
+        Returns:
+            ``ModelList`` for list responses, a model for single objects
+
+        Raises:
+            ValueError: If no model class is given or known for the response
+
+        Examples:
+            >>> page = client.activities.get(request).as_models(Activity)
+            >>> page[0].email.recipient.email
+        """
+        model_class = model_class or self.model_class
+        if model_class is None:
+            raise ValueError("as_models() needs a model class for this response")
+        if trusted is None:
+            trusted = self.trusted
+
+        key = (model_class, trusted, lazy)
+        if self._models is None or self._models[0] != key:
+            models = parse_models(self.data, model_class, trusted=trusted, lazy=lazy)
+            self._models = (key, models)
+        return self._models[1]
+
     @property
     def success(self) -> bool:
         """Whether the request was successful."""
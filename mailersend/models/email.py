@@ -1,14 +1,17 @@
 """Email models."""
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Union
 from pydantic import (
     Field,
     EmailStr,
     ConfigDict,
+    field_serializer,
     field_validator,
     model_validator,
 )
 from .base import BaseModel
+from ..attachments import AttachmentFile
+from ..serialization import stream_placeholder
 import time
 
 
@@ -18,17 +21,27 @@ class EmailContact(BaseModel):
 
 
 class EmailAttachment(BaseModel):
-    content: str  # Base64 encoded content
+    # Base64 encoded content, or a file encoded when the email is sent
+    content: Union[str, AttachmentFile]
     disposition: str  # 'inline' or 'attachment'
     filename: str
     id: Optional[str] = None
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     @field_validator("disposition")
     def validate_disposition(cls, v):
         if v not in ["inline", "attachment"]:
             raise ValueError("Disposition must be 'inline' or 'attachment'")
         return v
 
+    @field_serializer("content")
+    def serialize_content(self, content, info):
+        if isinstance(content, AttachmentFile):
+            # Streamed into the request body, or read in full if not sending
+            return stream_placeholder(content, info.context) or content.read_base64()
+        return content
+
 
 class EmailPersonalization(BaseModel):
     email: EmailStr
@@ -0,0 +1,484 @@
+"""
+Durable outbox for email sends.
+
+``Outbox`` stores serialized ``EmailRequest`` payloads in a local SQLite
+database. Enqueuing is a single local insert, so callers are not slowed
+down, or failed, by the API being slow or unavailable. ``OutboxDrainer`` sends
+the queued emails from a background thread through a regular client (and so
+at the rate its ``rate_limiter`` allows), retrying transient failures with
+backoff and recording every outcome in the database.
+
+Each email keeps the idempotency key it was enqueued with, so an email that
+is sent again after a crash, between the send and its checkpoint, carries
+the same ``Idempotency-Key`` as the first attempt.
+
+Rows are claimed with a lease before they are sent, so several drainers,
+even in different processes, can share one outbox file.
+
+Examples:
+    >>> outbox = Outbox("/var/spool/mailersend/outbox.db")
+    >>> outbox.enqueue(email)  # in the web tier
+    1
+
+    >>> with OutboxDrainer(outbox, client):  # in a worker
+    ...     serve_forever()
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .constants import (
+    IDEMPOTENCY_HEADER,
+    OUTBOX_LEASE,
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_MAX_RETRY_DELAY,
+    OUTBOX_RETRY_DELAY,
+)
+from .exceptions import (
+    AuthenticationError,
+    BadRequestError,
+    MailerSendError,
+    RateLimitExceeded,
+    ResourceNotFoundError,
+)
+from .idempotency import idempotency_key_for
+from .logging import get_logger
+from .rate_limit import parse_retry_after
+from .models.email import EmailRequest
+from .serialization import model_json
+
+PENDING = "pending"
+SENT = "sent"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    payload BLOB NOT NULL,
+    idempotency_key TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    enqueued_at REAL NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    message_id TEXT,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at);
+"""
+
+
+class Outbox:
+    """
+    SQLite-backed queue of emails waiting to be sent.
+
+    The database uses write-ahead logging. With the default ``synchronous``
+    setting, enqueued emails survive a crash of the process; use ``"FULL"``
+    to also survive a power loss, at the cost of slower inserts.
+    """
+
+    PERMANENT_ERRORS = (AuthenticationError, ResourceNotFoundError, BadRequestError)
+
+    def __init__(
+        self,
+        path: str,
+        max_attempts: int = OUTBOX_MAX_ATTEMPTS,
+        retry_delay: float = OUTBOX_RETRY_DELAY,
+        max_retry_delay: float = OUTBOX_MAX_RETRY_DELAY,
+        lease: float = OUTBOX_LEASE,
+        synchronous: str = "NORMAL",
+    ):
+        """
+        Open (and create, if needed) an outbox database.
+
+        Args:
+            path: Path of the SQLite database file
+            max_attempts: Send attempts after which an email is marked failed
+            retry_delay: Seconds before the first retry of a transient failure;
+                        doubled after every further failure
+            max_retry_delay: Upper bound for the delay between retries
+            lease: Seconds a claimed email is hidden from other drainers; a
+                  drainer that dies mid-send releases its emails after this
+            synchronous: SQLite ``synchronous`` pragma (``"NORMAL"`` or ``"FULL"``)
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if retry_delay < 0 or max_retry_delay < retry_delay:
+            raise ValueError("Delays must satisfy 0 <= retry_delay <= max_retry_delay")
+        if synchronous.upper() not in ("NORMAL", "FULL"):
+            raise ValueError("synchronous must be 'NORMAL' or 'FULL'")
+
+        self.path = path
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.lease = lease
+        self.synchronous = synchronous.upper()
+        self.logger = get_logger()
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        # Set when this process enqueues, so local drainers wake up at once
+        self._wakeup = threading.Event()
+
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection to the database."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Autocommit mode; transactions are opened explicitly. Each
+            # connection serves one thread, but close() may run on another.
+            connection = sqlite3.connect(
+                self.path, isolation_level=None, timeout=30, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(f"PRAGMA synchronous={self.synchronous}")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def enqueue(
+        self, email: EmailRequest, idempotency_key: Optional[str] = None
+    ) -> int:
+        """
+        Queue an email for sending.
+
+        Args:
+            email: A fully-validated EmailRequest object
+            idempotency_key: Key identifying this send (derived from the
+                            email content if omitted)
+
+        Returns:
+            ID of the outbox entry
+        """
+        (entry_id,) = self.enqueue_many([email], [idempotency_key])
+        return entry_id
+
+    def enqueue_many(
+        self,
+        emails: Iterable[EmailRequest],
+        idempotency_keys: Optional[Iterable[Optional[str]]] = None,
+    ) -> List[int]:
+        """
+        Queue several emails in a single transaction.
+
+        Args:
+            emails: EmailRequest objects to send
+            idempotency_keys: Key for each email (None entries are derived
+                             from the email content)
+
+        Returns:
+            IDs of the outbox entries, in order
+        """
+        emails = list(emails)
+        keys = list(idempotency_keys) if idempotency_keys is not None else []
+        keys += [None] * (len(emails) - len(keys))
+        now = time.time()
+
+        rows = []
+        for email, key in zip(emails, keys):
+            payload = model_json(email)
+            if key is None:
+                key = idempotency_key_for("POST", "email", payload)
+            rows.append((payload, key, now, now, now))
+
+        connection = self._connection()
+        ids = []
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for row in rows:
+                cursor = connection.execute(
+                    "INSERT INTO outbox (payload, idempotency_key, enqueued_at, "
+                    "next_attempt_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    row,
+                )
+                ids.append(cursor.lastrowid)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        self._wakeup.set()
+        return ids
+
+    def claim(self, limit: int = 1) -> List[Tuple[int, bytes, str]]:
+        """
+        Claim due emails for sending, oldest first.
+
+        Claimed emails are leased: other drainers skip them until the lease
+        expires or the outcome is recorded.
+
+        Args:
+            limit: Maximum number of emails to claim
+
+        Returns:
+            ``(id, payload, idempotency_key)`` for every claimed email
+        """
+        now = time.time()
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            rows = connection.execute(
+                "SELECT id, payload, idempotency_key FROM outbox "
+                "WHERE status = ? AND next_attempt_at <= ? ORDER BY id LIMIT ?",
+                (PENDING, now, limit),
+            ).fetchall()
+            connection.executemany(
+                "UPDATE outbox SET next_attempt_at = ? WHERE id = ?",
+                [(now + self.lease, row[0]) for row in rows],
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return rows
+
+    def mark_sent(self, entry_id: int, message_id: Optional[str]) -> None:
+        """Record that an email was accepted by the API."""
+        self._connection().execute(
+            "UPDATE outbox SET status = ?, attempts = attempts + 1, "
+            "message_id = ?, last_error = NULL, updated_at = ? WHERE id = ?",
+            (SENT, message_id, time.time(), entry_id),
+        )
+
+    def mark_failed(
+        self, entry_id: int, error: Exception, retry_after: Optional[float] = None
+    ) -> str:
+        """
+        Record a failed attempt to send an email.
+
+        The email is scheduled for another attempt with exponential backoff,
+        unless the error is permanent or the email ran out of attempts.
+
+        Args:
+            entry_id: ID of the outbox entry
+            error: Exception raised by the attempt
+            retry_after: Delay requested by the API, if any
+
+        Returns:
+            The email's new status (``"pending"`` or ``"failed"``)
+        """
+        connection = self._connection()
+        (attempts,) = connection.execute(
+            "SELECT attempts + 1 FROM outbox WHERE id = ?", (entry_id,)
+        ).fetchone()
+
+        now = time.time()
+        if isinstance(error, self.PERMANENT_ERRORS) or attempts >= self.max_attempts:
+            status, next_attempt_at = FAILED, now
+        else:
+            delay = min(self.retry_delay * 2 ** (attempts - 1), self.max_retry_delay)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            status, next_attempt_at = PENDING, now + delay
+
+        connection.execute(
+            "UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?, "
+            "last_error = ?, updated_at = ? WHERE id = ?",
+            (status, attempts, next_attempt_at, str(error), now, entry_id),
+        )
+        return status
+
+    def drain(
+        self,
+        client,
+        limit: Optional[int] = None,
+        stop: Optional[threading.Event] = None,
+    ) -> Dict[str, int]:
+        """
+        Send the emails that are due, in enqueue order.
+
+        Args:
+            client: The MailerSendClient instance used to send
+            limit: Maximum number of emails to send (None for all that are due)
+            stop: Event that, once set, ends the drain after the current email
+
+        Returns:
+            Number of emails ``sent``, ``retried`` later and ``failed``
+
+        Raises:
+            Exception: Any error other than a ``MailerSendError``, once the
+                      attempt has been recorded and the email released
+        """
+        counts = {SENT: 0, "retried": 0, FAILED: 0}
+        done = 0
+        while limit is None or done < limit:
+            if stop is not None and stop.is_set():
+                break
+            # One email per claim, so a lease only has to cover a single send
+            rows = self.claim(1)
+            if not rows:
+                break
+            counts[self._send(client, *rows[0])] += 1
+            done += 1
+        return counts
+
+    def _send(self, client, entry_id: int, payload: bytes, key: str) -> str:
+        """Send one claimed email and record the outcome."""
+        try:
+            response = client.request(
+                method="POST",
+                path="email",
+                body=payload,
+                headers={IDEMPOTENCY_HEADER: key},
+            )
+        except MailerSendError as e:
+            retry_after = None
+            if isinstance(e, RateLimitExceeded) and e.response is not None:
+                retry_after = parse_retry_after(e.response.headers.get("Retry-After"))
+            status = self.mark_failed(entry_id, e, retry_after)
+            self.logger.warning(
+                "Outbox entry %s not sent (%s): %s", entry_id, status, e
+            )
+            return FAILED if status == FAILED else "retried"
+        except Exception as e:
+            # A local failure (a middleware bug, an unreadable file) still
+            # counts as an attempt and releases the lease before propagating
+            self.mark_failed(entry_id, e)
+            raise
+
+        self.mark_sent(entry_id, response.headers.get("x-message-id"))
+        return SENT
+
+    def retry_failed(self) -> int:
+        """Queue every failed email for another round of attempts."""
+        now = time.time()
+        cursor = self._connection().execute(
+            "UPDATE outbox SET status = ?, attempts = 0, next_attempt_at = ?, "
+            "updated_at = ? WHERE status = ?",
+            (PENDING, now, now, FAILED),
+        )
+        self._wakeup.set()
+        return cursor.rowcount
+
+    def purge_sent(self, older_than: float = 0) -> int:
+        """
+        Delete sent emails.
+
+        Args:
+            older_than: Only delete emails sent at least this many seconds ago
+
+        Returns:
+            Number of deleted entries
+        """
+        cursor = self._connection().execute(
+            "DELETE FROM outbox WHERE status = ? AND updated_at <= ?",
+            (SENT, time.time() - older_than),
+        )
+        return cursor.rowcount
+
+    def get(self, entry_id: int) -> Optional[Dict[str, Any]]:
+        """Return an outbox entry (without its payload), or None."""
+        connection = self._connection()
+        cursor = connection.execute(
+            "SELECT id, idempotency_key, status, attempts, enqueued_at, "
+            "next_attempt_at, updated_at, message_id, last_error "
+            "FROM outbox WHERE id = ?",
+            (entry_id,),
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return dict(zip([column[0] for column in cursor.description], row))
+
+    def stats(self) -> Dict[str, Any]:
+        """Count the entries by status and report the age of the oldest pending one."""
+        connection = self._connection()
+        counts = dict(
+            connection.execute(
+                "SELECT status, COUNT(*) FROM outbox GROUP BY status"
+            ).fetchall()
+        )
+        (oldest,) = connection.execute(
+            "SELECT MIN(enqueued_at) FROM outbox WHERE status = ?", (PENDING,)
+        ).fetchone()
+        return {
+            PENDING: counts.get(PENDING, 0),
+            SENT: counts.get(SENT, 0),
+            FAILED: counts.get(FAILED, 0),
+            "oldest_pending_age": time.time() - oldest if oldest else None,
+        }
+
+    def close(self) -> None:
+        """Close every connection opened by this outbox."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def __enter__(self) -> "Outbox":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class OutboxDrainer:
+    """
+    Background thread sending the emails of an ``Outbox``.
+
+    The drainer sends whatever is due, then sleeps until ``poll_interval``
+    elapses or an email is enqueued by this process, whichever comes first.
+    """
+
+    def __init__(self, outbox: Outbox, client, poll_interval: float = 1.0):
+        """
+        Initialize the drainer.
+
+        Args:
+            outbox: Outbox to drain
+            client: The MailerSendClient instance used to send (its rate
+                   limiter and retry policy apply to every send)
+            poll_interval: Longest pause between two checks for due emails
+        """
+        self.outbox = outbox
+        self.client = client
+        self.poll_interval = poll_interval
+        self.logger = get_logger()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "OutboxDrainer":
+        """Start the background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            raise RuntimeError("OutboxDrainer is already running")
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="mailersend-outbox", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the thread once the email being sent, if any, is recorded."""
+        self._stop.set()
+        self.outbox._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.outbox._wakeup.clear()
+            try:
+                self.outbox.drain(self.client, stop=self._stop)
+            except Exception:
+                # Keep draining; a broken database or client is logged
+                self.logger.exception("Outbox drain failed")
+            self.outbox._wakeup.wait(self.poll_interval)
+
+    def __enter__(self) -> "OutboxDrainer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,442 @@
+"""
+Lazy pagination over list endpoints.
+
+Every ``list_*`` resource method returns a single page. ``Paginator`` walks
+the pages of such a method, following the ``meta``/``links`` blocks of each
+response, and yields the items one by one. While the caller works through a
+page, the next one is already being fetched in the background.
+
+Examples:
+    >>> for recipient in client.recipients.paginate("list_recipients"):
+    ...     export(recipient)
+
+    >>> request = MessagesBuilder().limit(100).build_list_request()
+    >>> for message in paginate(client.messages.list_messages, request):
+    ...     print(message["id"])
+
+    >>> # Fetch up to 8 pages at a time once the last page is known
+    >>> for entry in client.recipients.paginate("list_blocklist", max_in_flight=8):
+    ...     export(entry)
+"""
+
+import asyncio
+import inspect
+import typing
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterator,
+    Optional,
+)
+
+from pydantic import BaseModel as PydanticBaseModel
+
+from .models.base import APIResponse, ModelList, parse_models
+
+
+def with_page(request: PydanticBaseModel, page: int) -> PydanticBaseModel:
+    """
+    Return a copy of a list request that targets ``page``.
+
+    Supports requests carrying ``page`` directly as well as requests that
+    nest it in ``query_params``.
+
+    Raises:
+        TypeError: If the request has no page parameter
+    """
+    if "page" in type(request).model_fields:
+        return request.model_copy(update={"page": page})
+
+    query_params = getattr(request, "query_params", None)
+    if isinstance(query_params, PydanticBaseModel) and (
+        "page" in type(query_params).model_fields
+    ):
+        return request.model_copy(
+            update={"query_params": query_params.model_copy(update={"page": page})}
+        )
+
+    raise TypeError(f"{type(request).__name__} does not support pagination")
+
+
+def default_request(list_method: Callable[..., Any]) -> PydanticBaseModel:
+    """
+    Build the default request for a list method from its type hints.
+
+    Required nested models (typically ``query_params``) are created with
+    their own defaults, mirroring what list methods do when called without
+    a request.
+
+    Raises:
+        TypeError: If no default request can be built for the method
+    """
+    request_class = _request_class(list_method)
+    if request_class is None:
+        raise TypeError(
+            f"Cannot build a default request for {list_method.__name__}; "
+            "pass a request explicitly"
+        )
+
+    try:
+        values = {
+            name: field.annotation()
+            for name, field in request_class.model_fields.items()
+            if field.is_required() and _is_model_class(field.annotation)
+        }
+        return request_class(**values)
+    except ValueError as e:
+        raise TypeError(
+            f"Cannot build a default request for {list_method.__name__}; "
+            f"pass a request explicitly ({e})"
+        )
+
+
+def _request_class(list_method: Callable[..., Any]) -> Optional[type]:
+    """Return the request model class a list method expects."""
+    try:
+        hints = typing.get_type_hints(list_method)
+    except Exception:
+        return None
+
+    annotation = hints.get("request")
+    if typing.get_origin(annotation) is typing.Union:
+        candidates = [arg for arg in typing.get_args(annotation) if arg is not None]
+        annotation = next((arg for arg in candidates if _is_model_class(arg)), None)
+
+    return annotation if _is_model_class(annotation) else None
+
+
+def _is_model_class(annotation: Any) -> bool:
+    return inspect.isclass(annotation) and issubclass(annotation, PydanticBaseModel)
+
+
+def page_of(response: APIResponse) -> ModelList:
+    """Wrap a list response's items and pagination blocks in a ``ModelList``."""
+    data = response.data if isinstance(response.data, dict) else {}
+    return ModelList(
+        items=data.get("data") or [],
+        meta=data.get("meta"),
+        links=data.get("links"),
+    )
+
+
+def items_of(
+    response: APIResponse, model_class: Optional[type] = None, trusted: bool = False
+) -> list:
+    """Return a list response's items, as ``model_class`` instances if given."""
+    items = page_of(response).items
+    if model_class is None:
+        return items
+    return parse_models(items, model_class, trusted=trusted)
+
+
+def has_next_page(page: ModelList) -> bool:
+    """
+    Whether another page follows ``page``.
+
+    ``links.next`` is authoritative when present; otherwise ``meta.last_page``
+    is used, and as a last resort a full page is assumed to have a successor.
+    """
+    if not page.items:
+        return False
+    if "next" in page.links:
+        return bool(page.links["next"])
+    if "last_page" in page.meta:
+        return page.has_more_pages
+    return "per_page" in page.meta and len(page.items) >= page.per_page
+
+
+def _start_page(request: PydanticBaseModel) -> int:
+    """Page number a request starts from."""
+    page = getattr(request, "page", None)
+    if page is None:
+        page = getattr(getattr(request, "query_params", None), "page", None)
+    return page or 1
+
+
+def known_last_page(page: ModelList) -> Optional[int]:
+    """Return ``meta.last_page`` when the response reports it."""
+    last_page = page.meta.get("last_page")
+    return last_page if isinstance(last_page, int) else None
+
+
+class Paginator:
+    """
+    Iterate lazily over every item of a paginated list endpoint.
+
+    Only the current page (and, with ``prefetch``, the next one) is held in
+    memory. Iterating the paginator yields raw items, or ``model_class``
+    instances when one is given; ``pages()`` yields the ``APIResponse`` of
+    each page.
+
+    When the first response reports ``meta.last_page`` and ``max_in_flight``
+    is greater than one, the remaining pages are fetched concurrently, with
+    at most ``max_in_flight`` requests outstanding. Pages are still yielded
+    in order.
+    """
+
+    def __init__(
+        self,
+        list_method: Callable[..., APIResponse],
+        request: Optional[PydanticBaseModel] = None,
+        prefetch: bool = True,
+        max_in_flight: int = 1,
+        model_class: Optional[type] = None,
+        trusted: bool = False,
+    ):
+        """
+        Initialize the paginator.
+
+        Args:
+            list_method: Bound ``list_*`` resource method
+            request: List request for the first page (defaults are used if omitted)
+            prefetch: Fetch the next page in the background while the current
+                     one is being consumed
+            max_in_flight: Maximum number of pages fetched concurrently once the
+                     last page is known
+            model_class: Model to build each item as (raw dicts if omitted)
+            trusted: Build items without validating the API data
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        self.list_method = list_method
+        self.request = request if request is not None else default_request(list_method)
+        self.prefetch = prefetch
+        self.max_in_flight = max_in_flight
+        self.model_class = model_class
+        self.trusted = trusted
+
+    def __iter__(self) -> Iterator[Any]:
+        for response in self.pages():
+            yield from items_of(response, self.model_class, self.trusted)
+
+    def pages(self) -> Iterator[APIResponse]:
+        """Yield the response of every page, in order."""
+        page_number = _start_page(self.request)
+        response = self._fetch(page_number)
+
+        workers = self.max_in_flight if self.max_in_flight > 1 else int(self.prefetch)
+        if not workers:
+            yield from self._sequential(response, page_number, None)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            last_page = known_last_page(page_of(response))
+            if self.max_in_flight > 1 and last_page is not None:
+                yield from self._fan_out(response, page_number, last_page, executor)
+            else:
+                yield from self._sequential(response, page_number, executor)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _sequential(
+        self,
+        response: APIResponse,
+        page_number: int,
+        executor: Optional[ThreadPoolExecutor],
+    ) -> Iterator[APIResponse]:
+        """Follow pages one by one, prefetching the next one if possible."""
+        while True:
+            upcoming = None
+            has_next = has_next_page(page_of(response))
+            if has_next and executor is not None:
+                upcoming = executor.submit(
+                    copy_context().run, self._fetch, page_number + 1
+                )
+
+            yield response
+
+            if not has_next:
+                return
+            page_number += 1
+            if upcoming is not None:
+                response = upcoming.result()
+            else:
+                response = self._fetch(page_number)
+
+    def _fan_out(
+        self,
+        response: APIResponse,
+        page_number: int,
+        last_page: int,
+        executor: ThreadPoolExecutor,
+    ) -> Iterator[APIResponse]:
+        """Fetch the pages after ``page_number`` concurrently, yielding in order."""
+        window: Deque[Future] = deque()
+        next_page = page_number + 1
+
+        def fill() -> None:
+            nonlocal next_page
+            while next_page <= last_page and len(window) < self.max_in_flight:
+                window.append(
+                    executor.submit(copy_context().run, self._fetch, next_page)
+                )
+                next_page += 1
+
+        fill()
+        yield response
+
+        while window:
+            response = window.popleft().result()
+            fill()
+            yield response
+
+    def _fetch(self, page_number: int) -> APIResponse:
+        """Fetch a single page."""
+        return self.list_method(with_page(self.request, page_number))
+
+
+class AsyncPaginator:
+    """
+    Asyncio counterpart of ``Paginator`` for ``AsyncMailerSendClient``.
+
+    Examples:
+        >>> async for recipient in client.recipients.paginate("list_recipients"):
+        ...     await export(recipient)
+    """
+
+    def __init__(
+        self,
+        list_method: Callable[..., Awaitable[APIResponse]],
+        request: Optional[PydanticBaseModel] = None,
+        prefetch: bool = True,
+        max_in_flight: int = 1,
+        model_class: Optional[type] = None,
+        trusted: bool = False,
+    ):
+        """
+        Initialize the paginator.
+
+        Args:
+            list_method: Awaitable ``list_*`` resource method
+            request: List request for the first page (defaults are used if omitted)
+            prefetch: Fetch the next page concurrently with consuming the current one
+            max_in_flight: Maximum number of pages fetched concurrently once the
+                     last page is known
+            model_class: Model to build each item as (raw dicts if omitted)
+            trusted: Build items without validating the API data
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        self.list_method = list_method
+        self.request = request if request is not None else default_request(list_method)
+        self.prefetch = prefetch
+        self.max_in_flight = max_in_flight
+        self.model_class = model_class
+        self.trusted = trusted
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._items()
+
+    async def _items(self) -> AsyncIterator[Any]:
+        async for response in self.pages():
+            for item in items_of(response, self.model_class, self.trusted):
+                yield item
+
+    async def pages(self) -> AsyncIterator[APIResponse]:
+        """Yield the response of every page, in order."""
+        page_number = _start_page(self.request)
+        response = await self._fetch(page_number)
+
+        last_page = known_last_page(page_of(response))
+        if self.max_in_flight > 1 and last_page is not None:
+            pages = self._fan_out(response, page_number, last_page)
+        else:
+            pages = self._sequential(response, page_number)
+
+        async for page in pages:
+            yield page
+
+    async def _sequential(
+        self, response: APIResponse, page_number: int
+    ) -> AsyncIterator[APIResponse]:
+        """Follow pages one by one, prefetching the next one if enabled."""
+        upcoming = None
+        try:
+            while True:
+                has_next = has_next_page(page_of(response))
+                if has_next and self.prefetch:
+                    upcoming = asyncio.ensure_future(self._fetch(page_number + 1))
+
+                yield response
+
+                if not has_next:
+                    return
+                page_number += 1
+                if upcoming is not None:
+                    response, upcoming = await upcoming, None
+                else:
+                    response = await self._fetch(page_number)
+        finally:
+            if upcoming is not None:
+                upcoming.cancel()
+
+    async def _fan_out(
+        self, response: APIResponse, page_number: int, last_page: int
+    ) -> AsyncIterator[APIResponse]:
+        """Fetch the pages after ``page_number`` concurrently, yielding in order."""
+        window: Deque[asyncio.Future] = deque()
+        next_page = page_number + 1
+
+        def fill() -> None:
+            nonlocal next_page
+            while next_page <= last_page and len(window) < self.max_in_flight:
+                window.append(asyncio.ensure_future(self._fetch(next_page)))
+                next_page += 1
+
+        try:
+            fill()
+            yield response
+
+            while window:
+                response = await window.popleft()
+                fill()
+                yield response
+        finally:
+            for upcoming in window:
+                upcoming.cancel()
+
+    async def _fetch(self, page_number: int) -> APIResponse:
+        """Fetch a single page."""
+        return await self.list_method(with_page(self.request, page_number))
+
+
+def paginate(
+    list_method: Callable[..., APIResponse],
+    request: Optional[PydanticBaseModel] = None,
+    prefetch: bool = True,
+    max_in_flight: int = 1,
+    model_class: Optional[type] = None,
+    trusted: bool = False,
+) -> Paginator:
+    """
+    Iterate lazily over every item returned by a ``list_*`` method.
+
+    Args:
+        list_method: Bound ``list_*`` resource method
+        request: List request for the first page
+        prefetch: Fetch the next page in the background
+        max_in_flight: Maximum number of pages fetched concurrently once the
+                 last page is known
+        model_class: Model to build each item as (raw dicts if omitted)
+        trusted: Build items without validating the API data
+
+    Returns:
+        A Paginator yielding items across all pages
+    """
+    return Paginator(
+        list_method,
+        request,
+        prefetch=prefetch,
+        max_in_flight=max_in_flight,
+        model_class=model_class,
+        trusted=trusted,
+    )
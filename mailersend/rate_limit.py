@@ -0,0 +1,334 @@
+"""
+Client-side rate limiting.
+
+``RateLimiter`` is a token bucket shared by every request a client makes.
+Tokens refill at a steady rate up to a burst capacity; each request takes
+one token and waits when none is left. The bucket also learns from the
+rate-limit headers MailerSend returns, so callers slow down before the API
+starts answering with ``429 Too Many Requests``:
+
+* ``x-ratelimit-remaining`` caps the tokens currently available.
+* ``x-apiquota-remaining`` / ``x-apiquota-reset`` hold requests back until
+  the quota resets once it is used up.
+* ``Retry-After`` on a 429 response pauses all requests for that long.
+
+The bucket state lives in a backend. ``LocalBackend`` (the default) keeps
+it in memory for the threads of one process; ``FileBackend`` keeps it in a
+small file guarded by ``fcntl`` locks, so every worker process on a host
+draws from one budget and learns from every response.
+
+Examples:
+    >>> limiter = RateLimiter(rate=1, burst=10)
+    >>> client = MailerSendClient(rate_limiter=limiter)
+
+    >>> # Share the budget between all gunicorn/celery workers on the host
+    >>> limiter = RateLimiter(backend=FileBackend("/tmp/mailersend.bucket"))
+
+    >>> # Fail fast instead of queueing for long periods
+    >>> client = MailerSendClient(rate_limiter=RateLimiter(max_wait=5))
+"""
+
+import os
+import struct
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, ContextManager, Dict, Iterator, Mapping, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+from .constants import RATE_LIMIT_BURST, RATE_LIMIT_PER_SECOND
+from .exceptions import RateLimitExceeded
+from .utils.headers import parse_int_header
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header into seconds from now.
+
+    Both forms allowed by RFC 9110 are accepted: a number of seconds and an
+    HTTP date.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _seconds_until(value: Optional[str]) -> Optional[float]:
+    """Seconds until an ISO 8601 timestamp such as ``x-apiquota-reset``."""
+    if not value:
+        return None
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class BucketState:
+    """Mutable token bucket state handed out by a backend."""
+
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: Optional[float] = None, updated: float = 0.0):
+        # ``tokens`` is None until the limiter initializes a fresh bucket
+        self.tokens = tokens
+        self.updated = updated
+
+
+class RateLimitBackend:
+    """
+    Storage for the state of a ``RateLimiter``.
+
+    Subclasses provide ``locked()``, a context manager that yields the
+    ``BucketState`` with exclusive access and persists changes made to it
+    when the block exits.
+    """
+
+    def locked(self) -> ContextManager[BucketState]:
+        raise NotImplementedError
+
+
+class LocalBackend(RateLimitBackend):
+    """Bucket state shared by the threads of a single process."""
+
+    def __init__(self):
+        self._state = BucketState()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def locked(self) -> Iterator[BucketState]:
+        """Hold exclusive access to the bucket state."""
+        with self._lock:
+            yield self._state
+
+
+class FileBackend(RateLimitBackend):
+    """
+    Bucket state shared by every process on a host through a lock file.
+
+    The state is two doubles stored in ``path``; each access takes an
+    exclusive ``fcntl.flock`` on the file, so the critical section is a
+    16-byte read and write. Timestamps come from ``time.monotonic``: every
+    process on one host reads the same clock, but it restarts at boot and
+    differs between hosts. A state file written before a reboot is treated
+    as a full bucket, and the file must not be shared between hosts.
+    """
+
+    _FORMAT = struct.Struct("<dd")
+
+    def __init__(self, path: str):
+        """
+        Initialize the backend.
+
+        Args:
+            path: File holding the shared state (created if missing)
+
+        Raises:
+            RuntimeError: If file locking is not supported on this platform
+        """
+        if fcntl is None:
+            raise RuntimeError("FileBackend requires fcntl, which is unavailable")
+
+        self.path = path
+        self._fd: Optional[int] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        backend = weakref.ref(self)
+        os.register_at_fork(after_in_child=lambda: FileBackend._after_fork(backend))
+
+    @contextmanager
+    def locked(self) -> Iterator[BucketState]:
+        """Hold exclusive access to the bucket state."""
+        with self._lock:
+            fd = self._open()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                raw = os.pread(fd, self._FORMAT.size, 0)
+                state = BucketState()
+                if len(raw) == self._FORMAT.size:
+                    state.tokens, state.updated = self._FORMAT.unpack(raw)
+
+                yield state
+
+                if state.tokens is not None:
+                    os.pwrite(fd, self._FORMAT.pack(state.tokens, state.updated), 0)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """Close the state file of this process."""
+        with self._lock:
+            if self._fd is not None and self._pid == os.getpid():
+                os.close(self._fd)
+            self._fd = None
+            self._pid = None
+
+    def _open(self) -> int:
+        """Open the state file once per process. Caller holds the lock."""
+        # A descriptor inherited across fork() shares its flock with the
+        # parent, which would let both processes in at once
+        if self._pid != os.getpid():
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            self._pid = os.getpid()
+        return self._fd
+
+    @staticmethod
+    def _after_fork(backend: "weakref.ref[FileBackend]") -> None:
+        """Reset the thread lock in a forked child; the parent may have held it."""
+        self = backend()
+        if self is not None:
+            self._lock = threading.Lock()
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that paces requests ahead of the API limits.
+
+    ``reserve()`` takes a token and returns how long the caller has to wait
+    before sending, which lets both the synchronous and the asyncio client
+    sleep in their own way; ``acquire()`` does the waiting itself. Tokens may
+    go negative: concurrent callers queue up behind each other instead of
+    all waking at the same instant.
+    """
+
+    def __init__(
+        self,
+        rate: float = RATE_LIMIT_PER_SECOND,
+        burst: int = RATE_LIMIT_BURST,
+        max_wait: Optional[float] = None,
+        backend: Optional[RateLimitBackend] = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens the bucket holds
+            max_wait: Raise RateLimitExceeded instead of waiting longer than
+                     this many seconds (None waits as long as needed)
+            backend: Where the bucket state lives; ``LocalBackend`` by default.
+                     Every process sharing a ``FileBackend`` path should use
+                     the same rate and burst
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self.max_wait = max_wait
+        self.backend = backend or LocalBackend()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available (negative while callers are queued)."""
+        with self.backend.locked() as state:
+            self._refill(state)
+            return state.tokens
+
+    def reserve(self) -> float:
+        """
+        Take a token and return the delay before the request may be sent.
+
+        Raises:
+            RateLimitExceeded: If the delay would exceed ``max_wait``; no
+                              token is taken in that case
+        """
+        with self.backend.locked() as state:
+            self._refill(state)
+            delay = max(0.0, (1 - state.tokens) / self.rate)
+            if self.max_wait is not None and delay > self.max_wait:
+                raise RateLimitExceeded(
+                    f"Client-side rate limit: request would wait {delay:.1f}s, "
+                    f"more than max_wait={self.max_wait}s"
+                )
+            state.tokens -= 1
+            return delay
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def update(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """
+        Adjust the bucket to the limits reported by a response.
+
+        Args:
+            status_code: HTTP status code of the response
+            headers: Response headers (case-insensitive mapping)
+        """
+        pause = None
+        if status_code == 429:
+            pause = parse_retry_after(headers.get("retry-after"))
+
+        quota_remaining = parse_int_header(headers, "x-apiquota-remaining")
+        if quota_remaining is not None and quota_remaining <= 0:
+            reset_in = _seconds_until(headers.get("x-apiquota-reset"))
+            if reset_in is not None:
+                pause = max(pause or 0.0, reset_in)
+
+        remaining = parse_int_header(headers, "x-ratelimit-remaining")
+
+        with self.backend.locked() as state:
+            self._refill(state)
+            if remaining is not None:
+                state.tokens = min(state.tokens, float(remaining))
+            if pause is not None:
+                # The next token becomes available once the pause is over
+                state.tokens = min(state.tokens, 1 - pause * self.rate)
+            elif status_code == 429:
+                state.tokens = min(state.tokens, 0.0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current limiter settings and state, for debugging."""
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "max_wait": self.max_wait,
+            "backend": type(self.backend).__name__,
+            "tokens": round(self.tokens, 3),
+        }
+
+    def _refill(self, state: BucketState) -> None:
+        """Add the tokens accrued since the last update. Caller holds the lock."""
+        now = time.monotonic()
+        if state.tokens is None:
+            state.tokens, state.updated = float(self.burst), now
+            return
+
+        elapsed = now - state.updated
+        if elapsed < 0:
+            # The clock restarted since the state was saved (a reboot, with
+            # a FileBackend), so its timestamp says nothing about the bucket
+            state.tokens, state.updated = float(self.burst), now
+        elif elapsed > 0:
+            state.tokens = min(float(self.burst), state.tokens + elapsed * self.rate)
+            state.updated = now
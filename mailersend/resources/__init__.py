@@ -2,30 +2,36 @@
 API resource classes for interacting with specific MailerSend API endpoints.
 """
 
-from .base import BaseResource
-from .email import Email
-from .activity import Activity
-from .analytics import Analytics
-from .domains import Domains
-from .identities import IdentitiesResource
-from .inbound import InboundResource
-from .messages import Messages
-from .schedules import Schedules
-from .recipients import Recipients
-from .templates import Templates
-from .tokens import Tokens
-from .webhooks import Webhooks
-from .email_verification import EmailVerification
-from .users import Users
-from .sms_messages import SmsMessages
-from .sms_numbers import SmsNumbers
-from .sms_activity import SmsActivity
-from .sms_sending import SmsSending
-from .sms_recipients import SmsRecipients
-from .sms_webhooks import SmsWebhooks
-from .sms_inbounds import SmsInbounds
-from .other import Other
-from .dmarc_monitoring import DmarcMonitoring
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import BaseResource
+    from .email import Email
+    from .activity import Activity
+    from .analytics import Analytics
+    from .domains import Domains
+    from .identities import IdentitiesResource
+    from .inbound import InboundResource
+    from .messages import Messages
+    from .schedules import Schedules
+    from .recipients import Recipients
+    from .templates import Templates
+    from .tokens import Tokens
+    from .webhooks import Webhooks
+    from .email_verification import EmailVerification
+    from .users import Users
+    from .sms_messages import SmsMessages
+    from .sms_numbers import SmsNumbers
+    from .sms_activity import SmsActivity
+    from .sms_sending import SmsSending
+    from .sms_recipients import SmsRecipients
+    from .sms_webhooks import SmsWebhooks
+    from .sms_inbounds import SmsInbounds
+    from .smtp_users import SmtpUsers
+    from .other import Other
+    from .dmarc_monitoring import DmarcMonitoring
 
 __all__ = [
     "BaseResource",
@@ -50,6 +56,38 @@ __all__ = [
     "SmsRecipients",
     "SmsWebhooks",
     "SmsInbounds",
+    "SmtpUsers",
     "Other",
     "DmarcMonitoring",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".base": ("BaseResource",),
+        ".email": ("Email",),
+        ".activity": ("Activity",),
+        ".analytics": ("Analytics",),
+        ".domains": ("Domains",),
+        ".identities": ("IdentitiesResource",),
+        ".inbound": ("InboundResource",),
+        ".messages": ("Messages",),
+        ".schedules": ("Schedules",),
+        ".recipients": ("Recipients",),
+        ".templates": ("Templates",),
+        ".tokens": ("Tokens",),
+        ".webhooks": ("Webhooks",),
+        ".email_verification": ("EmailVerification",),
+        ".users": ("Users",),
+        ".sms_messages": ("SmsMessages",),
+        ".sms_numbers": ("SmsNumbers",),
+        ".sms_activity": ("SmsActivity",),
+        ".sms_sending": ("SmsSending",),
+        ".sms_recipients": ("SmsRecipients",),
+        ".sms_webhooks": ("SmsWebhooks",),
+        ".sms_inbounds": ("SmsInbounds",),
+        ".smtp_users": ("SmtpUsers",),
+        ".other": ("Other",),
+        ".dmarc_monitoring": ("DmarcMonitoring",),
+    },
+)
@@ -1,15 +1,87 @@
 """Activity resource"""
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
 from .base import BaseResource
-from ..models.activity import ActivityRequest, SingleActivityRequest
+from ..constants import ACTIVITY_MAX_RANGE_SECONDS
+from ..models.activity import (
+    Activity as ActivityModel,
+    ActivityQueryParams,
+    ActivityRequest,
+    SingleActivityRequest,
+)
 from ..models.base import APIResponse
 
 
+def export_windows(
+    date_from: int, date_to: int, window: int = ACTIVITY_MAX_RANGE_SECONDS
+) -> List[Tuple[int, int]]:
+    """
+    Split a date range into consecutive windows the activity endpoint accepts.
+
+    Args:
+        date_from: Start of the range (Unix timestamp)
+        date_to: End of the range (Unix timestamp)
+        window: Maximum window length in seconds
+
+    Returns:
+        List of (date_from, date_to) pairs covering the whole range
+    """
+    if date_to <= date_from:
+        raise ValueError("date_to must be greater than date_from")
+    if not 0 < window <= ACTIVITY_MAX_RANGE_SECONDS:
+        raise ValueError(
+            f"window must be between 1 and {ACTIVITY_MAX_RANGE_SECONDS} seconds"
+        )
+
+    windows = []
+    start = date_from
+    while start < date_to:
+        end = min(start + window, date_to)
+        windows.append((start, end))
+        start = end
+    return windows
+
+
+def ordered_unique(
+    records: List[Dict[str, Any]], seen: Set[str]
+) -> Tuple[List[Dict[str, Any]], Set[str]]:
+    """
+    Sort one window's records by timestamp and drop those already yielded.
+
+    Windows share their boundary second, so only the previous window's IDs
+    need to be remembered. A record repeated within the window, e.g. when
+    it moved between pages while the window was read, is kept once.
+
+    Args:
+        records: Activity records of one window
+        seen: IDs of the previous window's records
+
+    Returns:
+        The ordered new records and the IDs to remember for the next window
+    """
+    records = sorted(records, key=lambda record: record.get("created_at") or "")
+    fresh = []
+    window = set()
+    for record in records:
+        record_id = record.get("id")
+        if record_id not in seen and record_id not in window:
+            fresh.append(record)
+        window.add(record_id)
+    return fresh, window
+
+
 class Activity(BaseResource):
     """
     Client for interacting with the MailerSend Activity API.
     """
 
+    # Responses convert to Activity models with ``response.as_models()``
+    MODEL_CLASS = ActivityModel
+
     def get(self, request: ActivityRequest) -> APIResponse:
         """
         Get activity data for a domain.
@@ -52,3 +124,89 @@ class Activity(BaseResource):
         )
 
         return self._create_response(response)
+
+    def export(
+        self,
+        domain_id: str,
+        date_from: int,
+        date_to: int,
+        events: Optional[Iterable[str]] = None,
+        limit: int = 100,
+        max_in_flight: int = 4,
+        window: int = ACTIVITY_MAX_RANGE_SECONDS,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream every activity record of a domain over an arbitrary date range.
+
+        The range is split into windows the API accepts (at most 7 days each).
+        Up to ``max_in_flight`` windows are paged concurrently. Records are
+        yielded in timestamp order, with duplicates from overlapping window
+        boundaries removed. Each window is buffered in memory while it is
+        sorted, so use a smaller ``window`` for very busy domains.
+
+        Args:
+            domain_id: Domain to export activity for
+            date_from: Start of the range (Unix timestamp)
+            date_to: End of the range (Unix timestamp)
+            events: Optional activity types to include
+            limit: Records per page (10-100)
+            max_in_flight: Maximum number of windows fetched concurrently
+            window: Window length in seconds (at most 7 days)
+
+        Yields:
+            Activity records as returned by the API
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        # Read events once, so an iterator filters every window, not the first
+        events = list(events) if events is not None else None
+        requests = [
+            self._export_request(domain_id, start, end, events, limit)
+            for start, end in export_windows(date_from, date_to, window)
+        ]
+        self.logger.debug(
+            "Exporting activity for domain %s in %d windows", domain_id, len(requests)
+        )
+
+        executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        pending: Deque[Future] = deque()
+        seen: Set[str] = set()
+        try:
+            for request in requests:
+                pending.append(
+                    executor.submit(copy_context().run, self._export_window, request)
+                )
+                if len(pending) < max_in_flight:
+                    continue
+                records, seen = ordered_unique(pending.popleft().result(), seen)
+                yield from records
+
+            while pending:
+                records, seen = ordered_unique(pending.popleft().result(), seen)
+                yield from records
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _export_request(
+        domain_id: str,
+        date_from: int,
+        date_to: int,
+        events: Optional[List[str]],
+        limit: int,
+    ) -> ActivityRequest:
+        """Build the first-page request of one export window."""
+        return ActivityRequest(
+            domain_id=domain_id,
+            query_params=ActivityQueryParams(
+                date_from=date_from,
+                date_to=date_to,
+                limit=limit,
+                event=events or None,
+            ),
+        )
+
+    def _export_window(self, request: ActivityRequest) -> List[Dict[str, Any]]:
+        """Fetch every record of one export window."""
+        return list(self.paginate(self.get, request))
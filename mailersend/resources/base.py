@@ -1,7 +1,11 @@
 import logging
-from typing import Dict, Any, Optional, Union, List, TypeVar, Type, ClassVar
-from ..models.base import BaseModel, ModelList, APIResponse
+from typing import Dict, Any, Optional, Union, List, TypeVar, Type, ClassVar, Callable
+from ..models.base import BaseModel, ModelList, APIResponse, parse_models
+from ..constants import IDEMPOTENCY_HEADER
 from ..logging import get_logger
+from ..pagination import Paginator
+from ..serialization import response_json
+from ..utils.headers import parse_int_header
 import requests
 
 T = TypeVar("T", bound=BaseModel)
@@ -12,6 +16,8 @@ class BaseResource:
 
     BASE_API_URL: ClassVar[str] = ""
     MODEL_CLASS: ClassVar[Type[BaseModel]] = BaseModel
+    # Item models of methods whose responses differ from MODEL_CLASS
+    METHOD_MODELS: ClassVar[Dict[str, Type[BaseModel]]] = {}
 
     def __init__(self, client, logger: Optional[logging.Logger] = None):
         """
@@ -23,26 +29,91 @@ class BaseResource:
         self.client = client
         self.logger = logger or get_logger()
 
+    def paginate(
+        self,
+        list_method: Union[str, Callable[..., APIResponse]],
+        request: Optional[BaseModel] = None,
+        prefetch: bool = True,
+        max_in_flight: int = 1,
+        model_class: Optional[Type[BaseModel]] = None,
+        trusted: Optional[bool] = None,
+    ) -> Paginator:
+        """
+        Iterate lazily over every item of one of this resource's list methods.
+
+        Args:
+            list_method: Name of a ``list_*`` method (e.g. ``"list_recipients"``)
+                        or the bound method itself
+            request: List request for the first page (defaults are used if omitted)
+            prefetch: Fetch the next page in the background
+            max_in_flight: Maximum number of pages fetched concurrently once the
+                          last page is known
+            model_class: Model to build each item as (raw dicts if omitted)
+            trusted: Build items without validation (defaults to the client's
+                    ``trust_server_data`` setting)
+
+        Returns:
+            Paginator yielding items across all pages
+
+        Examples:
+            >>> for entry in client.recipients.paginate("list_blocklist"):
+            ...     print(entry["pattern"])
+
+            >>> for activity in client.activities.paginate(
+            ...     "get", request, model_class=Activity, trusted=True
+            ... ):
+            ...     print(activity.email.recipient.email)
+        """
+        if isinstance(list_method, str):
+            list_method = getattr(self, list_method)
+        if trusted is None:
+            trusted = self._trust_server_data()
+        return Paginator(
+            list_method,
+            request,
+            prefetch=prefetch,
+            max_in_flight=max_in_flight,
+            model_class=model_class,
+            trusted=trusted,
+        )
+
     def _create_response(
-        self, response: requests.Response, data: Any = None
+        self,
+        response: requests.Response,
+        data: Any = None,
+        method: Optional[str] = None,
     ) -> APIResponse:
         """
         Create unified APIResponse object from HTTP response.
 
+        The JSON body is decoded on first access to ``APIResponse.data``.
+
         Args:
             response: The HTTP response object
-            data: Optional custom data to include (if None, uses response.json())
+            data: Optional custom data to include (if None, the JSON body is used)
+            method: Name of the resource method, selecting its model from
+                   ``METHOD_MODELS``
 
         Returns:
             APIResponse object with data, headers, and metadata
         """
+        content = None
         if data is None:
-            try:
-                data = response.json() if response.content else {}
-            except Exception:
-                # If JSON parsing fails, use empty dict
+            content = response.content
+            if not content:
                 data = {}
-
+            elif not isinstance(content, (bytes, bytearray)):
+                # Not a raw body; let the response decode itself
+                content = None
+                try:
+                    data = response_json(response)
+                except Exception:
+                    # If JSON parsing fails, use empty dict
+                    data = {}
+
+        model_class = self.METHOD_MODELS.get(method, self.MODEL_CLASS)
+        if model_class is BaseModel:
+            model_class = None
         return APIResponse(
             data=data,
             headers=dict(response.headers),
@@ -51,8 +122,19 @@ class BaseResource:
             rate_limit_remaining=self._parse_int_header(
                 response, "x-apiquota-remaining"
             ),
+            content=content,
+            model_class=model_class,
+            trusted=self._trust_server_data(),
         )
 
+    def _idempotency_headers(
+        self, idempotency_key: Optional[str]
+    ) -> Optional[Dict[str, str]]:
+        """Request headers carrying a caller-supplied idempotency key."""
+        if idempotency_key is None:
+            return None
+        return {IDEMPOTENCY_HEADER: idempotency_key}
+
     def _parse_int_header(
         self, response: requests.Response, header: str
     ) -> Optional[int]:
@@ -66,16 +148,13 @@ class BaseResource:
         Returns:
             Integer value or None if parsing fails
         """
-        value = response.headers.get(header)
-        if value:
-            try:
-                return int(value)
-            except ValueError:
-                pass
-        return None
+        return parse_int_header(response.headers, header)
 
     def _process_response(
-        self, response_data: Dict[str, Any], model_class: Optional[Type[T]] = None
+        self,
+        response_data: Dict[str, Any],
+        model_class: Optional[Type[T]] = None,
+        trusted: Optional[bool] = None,
     ) -> Union[T, ModelList[T], Dict[str, Any]]:
         """
         Process the API response data into model instances.
@@ -83,6 +162,8 @@ class BaseResource:
         Args:
             response_data: The raw API response data
             model_class: The model class to use for conversion
+            trusted: Build models without validation (defaults to the
+                    client's ``trust_server_data`` setting)
 
         Returns:
             Processed model instance(s) or raw data
@@ -92,21 +173,10 @@ class BaseResource:
         if not cls:
             return response_data
 
-        # Handle pagination results
-        if isinstance(response_data, dict) and "data" in response_data:
-            items = [cls(**item) for item in response_data["data"]]
-            return ModelList(
-                items=items,
-                meta=response_data.get("meta", {}),
-                links=response_data.get("links", {}),
-            )
-
-        # Handle single item
-        if isinstance(response_data, dict):
-            return cls(**response_data)
-
-        # Handle list of items
-        if isinstance(response_data, list):
-            return [cls(**item) for item in response_data]
+        if trusted is None:
+            trusted = self._trust_server_data()
+        return parse_models(response_data, cls, trusted=trusted)
 
-        return response_data
+    def _trust_server_data(self) -> bool:
+        """Whether the client builds response models without validation."""
+        return getattr(self.client, "trust_server_data", False) is True
@@ -1,10 +1,66 @@
 """Email resource"""
 
-from typing import List
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .base import BaseResource
 from ..models.email import EmailRequest
 from ..models.base import APIResponse
+from ..serialization import model_body, models_body_array
+
+
+class EmailSendResult:
+    """Outcome of one email sent through ``Email.send_many``."""
+
+    __slots__ = ("index", "email", "response", "error")
+
+    def __init__(
+        self,
+        index: int,
+        email: EmailRequest,
+        response: Optional[APIResponse] = None,
+        error: Optional[BaseException] = None,
+    ):
+        self.index = index
+        self.email = email
+        self.response = response
+        self.error = error
+
+    @property
+    def success(self) -> bool:
+        """Whether the API accepted the email."""
+        return self.error is None
+
+    @property
+    def message_id(self) -> Optional[str]:
+        """The ``x-message-id`` of the accepted email."""
+        if self.response is None:
+            return None
+        return self.response.get("id")
+
+    def __repr__(self) -> str:
+        return (
+            f"EmailSendResult(index={self.index}, message_id={self.message_id!r}, "
+            f"error={self.error!r})"
+        )
+
+
+def completed_sends(
+    done: Iterable[Any], pending: Dict[Any, Tuple[int, EmailRequest]]
+) -> Iterator[EmailSendResult]:
+    """
+    Turn finished send futures into results, removing them from ``pending``.
+
+    Works with both ``concurrent.futures`` and ``asyncio`` futures.
+    """
+    for future in done:
+        index, email = pending.pop(future)
+        error = future.exception()
+        if error is None:
+            yield EmailSendResult(index, email, response=future.result())
+        else:
+            yield EmailSendResult(index, email, error=error)
 
 
 class Email(BaseResource):
@@ -12,12 +68,16 @@ class Email(BaseResource):
     Client for interacting with the MailerSend Email API.
     """
 
-    def send(self, email: EmailRequest) -> APIResponse:
+    def send(
+        self, email: EmailRequest, idempotency_key: Optional[str] = None
+    ) -> APIResponse:
         """
         Send a single email.
 
         Args:
             email: A fully-validated EmailRequest object
+            idempotency_key: Key identifying this send (derived from the
+                            email content if omitted)
 
         Returns:
             APIResponse with email ID and metadata
@@ -25,40 +85,101 @@ class Email(BaseResource):
         """
         self.logger.debug("Preparing to send email")
 
-        payload = email.model_dump(by_alias=True, exclude_none=True)
+        # Serialized straight to JSON bytes, without an intermediate dict;
+        # attached files are streamed into the body while it is sent
+        payload = model_body(email)
 
         self.logger.debug("Sending email request to MailerSend API")
         self.logger.debug("Payload: %s", payload)
 
-        response = self.client.request(method="POST", path="email", body=payload)
+        response = self.client.request(
+            method="POST",
+            path="email",
+            body=payload,
+            headers=self._idempotency_headers(idempotency_key),
+        )
 
         # Create custom data with email ID from headers
         email_data = {"id": response.headers.get("x-message-id")}
 
         return self._create_response(response, email_data)
 
-    def send_bulk(self, emails: List[EmailRequest]) -> APIResponse:
+    def send_many(
+        self, emails: Iterable[EmailRequest], max_in_flight: int = 8
+    ) -> Iterator[EmailSendResult]:
+        """
+        Send emails one request each, with up to ``max_in_flight`` in flight.
+
+        Unlike ``send_bulk``, every email gets its ``x-message-id`` right
+        away. Requests share the client's connection pool (size
+        ``pool_maxsize`` to at least ``max_in_flight``) and go through its
+        rate limiter and retry policy. Emails are read lazily from
+        ``emails``, and a failed send is reported in its result instead of
+        stopping the others.
+
+        Args:
+            emails: Any iterable of EmailRequest objects
+            max_in_flight: Maximum number of requests outstanding at once
+
+        Yields:
+            EmailSendResult for every email, in completion order; ``index``
+            is the email's position in ``emails``
+
+        Examples:
+            >>> for result in client.emails.send_many(emails, max_in_flight=8):
+            ...     if result.success:
+            ...         store(result.index, result.message_id)
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        pending: Dict[Future, Tuple[int, EmailRequest]] = {}
+        try:
+            for index, email in enumerate(emails):
+                if len(pending) >= max_in_flight:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from completed_sends(done, pending)
+                # Each send runs in a copy of the caller's context, so an
+                # enclosing retry_budget block applies to it
+                future = executor.submit(copy_context().run, self.send, email)
+                pending[future] = (index, email)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from completed_sends(done, pending)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def send_bulk(
+        self, emails: List[EmailRequest], idempotency_key: Optional[str] = None
+    ) -> APIResponse:
         """
         Send multiple emails in one request.
 
         Args:
             emails: List of EmailRequest objects to send
+            idempotency_key: Key identifying this bulk request (derived from
+                            the emails if omitted)
 
         Returns:
             APIResponse with bulk email information and metadata
         """
         self.logger.debug("Preparing to send emails in bulk")
 
-        payload = []
-        for email in emails:
-            # Prepare payload for each email
-            email_payload = email.model_dump(by_alias=True, exclude_none=True)
-            payload.append(email_payload)
+        # Serialized straight to JSON bytes, without intermediate dicts;
+        # attached files are streamed into the body while it is sent
+        payload = models_body_array(emails)
 
         self.logger.debug("Sending bulk email request to MailerSend API")
         self.logger.debug("Payload: %s", payload)
 
-        response = self.client.request(method="POST", path="bulk-email", body=payload)
+        response = self.client.request(
+            method="POST",
+            path="bulk-email",
+            body=payload,
+            headers=self._idempotency_headers(idempotency_key),
+        )
 
         return self._create_response(response)
 
@@ -3,13 +3,22 @@ SMS Activity API resource.
 """
 
 from .base import BaseResource
-from ..models.sms_activity import SmsActivityListRequest, SmsMessageGetRequest
+from ..models.sms_activity import (
+    SmsActivity as SmsActivityModel,
+    SmsActivityListRequest,
+    SmsMessage,
+    SmsMessageGetRequest,
+)
 from ..models.base import APIResponse
 
 
 class SmsActivity(BaseResource):
     """Resource for SMS Activity API endpoints."""
 
+    # Responses convert to models with ``response.as_models()``
+    MODEL_CLASS = SmsActivityModel
+    METHOD_MODELS = {"get": SmsMessage}
+
     def list(self, request: SmsActivityListRequest) -> APIResponse:
         """
         Get a list of SMS activities.
@@ -52,4 +61,4 @@ class SmsActivity(BaseResource):
             method="GET", path=f"sms-messages/{request.sms_message_id}"
         )
 
-        return self._create_response(response)
+        return self._create_response(response, method="get")
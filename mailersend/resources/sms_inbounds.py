@@ -2,6 +2,7 @@
 
 from .base import BaseResource
 from ..models.sms_inbounds import (
+    SmsInbound,
     SmsInboundsListRequest,
     SmsInboundGetRequest,
     SmsInboundCreateRequest,
@@ -14,6 +15,9 @@ from ..models.base import APIResponse
 class SmsInbounds(BaseResource):
     """SMS Inbounds resource for MailerSend API."""
 
+    # Responses convert to SmsInbound models with ``response.as_models()``
+    MODEL_CLASS = SmsInbound
+
     def list_sms_inbounds(self, request: SmsInboundsListRequest) -> APIResponse:
         """List SMS inbound routes.
 
@@ -1,6 +1,7 @@
 """SMS Messages resource."""
 
 from .base import BaseResource
+from ..models.sms_activity import SmsMessage
 from ..models.sms_messages import SmsMessagesListRequest, SmsMessageGetRequest
 from ..models.base import APIResponse
 
@@ -8,6 +9,9 @@ from ..models.base import APIResponse
 class SmsMessages(BaseResource):
     """SMS Messages resource for MailerSend API."""
 
+    # Responses convert to SmsMessage models with ``response.as_models()``
+    MODEL_CLASS = SmsMessage
+
     def list_sms_messages(self, request: SmsMessagesListRequest) -> APIResponse:
         """
         List SMS messages.
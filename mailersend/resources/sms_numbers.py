@@ -2,6 +2,7 @@
 
 from .base import BaseResource
 from ..models.sms_numbers import (
+    SmsNumber,
     SmsNumbersListRequest,
     SmsNumberGetRequest,
     SmsNumberUpdateRequest,
@@ -15,6 +16,9 @@ class SmsNumbers(BaseResource):
     Client for interacting with the MailerSend SMS Phone Numbers API.
     """
 
+    # Responses convert to SmsNumber models with ``response.as_models()``
+    MODEL_CLASS = SmsNumber
+
     def list(self, request: SmsNumbersListRequest) -> APIResponse:
         """
         Get a list of SMS phone numbers.
@@ -2,6 +2,7 @@
 
 from .base import BaseResource
 from ..models.sms_recipients import (
+    SmsRecipient,
     SmsRecipientsListRequest,
     SmsRecipientGetRequest,
     SmsRecipientUpdateRequest,
@@ -12,6 +13,9 @@ from ..models.base import APIResponse
 class SmsRecipients(BaseResource):
     """SMS Recipients resource for MailerSend API."""
 
+    # Responses convert to SmsRecipient models with ``response.as_models()``
+    MODEL_CLASS = SmsRecipient
+
     def list_sms_recipients(self, request: SmsRecipientsListRequest) -> APIResponse:
         """
         List SMS recipients.
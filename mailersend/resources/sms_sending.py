@@ -1,5 +1,7 @@
 """SMS Sending resource"""
 
+from typing import Optional
+
 from .base import BaseResource
 from ..models.sms_sending import SmsSendRequest
 from ..models.base import APIResponse
@@ -10,12 +12,16 @@ class SmsSending(BaseResource):
     Client for interacting with the MailerSend SMS Sending API.
     """
 
-    def send(self, request: SmsSendRequest) -> APIResponse:
+    def send(
+        self, request: SmsSendRequest, idempotency_key: Optional[str] = None
+    ) -> APIResponse:
         """
         Send an SMS message.
 
         Args:
             request: SmsSendRequest with SMS details
+            idempotency_key: Key identifying this send (derived from the
+                            message content if omitted)
 
         Returns:
             APIResponse with SMS sending response and metadata
@@ -27,6 +33,11 @@ class SmsSending(BaseResource):
 
         self.logger.debug("SMS payload: %s", payload)
 
-        response = self.client.request(method="POST", path="sms", body=payload)
+        response = self.client.request(
+            method="POST",
+            path="sms",
+            body=payload,
+            headers=self._idempotency_headers(idempotency_key),
+        )
 
         return self._create_response(response)
@@ -2,6 +2,7 @@
 
 from .base import BaseResource
 from ..models.sms_webhooks import (
+    SmsWebhook,
     SmsWebhooksListRequest,
     SmsWebhookGetRequest,
     SmsWebhookCreateRequest,
@@ -14,6 +15,9 @@ from ..models.base import APIResponse
 class SmsWebhooks(BaseResource):
     """SMS Webhooks resource for MailerSend API."""
 
+    # Responses convert to SmsWebhook models with ``response.as_models()``
+    MODEL_CLASS = SmsWebhook
+
     def list_sms_webhooks(self, request: SmsWebhooksListRequest) -> APIResponse:
         """
         List SMS webhooks.
@@ -25,7 +25,9 @@ class Tokens(BaseResource):
             APIResponse: API response with tokens list data
         """
         self.logger.info(
-            f"Listing tokens with pagination: page={request.query_params.page}, limit={request.query_params.limit}"
+            "Listing tokens with pagination: page=%s, limit=%s",
+            request.query_params.page,
+            request.query_params.limit,
         )
 
         # Extract query parameters
@@ -3,6 +3,8 @@
 from .base import BaseResource
 from ..models.base import APIResponse
 from ..models.users import (
+    User,
+    UserInvite,
     UsersListRequest,
     UserGetRequest,
     UserInviteRequest,
@@ -18,6 +20,14 @@ from ..models.users import (
 class Users(BaseResource):
     """Users API resource."""
 
+    # Responses convert to models with ``response.as_models()``
+    MODEL_CLASS = User
+    METHOD_MODELS = {
+        "list_invites": UserInvite,
+        "get_invite": UserInvite,
+        "resend_invite": UserInvite,
+    }
+
     def list_users(self, request: UsersListRequest) -> APIResponse:
         """Get a list of account users.
 
@@ -140,7 +150,7 @@ class Users(BaseResource):
         response = self.client.request(method="GET", path="invites", params=params)
 
         # Create standardized response
-        return self._create_response(response)
+        return self._create_response(response, method="list_invites")
 
     def get_invite(self, request: InviteGetRequest) -> APIResponse:
         """Get a single invite.
@@ -159,7 +169,7 @@ class Users(BaseResource):
         )
 
         # Create standardized response
-        return self._create_response(response)
+        return self._create_response(response, method="get_invite")
 
     def resend_invite(self, request: InviteResendRequest) -> APIResponse:
         """Resend an invite.
@@ -178,7 +188,7 @@ class Users(BaseResource):
         )
 
         # Create standardized response
-        return self._create_response(response)
+        return self._create_response(response, method="resend_invite")
 
     def cancel_invite(self, request: InviteCancelRequest) -> APIResponse:
         """Cancel an invite.
@@ -0,0 +1,216 @@
+"""
+Retry policy for transient API failures.
+
+Both clients retry rate limiting (429), server errors and network failures
+according to a ``RetryPolicy``:
+
+* Delays follow "decorrelated jitter" backoff: each delay is drawn uniformly
+  between ``base_delay`` and three times the previous delay, capped at
+  ``max_delay``. Workers that fail together therefore do not retry together.
+* ``Retry-After`` on 429 and 503 responses is honoured, plus a small jitter.
+* ``max_total_time`` caps the time a single call may spend retrying; a retry
+  that would end past it is not attempted.
+* Non-idempotent requests (POST, PATCH) are only retried when the server
+  cannot have processed them: a 429 response or a failure to connect.
+
+The policy can be narrowed for a single call, or for every call made inside
+a block:
+
+Examples:
+    >>> client = MailerSendClient(retry_policy=RetryPolicy(max_retries=5))
+
+    >>> with retry_budget(max_retries=1, max_total_time=5):
+    ...     client.emails.send(email)
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional
+
+from .constants import (
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    RETRY_MAX_TOTAL_TIME,
+    RETRY_STATUS_CODES,
+)
+from .rate_limit import parse_retry_after
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Status codes whose Retry-After header is honoured
+RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+
+_budget_overrides: ContextVar[Dict[str, Any]] = ContextVar(
+    "mailersend_retry_budget", default={}
+)
+
+
+class RetryPolicy:
+    """Settings that decide whether and when a failed request is retried."""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+        max_total_time: Optional[float] = RETRY_MAX_TOTAL_TIME,
+        status_codes: Iterable[int] = RETRY_STATUS_CODES,
+        retry_keyed_requests: bool = False,
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_retries: Maximum number of retries after the first attempt
+            base_delay: Smallest delay between two attempts, in seconds
+            max_delay: Largest backoff delay between two attempts, in seconds
+            max_total_time: Maximum seconds a call may spend including retries
+                           (None for no limit)
+            status_codes: Response status codes that are retried
+            retry_keyed_requests: Retry POST requests carrying an idempotency
+                           key like idempotent ones (only safe when the API
+                           deduplicates on the key)
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        if base_delay < 0 or max_delay < base_delay:
+            raise ValueError("Delays must satisfy 0 <= base_delay <= max_delay")
+
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_total_time = max_total_time
+        self.status_codes = frozenset(status_codes)
+        self.retry_keyed_requests = retry_keyed_requests
+
+    def replace(self, **changes: Any) -> "RetryPolicy":
+        """Return a copy of the policy with some settings changed."""
+        settings = {
+            "max_retries": self.max_retries,
+            "base_delay": self.base_delay,
+            "max_delay": self.max_delay,
+            "max_total_time": self.max_total_time,
+            "status_codes": self.status_codes,
+            "retry_keyed_requests": self.retry_keyed_requests,
+        }
+        settings.update(changes)
+        return RetryPolicy(**settings)
+
+    def start(self, method: str, keyed: bool = False) -> "RetryState":
+        """
+        Begin tracking the retries of one call.
+
+        Args:
+            method: HTTP method of the call
+            keyed: Whether the request carries an idempotency key
+        """
+        return RetryState(self, method, keyed)
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_retries={self.max_retries}, "
+            f"base_delay={self.base_delay}, max_delay={self.max_delay}, "
+            f"max_total_time={self.max_total_time})"
+        )
+
+
+class RetryState:
+    """Retry bookkeeping for a single call."""
+
+    def __init__(self, policy: RetryPolicy, method: str, keyed: bool = False):
+        self.policy = policy
+        self.method = method.upper()
+        self.keyed = keyed
+        self.attempt = 0
+        self.started = time.monotonic()
+        self._previous_delay = policy.base_delay
+
+    @property
+    def idempotent(self) -> bool:
+        """Whether repeating the request cannot cause duplicate side effects."""
+        if self.keyed and self.policy.retry_keyed_requests:
+            return True
+        return self.method in IDEMPOTENT_METHODS
+
+    def delay_for_response(
+        self, status_code: int, headers: Mapping[str, str]
+    ) -> Optional[float]:
+        """
+        Seconds to wait before retrying a response, or None to stop.
+
+        Args:
+            status_code: HTTP status code of the response
+            headers: Response headers (case-insensitive mapping)
+        """
+        if status_code not in self.policy.status_codes:
+            return None
+        # A 429 is rejected before any processing, so it is safe to repeat
+        if status_code != 429 and not self.idempotent:
+            return None
+
+        retry_after = None
+        if status_code in RETRY_AFTER_STATUS_CODES:
+            retry_after = parse_retry_after(headers.get("retry-after"))
+        return self._next_delay(retry_after)
+
+    def delay_for_error(self, reached_server: bool = True) -> Optional[float]:
+        """
+        Seconds to wait before retrying after a network error, or None to stop.
+
+        Args:
+            reached_server: Whether the request may have reached the server
+                           (False for connection failures)
+        """
+        if reached_server and not self.idempotent:
+            return None
+        return self._next_delay()
+
+    def _next_delay(self, retry_after: Optional[float] = None) -> Optional[float]:
+        """Count an attempt and return its delay if the budget allows it."""
+        policy = self.policy
+        if self.attempt >= policy.max_retries:
+            return None
+
+        if retry_after is not None:
+            delay = retry_after + random.uniform(0, policy.base_delay)
+        else:
+            upper = max(policy.base_delay, self._previous_delay * 3)
+            delay = min(policy.max_delay, random.uniform(policy.base_delay, upper))
+            self._previous_delay = delay
+
+        if policy.max_total_time is not None:
+            elapsed = time.monotonic() - self.started
+            if elapsed + delay > policy.max_total_time:
+                return None
+
+        self.attempt += 1
+        return delay
+
+
+def current_policy(policy: RetryPolicy) -> RetryPolicy:
+    """Apply the overrides of any enclosing ``retry_budget`` block to ``policy``."""
+    overrides = _budget_overrides.get()
+    return policy.replace(**overrides) if overrides else policy
+
+
+@contextmanager
+def retry_budget(**overrides: Any) -> Iterator[None]:
+    """
+    Override retry settings for every request made inside the block.
+
+    Accepts the keyword arguments of ``RetryPolicy``. Blocks can be nested;
+    the innermost setting wins. The override follows the current thread or
+    asyncio task.
+
+    Examples:
+        >>> with retry_budget(max_retries=0):
+        ...     client.emails.send(email)  # fail fast, never retried
+    """
+    RetryPolicy().replace(**overrides)  # validate eagerly
+    token = _budget_overrides.set({**_budget_overrides.get(), **overrides})
+    try:
+        yield
+    finally:
+        _budget_overrides.reset(token)
@@ -0,0 +1,232 @@
+"""
+JSON encoding of request bodies and decoding of responses.
+
+Bodies are encoded once, to ``bytes``, and sent as-is. Pydantic models are
+written straight to JSON bytes by pydantic's serializer, without building an
+intermediate dict; other payloads use orjson when it is installed
+(``pip install "mailersend[fast]"``) and the standard library otherwise.
+
+Request models holding ``AttachmentFile`` content are encoded to a
+``StreamingBody`` instead: the JSON around the files is encoded up front and
+each file is base64-encoded into the body while it is sent.
+"""
+
+import json
+import re
+import secrets
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Optional, Union
+
+from pydantic import BaseModel as PydanticBaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is missing
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+    ).encode()
+
+
+def loads(data: Any) -> Any:
+    """Decode a JSON document from ``bytes`` or ``str``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def model_json(model: PydanticBaseModel) -> bytes:
+    """
+    Encode a request model as it is sent to the API.
+
+    Equivalent to ``dumps(model.model_dump(by_alias=True, exclude_none=True))``
+    but serialized directly by pydantic.
+    """
+    return model.__pydantic_serializer__.to_json(
+        model, by_alias=True, exclude_none=True
+    )
+
+
+def models_json_array(models: Iterable[PydanticBaseModel]) -> bytes:
+    """Encode request models as a JSON array."""
+    return b"[" + b",".join(model_json(model) for model in models) + b"]"
+
+
+# Serialization context key under which values to stream are collected
+STREAMED = "mailersend_streamed"
+
+
+class _Streamed:
+    """Values deferred while encoding one request body."""
+
+    __slots__ = ("token", "values")
+
+    def __init__(self):
+        # Created on first use, so bodies without files skip the random draw
+        self.token: Optional[str] = None
+        self.values: List[Any] = []
+
+
+def stream_placeholder(value: Any, context: Any) -> Optional[str]:
+    """
+    Defer ``value`` to be streamed in place of a JSON string.
+
+    Called by field serializers. ``value`` must provide ``encoded_size``,
+    ``iter_base64()`` and ``fingerprint()``.
+
+    Args:
+        value: The value to stream
+        context: Serialization context of the running encoder
+
+    Returns:
+        A placeholder string to serialize instead, or None when the encoder
+        is not streaming and ``value`` has to be encoded in full
+    """
+    streamed = context.get(STREAMED) if isinstance(context, dict) else None
+    if streamed is None:
+        return None
+    if streamed.token is None:
+        streamed.token = secrets.token_hex(8)
+    streamed.values.append(value)
+    return f"{streamed.token}:{len(streamed.values) - 1}"
+
+
+class StreamingBody:
+    """
+    A JSON request body whose file attachments are encoded while it is sent.
+
+    Iterating yields the body in chunks; it can be iterated any number of
+    times (once per attempt). ``len()`` is the exact size of the body, so
+    it is sent with a ``Content-Length`` header.
+    """
+
+    __slots__ = ("parts", "_length")
+
+    def __init__(self, parts: List[Any]):
+        """
+        Args:
+            parts: Encoded JSON ``bytes`` and streamed values, in body order
+        """
+        self.parts = parts
+        self._length = sum(
+            len(part) if isinstance(part, bytes) else part.encoded_size
+            for part in parts
+        )
+
+    def __iter__(self) -> Iterator[bytes]:
+        for part in self.parts:
+            if isinstance(part, bytes):
+                yield part
+            else:
+                yield from part.iter_base64()
+
+    async def aiter_bytes(self) -> AsyncIterator[bytes]:
+        """Yield the body in chunks, for clients that need an async stream."""
+        for chunk in self:
+            yield chunk
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bytes__(self) -> bytes:
+        return b"".join(self)
+
+    def __repr__(self) -> str:
+        files = sum(not isinstance(part, bytes) for part in self.parts)
+        return f"StreamingBody({self._length} bytes, {files} streamed)"
+
+
+def _streaming_body(body: bytes, streamed: _Streamed) -> Union[bytes, StreamingBody]:
+    """Split an encoded body around the placeholders of its streamed values."""
+    if not streamed.values:
+        return body
+
+    placeholder = re.compile(b'"' + streamed.token.encode() + rb':(\d+)"')
+    parts: List[Any] = []
+    position = 0
+    for match in placeholder.finditer(body):
+        # Keep the quotes in the JSON parts around the streamed value
+        parts.append(body[position : match.start() + 1])
+        parts.append(streamed.values[int(match.group(1))])
+        position = match.end() - 1
+    parts.append(body[position:])
+    return StreamingBody(parts)
+
+
+def model_body(model: PydanticBaseModel) -> Union[bytes, StreamingBody]:
+    """
+    Encode a request model as it is sent to the API, streaming its files.
+
+    Returns the same ``bytes`` as ``model_json`` unless the model holds
+    values to stream, in which case a ``StreamingBody`` is returned.
+    """
+    streamed = _Streamed()
+    body = model.__pydantic_serializer__.to_json(
+        model, by_alias=True, exclude_none=True, context={STREAMED: streamed}
+    )
+    return _streaming_body(body, streamed)
+
+
+class EncodedModels(list):
+    """
+    Request models together with their JSON array body, already encoded.
+
+    Lets code that measured each model while encoding it (such as
+    ``BulkSender``) hand the models on without them being encoded again.
+    The list must not be modified afterwards.
+    """
+
+    def __init__(
+        self, models: Iterable[PydanticBaseModel], body: Union[bytes, StreamingBody]
+    ):
+        super().__init__(models)
+        self.body = body
+
+
+def bodies_array(
+    bodies: Iterable[Union[bytes, StreamingBody]],
+) -> Union[bytes, StreamingBody]:
+    """Join encoded bodies (from ``model_body``) into a JSON array body."""
+    parts: List[Any] = []
+    # Adjacent JSON pieces are merged, so only files break up the body
+    pending: List[bytes] = [b"["]
+    for index, body in enumerate(bodies):
+        if index:
+            pending.append(b",")
+        if not isinstance(body, StreamingBody):
+            pending.append(body)
+            continue
+        for part in body.parts:
+            if isinstance(part, bytes):
+                pending.append(part)
+            else:
+                parts.append(b"".join(pending))
+                parts.append(part)
+                pending = []
+    pending.append(b"]")
+    parts.append(b"".join(pending))
+    return parts[0] if len(parts) == 1 else StreamingBody(parts)
+
+
+def models_body_array(
+    models: Iterable[PydanticBaseModel],
+) -> Union[bytes, StreamingBody]:
+    """Encode request models as a JSON array, streaming their files."""
+    if isinstance(models, EncodedModels):
+        return models.body
+    return bodies_array([model_body(model) for model in models])
+
+
+def response_json(response: Any) -> Any:
+    """Decode the JSON body of a ``requests`` or ``httpx`` response."""
+    content = response.content
+    if isinstance(content, (bytes, bytearray)):
+        return loads(content)
+    return response.json()
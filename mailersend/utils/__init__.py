@@ -2,10 +2,26 @@
 Utility functions and helpers for the MailerSend SDK.
 """
 
-from .files import process_file_attachments
-from .validators import validate_email_requirements
+from typing import TYPE_CHECKING
+
+from .lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .files import process_file_attachments
+    from .headers import parse_int_header
+    from .validators import validate_email_requirements
 
 __all__ = [
     "process_file_attachments",
+    "parse_int_header",
     "validate_email_requirements",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".files": ("process_file_attachments",),
+        ".headers": ("parse_int_header",),
+        ".validators": ("validate_email_requirements",),
+    },
+)
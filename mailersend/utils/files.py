@@ -1,8 +1,8 @@
 import os
-import base64
 from typing import Dict, Any, List
 import logging
 
+from ..attachments import AttachmentFile
 from ..exceptions import ValidationError
 from ..models.email import EmailAttachment
 
@@ -13,7 +13,7 @@ def process_file_attachments(
     attachments: List[Dict[str, Any]],
 ) -> List[EmailAttachment]:
     """
-    Process file attachments by reading file content and encoding as base64.
+    Process file attachments, referencing files to encode as base64 on send.
 
     Args:
         attachments: List of attachment dictionaries with possible 'file_path' keys
@@ -32,9 +32,8 @@ def process_file_attachments(
             file_path = attachment_data.pop("file_path")
 
             try:
-                # Read and encode file content
-                with open(file_path, "rb") as file:
-                    file_content = base64.b64encode(file.read()).decode("utf-8")
+                # Encoded into the request body while it is sent
+                file_content = AttachmentFile(file_path)
 
                 # Use filename from path if not provided
                 if "filename" not in attachment_data:
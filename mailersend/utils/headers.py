@@ -0,0 +1,58 @@
+import platform
+from functools import lru_cache
+from typing import Iterable, Mapping, Optional
+
+from ..constants import PACKAGE_NAME, __version__
+
+
+def parse_int_header(headers: Mapping[str, str], header: str) -> Optional[int]:
+    """
+    Safely parse integer header value.
+
+    Args:
+        headers: Response headers (case-insensitive mapping)
+        header: Header name to parse
+
+    Returns:
+        Integer value or None if the header is missing or not an integer
+    """
+    value = headers.get(header)
+    if value:
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    return None
+
+
+@lru_cache(maxsize=None)
+def _base_user_agent() -> str:
+    # Platform probing can be slow on some container runtimes; it runs once,
+    # when the first client is created rather than at import time
+    return (
+        f"{PACKAGE_NAME}/{__version__} "
+        f"(Python/{platform.python_version()}; "
+        f"OS/{platform.system()} {platform.release()}; "
+        f"Impl/{platform.python_implementation()})"
+    )
+
+
+def user_agent(products: Iterable[str] = ()) -> str:
+    """
+    Build the ``User-Agent`` header value.
+
+    Args:
+        products: Extra product tokens appended after the SDK's own, such as
+                 ``"my-app/1.4"``
+
+    Returns:
+        User agent string
+
+    Raises:
+        ValueError: If a product token is empty or contains whitespace
+    """
+    products = tuple(products)
+    for product in products:
+        if not product or any(char.isspace() for char in product):
+            raise ValueError(f"Invalid User-Agent product token: {product!r}")
+    return " ".join((_base_user_agent(),) + products)
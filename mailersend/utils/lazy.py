@@ -0,0 +1,58 @@
+"""
+Lazy package exports.
+
+Importing every builder, resource and model up front builds hundreds of
+pydantic schemas, most of which a short-lived process never uses. Packages
+instead declare what they export and from which submodule; the submodule is
+imported the first time one of its names is accessed (PEP 562).
+
+Examples:
+    >>> __getattr__, __dir__ = lazy_exports(
+    ...     __name__, {".email": ("EmailBuilder",)}
+    ... )
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Union
+
+Export = Union[str, Tuple[str, str]]
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, Sequence[Export]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` for ``package``.
+
+    Args:
+        package: ``__name__`` of the exporting package
+        exports: Names exported by each submodule (relative to ``package``);
+                a ``(name, alias)`` pair exports ``name`` as ``alias``
+
+    Returns:
+        The ``__getattr__`` and ``__dir__`` functions to assign in the package
+    """
+    module = sys.modules[package]
+    sources: Dict[str, Tuple[str, str]] = {}
+    for submodule, names in exports.items():
+        for export in names:
+            name, alias = (export, export) if isinstance(export, str) else export
+            sources[alias] = (submodule, name)
+
+    def __getattr__(name: str) -> Any:
+        try:
+            submodule, attribute = sources[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(importlib.import_module(submodule, package), attribute)
+        # Cache it so later lookups bypass __getattr__
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(module)) | set(sources))
+
+    return __getattr__, __dir__
@@ -0,0 +1,63 @@
+"""
+Cold-start cost of the SDK.
+
+Times, in fresh interpreters, importing the package and sending-ready client
+construction (``MailerSendClient()`` plus ``client.emails``), and counts the
+SDK modules loaded by then.
+
+Run with::
+
+    python tests/benchmarks/bench_import.py [runs]
+"""
+
+import statistics
+import subprocess
+import sys
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+loaded = sum(name.startswith("mailersend.") for name in sys.modules)
+print(elapsed * 1000, loaded)
+"""
+
+CASES = {
+    "import mailersend": "import mailersend",
+    "client + emails": (
+        "from mailersend import MailerSendClient\n"
+        "MailerSendClient(api_key='key').emails"
+    ),
+    "all resources": (
+        "from mailersend import MailerSendClient\n"
+        "client = MailerSendClient(api_key='key')\n"
+        "[getattr(client, name) for name in dir(client)]"
+    ),
+}
+
+
+def measure(code: str) -> tuple:
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(code=code)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return float(output[0]), int(output[1])
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    for label, code in CASES.items():
+        results = [measure(code) for _ in range(runs)]
+        times = [elapsed for elapsed, _ in results]
+        print(
+            f"{label:<18} {statistics.median(times):7.1f} ms median, "
+            f"{results[0][1]:3d} SDK modules"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Per-request logging overhead of ``Email.send``.
+
+Sends an email through a client whose HTTP session is replaced by a stub, so
+only SDK work is measured, once with logging disabled (the default WARNING
+level) and once with DEBUG logging written to an in-memory stream.
+
+Run with::
+
+    python tests/benchmarks/bench_logging.py [iterations]
+"""
+
+import io
+import logging
+import sys
+import timeit
+from unittest.mock import Mock
+
+from requests.structures import CaseInsensitiveDict
+
+from mailersend import MailerSendClient
+from mailersend.logging import DebugFilter, SensitiveDataFormatter
+from mailersend.models.email import EmailRequest
+
+
+def make_client(level: int) -> MailerSendClient:
+    logger = logging.getLogger(f"mailersend.bench.{logging.getLevelName(level)}")
+    logger.handlers = []
+    logger.propagate = False
+    logger.setLevel(level)
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(
+        SensitiveDataFormatter("%(levelname)s [%(request_id)s] %(message)s")
+    )
+    handler.addFilter(DebugFilter())
+    logger.addHandler(handler)
+
+    response = Mock()
+    response.status_code = 202
+    response.headers = CaseInsensitiveDict({"x-message-id": "msg-1"})
+    response.json.side_effect = ValueError
+    response.text = ""
+
+    client = MailerSendClient(api_key="bench-key", logger=logger)
+    client.emails.logger = logger
+    client.session.request = Mock(return_value=response)
+    return client
+
+
+def make_email(attachment_size: int = 0) -> EmailRequest:
+    attachments = {}
+    if attachment_size:
+        attachments["attachments"] = [
+            {
+                "content": "QUJD" * (attachment_size // 4),
+                "filename": "report.pdf",
+                "disposition": "attachment",
+            }
+        ]
+    return EmailRequest(
+        **attachments,
+        **{
+            "from": {"email": "sender@example.com", "name": "Sender"},
+            "to": [{"email": f"user{n}@example.com"} for n in range(10)],
+            "subject": "Benchmark",
+            "html": "<p>Hello {{ name }}</p>" * 50,
+            "text": "Hello {{ name }}" * 50,
+            "personalization": [
+                {"email": f"user{n}@example.com", "data": {"name": f"User {n}"}}
+                for n in range(10)
+            ],
+        },
+    )
+
+
+def measure(level: int, iterations: int, attachment_size: int = 0) -> float:
+    """Microseconds per ``Email.send`` call at the given logger level."""
+    client = make_client(level)
+    email = make_email(attachment_size)
+    client.emails.send(email)  # warm up
+    seconds = min(
+        timeit.repeat(lambda: client.emails.send(email), number=iterations, repeat=5)
+    )
+    return seconds / iterations * 1e6
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    disabled = measure(logging.WARNING, iterations)
+    enabled = measure(logging.DEBUG, iterations)
+    print(f"logging disabled: {disabled:8.1f} µs/request")
+    print(f"logging enabled:  {enabled:8.1f} µs/request")
+    print(f"overhead of DEBUG logging: {enabled - disabled:8.1f} µs/request")
+
+    size = 5 * 1024 * 1024
+    disabled = measure(logging.WARNING, 20, attachment_size=size)
+    enabled = measure(logging.DEBUG, 20, attachment_size=size)
+    print(f"5 MB attachment, logging disabled: {disabled:10.1f} µs/request")
+    print(f"5 MB attachment, logging enabled:  {enabled:10.1f} µs/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Encoding cost of a bulk email request body.
+
+Compares building the body through ``model_dump`` dicts and ``json.dumps``
+(what ``json=`` bodies cost) with the direct ``models_json_array`` encoding
+used by ``Email.send_bulk``.
+
+Run with::
+
+    python tests/benchmarks/bench_serialization.py [emails]
+"""
+
+import json
+import sys
+import timeit
+
+from mailersend.models.email import EmailRequest
+from mailersend.serialization import JSON_BACKEND, dumps, models_json_array
+
+
+def make_email(index: int) -> EmailRequest:
+    return EmailRequest(
+        **{
+            "from": {"email": "sender@example.com", "name": "Sender"},
+            "to": [{"email": f"user{index}@example.com", "name": f"User {index}"}],
+            "subject": "Your weekly report",
+            "html": "<p>Hello {{ name }}, here is your report.</p>" * 40,
+            "text": "Hello {{ name }}, here is your report." * 40,
+            "personalization": [
+                {"email": f"user{index}@example.com", "data": {"name": f"User {index}"}}
+            ],
+        }
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    emails = [make_email(i) for i in range(count)]
+
+    def via_dicts() -> bytes:
+        payload = [e.model_dump(by_alias=True, exclude_none=True) for e in emails]
+        return json.dumps(payload).encode()
+
+    def via_dicts_fast_backend() -> bytes:
+        return dumps([e.model_dump(by_alias=True, exclude_none=True) for e in emails])
+
+    def direct() -> bytes:
+        return models_json_array(emails)
+
+    size = len(direct())
+    print(f"{count} emails, {size / 1e6:.1f} MB body, backend: {JSON_BACKEND}")
+    for name, encode in (
+        ("model_dump + json.dumps", via_dicts),
+        (f"model_dump + {JSON_BACKEND}", via_dicts_fast_backend),
+        ("models_json_array", direct),
+    ):
+        seconds = min(timeit.repeat(encode, number=1, repeat=5))
+        print(f"{name:>26}: {seconds * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -89,3 +89,43 @@ def email_client(api_key):
     client = MailerSendClient(api_key=api_key)
 
     return client
+
+
+class FakeClock:
+    """Deterministic replacement for the ``time`` module."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock():
+    """Return a clock to patch over the ``time`` module of the code under test."""
+    return FakeClock()
+
+
+@pytest.fixture
+def make_email():
+    """Return a factory of valid emails; ``fields`` override the defaults."""
+    from mailersend.models.email import EmailRequest
+
+    def make_email(index=0, **fields):
+        return EmailRequest(
+            **{
+                "from": {"email": "sender@example.com"},
+                "to": [{"email": f"recipient{index}@example.com"}],
+                "subject": f"Email {index}",
+                "text": "Hello",
+                **fields,
+            }
+        )
+
+    return make_email
@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest.mock import Mock, patch
 from requests import Response
@@ -10,6 +11,7 @@ from mailersend.models.activity import (
 )
 from mailersend.models.base import APIResponse
 from mailersend.exceptions import ValidationError
+from mailersend.retry import RetryPolicy, current_policy, retry_budget
 
 
 class TestActivityResource:
@@ -165,3 +167,154 @@ class TestActivityResource:
         recipient = email["recipient"]
         assert "id" in recipient
         assert "email" in recipient
+
+
+DAY = 24 * 60 * 60
+
+
+class TestActivityExport:
+    """Test exporting activity over ranges longer than the API allows."""
+
+    @staticmethod
+    def activity_client(records):
+        """Mock client serving ``records`` (id, timestamp) filtered by window."""
+        client = Mock()
+        client.windows = []
+
+        def request(method, path, params=None, body=None):
+            date_from, date_to = params["date_from"], params["date_to"]
+            if params["page"] == 1:
+                client.windows.append((date_from, date_to))
+            in_window = [
+                {"id": record_id, "created_at": f"{timestamp:012d}"}
+                for record_id, timestamp in records
+                if date_from <= timestamp <= date_to
+            ]
+            # Serve newest first, two per page, like a simple paginator
+            in_window.reverse()
+            start = (params["page"] - 1) * 2
+            page = in_window[start : start + 2]
+            response = Mock(spec=Response)
+            response.status_code = 200
+            response.headers = {}
+            payload = {
+                "data": page,
+                "links": {"next": "next" if start + 2 < len(in_window) else None},
+                "meta": {"current_page": params["page"], "per_page": 2},
+            }
+            response.content = json.dumps(payload).encode()
+            response.json.return_value = payload
+            return response
+
+        client.request.side_effect = request
+        return client
+
+    def test_export_windows_split_long_ranges(self):
+        from mailersend.resources.activity import export_windows
+
+        windows = export_windows(0, 20 * DAY)
+
+        assert windows == [(0, 7 * DAY), (7 * DAY, 14 * DAY), (14 * DAY, 20 * DAY)]
+        for start, end in windows:
+            ActivityQueryParams(date_from=start, date_to=end)
+
+    @pytest.mark.parametrize("date_from,date_to,window", [(5, 5, DAY), (0, 10, 0)])
+    def test_export_windows_rejects_invalid_ranges(self, date_from, date_to, window):
+        from mailersend.resources.activity import export_windows
+
+        with pytest.raises(ValueError):
+            export_windows(date_from, date_to, window)
+
+    @pytest.mark.parametrize("max_in_flight", [1, 3])
+    def test_export_streams_records_in_timestamp_order(self, max_in_flight):
+        records = [(f"a{i}", i * DAY // 2) for i in range(60)]
+        # A record on a window boundary is returned by both windows
+        records.append(("boundary", 7 * DAY))
+        client = self.activity_client(records)
+
+        exported = list(
+            Activity(client).export(
+                "domain-1", 0, 30 * DAY, max_in_flight=max_in_flight
+            )
+        )
+
+        timestamps = [record["created_at"] for record in exported]
+        assert timestamps == sorted(timestamps)
+        assert len(exported) == 61
+        assert len({record["id"] for record in exported}) == 61
+        assert client.windows == [
+            (0, 7 * DAY),
+            (7 * DAY, 14 * DAY),
+            (14 * DAY, 21 * DAY),
+            (21 * DAY, 28 * DAY),
+            (28 * DAY, 30 * DAY),
+        ]
+
+    def test_export_runs_in_the_callers_context(self):
+        client = self.activity_client([("a", 0), ("b", 8 * DAY)])
+        budgets = []
+        request = client.request.side_effect
+
+        def recording(*args, **kwargs):
+            budgets.append(current_policy(RetryPolicy()).max_retries)
+            return request(*args, **kwargs)
+
+        client.request.side_effect = recording
+
+        with retry_budget(max_retries=0):
+            exported = list(Activity(client).export("domain-1", 0, 10 * DAY))
+
+        assert len(exported) == 2
+        assert budgets == [0, 0]
+
+    def test_export_passes_events_and_limit(self):
+        client = self.activity_client([])
+
+        list(
+            Activity(client).export(
+                "domain-1", 0, DAY, events=["opened", "clicked"], limit=50
+            )
+        )
+
+        params = client.request.call_args.kwargs["params"]
+        assert client.request.call_args.kwargs["path"] == "activity/domain-1"
+        assert params["limit"] == 50
+        assert params["event[0]"] == "opened"
+        assert params["event[1]"] == "clicked"
+
+    def test_export_filters_every_window_by_events(self):
+        client = self.activity_client([])
+
+        list(
+            Activity(client).export(
+                "domain-1", 0, 20 * DAY, events=(e for e in ["sent", "delivered"])
+            )
+        )
+
+        filters = [
+            [call.kwargs["params"].get(f"event[{i}]") for i in range(2)]
+            for call in client.request.call_args_list
+        ]
+        assert filters == [["sent", "delivered"]] * 3
+
+    def test_export_validates_before_requesting(self):
+        client = self.activity_client([])
+
+        with pytest.raises(ValueError):
+            list(Activity(client).export("domain-1", 0, DAY, events=["bogus"]))
+        client.request.assert_not_called()
+
+    def test_records_repeated_within_a_window_are_yielded_once(self):
+        from mailersend.resources.activity import ordered_unique
+
+        records = [
+            {"id": "b", "created_at": "2"},
+            {"id": "a", "created_at": "1"},
+            {"id": "b", "created_at": "2"},
+            {"id": "c", "created_at": "3"},
+        ]
+
+        fresh, seen = ordered_unique(records, {"c"})
+
+        assert [record["id"] for record in fresh] == ["a", "b"]
+        assert seen == {"a", "b", "c"}
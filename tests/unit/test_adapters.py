@@ -0,0 +1,105 @@
+"""Tests for connection pool configuration and statistics."""
+
+import json
+import pickle
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from mailersend.adapters import PooledHTTPAdapter, keepalive_socket_options
+from mailersend.client import MailerSendClient
+
+
+class JSONHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"data": []}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), JSONHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1/"
+    server.shutdown()
+    server.server_close()
+
+
+class TestPooledHTTPAdapter:
+    def test_rejects_empty_pools(self):
+        with pytest.raises(ValueError):
+            PooledHTTPAdapter(pool_maxsize=0)
+
+    def test_pool_settings_reach_urllib3(self):
+        adapter = PooledHTTPAdapter(pool_maxsize=64, pool_block=True)
+
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 64
+        assert adapter.poolmanager.connection_pool_kw["block"] is True
+        assert "socket_options" not in adapter.poolmanager.connection_pool_kw
+
+    def test_tcp_keepalive_socket_options(self):
+        adapter = PooledHTTPAdapter(tcp_keepalive=True)
+
+        options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+        assert options == keepalive_socket_options()
+
+    def test_pickling_keeps_settings(self):
+        adapter = pickle.loads(
+            pickle.dumps(PooledHTTPAdapter(pool_maxsize=32, tcp_keepalive=True))
+        )
+
+        assert adapter.pool_stats()["pool_maxsize"] == 32
+        assert "socket_options" in adapter.poolmanager.connection_pool_kw
+
+
+class TestClientPooling:
+    def test_connections_are_reused(self, server):
+        client = MailerSendClient(
+            api_key="test-key", base_url=server, pool_maxsize=4, tcp_keepalive=True
+        )
+
+        for _ in range(3):
+            client.request("GET", "domains")
+
+        stats = client.get_debug_info()["connection_pool"]
+        assert stats["pool_maxsize"] == 4
+        assert stats["tcp_keepalive"] is True
+        assert stats["pools"] == [
+            {
+                "host": server.rsplit("/", 2)[0],
+                "connections_opened": 1,
+                "idle_connections": 1,
+                "requests": 3,
+            }
+        ]
+
+    def test_threads_share_a_bounded_pool(self, server):
+        client = MailerSendClient(
+            api_key="test-key", base_url=server, pool_maxsize=2, pool_block=True
+        )
+
+        threads = [
+            threading.Thread(target=client.request, args=("GET", "domains"))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        (pool,) = client.get_debug_info()["connection_pool"]["pools"]
+        assert pool["requests"] == 8
+        assert pool["connections_opened"] <= 2
@@ -0,0 +1,278 @@
+"""Tests for AsyncMailerSendClient."""
+
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from mailersend.async_client import AsyncMailerSendClient, AsyncResource
+from mailersend.exceptions import (
+    AuthenticationError,
+    MailerSendError,
+    RateLimitExceeded,
+    ResourceNotFoundError,
+)
+from mailersend.models.base import APIResponse
+from mailersend.models.messages import MessageGetRequest
+from mailersend.retry import RetryPolicy
+
+NO_WAIT = RetryPolicy(base_delay=0, max_delay=0)
+
+
+def make_client(handler, **kwargs):
+    """Create an async client backed by an in-memory transport."""
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncMailerSendClient(api_key="test-key", http_client=http_client, **kwargs)
+
+
+class TestAsyncMailerSendClient:
+    """Test the asyncio client."""
+
+    def test_requires_api_key(self, monkeypatch):
+        monkeypatch.delenv("MAILERSEND_API_KEY", raising=False)
+        with pytest.raises(ValueError) as exc_info:
+            AsyncMailerSendClient()
+        assert "API key is required" in str(exc_info.value)
+
+    def test_exposes_every_sync_resource(self):
+        from mailersend.client import MailerSendClient
+
+        sync_client = MailerSendClient(api_key="test-key")
+        client = AsyncMailerSendClient(api_key="test-key")
+
+        for name, value in vars(sync_client).items():
+            if hasattr(value, "_create_response"):
+                resource = getattr(client, name)
+                assert isinstance(resource, AsyncResource)
+                assert isinstance(resource._resource, type(value))
+
+    def test_send_email(self, make_email):
+        seen = {}
+
+        def handler(request):
+            seen["method"] = request.method
+            seen["url"] = str(request.url)
+            seen["auth"] = request.headers["Authorization"]
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(202, headers={"x-message-id": "msg-123"})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.emails.send(make_email())
+
+        response = asyncio.run(run())
+
+        assert isinstance(response, APIResponse)
+        assert response.status_code == 202
+        assert response["id"] == "msg-123"
+        assert seen["method"] == "POST"
+        assert seen["url"] == "https://api.mailersend.com/v1/email"
+        assert seen["auth"] == "Bearer test-key"
+        assert seen["body"]["from"] == {"email": "sender@example.com"}
+
+    def test_generic_resource_method(self):
+        def handler(request):
+            assert request.url.path == "/v1/messages/msg-1"
+            return httpx.Response(200, json={"data": {"id": "msg-1"}})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.messages.get_message(
+                    MessageGetRequest(message_id="msg-1")
+                )
+
+        response = asyncio.run(run())
+
+        assert response.status_code == 200
+        assert response["data"]["id"] == "msg-1"
+
+    def test_many_requests_in_flight(self, make_email):
+        in_flight = {"current": 0, "peak": 0}
+
+        async def handler(request):
+            in_flight["current"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+            await asyncio.sleep(0.01)
+            in_flight["current"] -= 1
+            return httpx.Response(202, headers={"x-message-id": "id"})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await asyncio.gather(
+                    *(client.emails.send(make_email()) for _ in range(20))
+                )
+
+        responses = asyncio.run(run())
+
+        assert len(responses) == 20
+        assert in_flight["peak"] > 1
+
+    def test_send_many(self, make_email):
+        in_flight = {"current": 0, "peak": 0}
+
+        async def handler(request):
+            in_flight["current"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+            await asyncio.sleep(0.01)
+            in_flight["current"] -= 1
+            if json.loads(request.content)["subject"] == "Email 2":
+                return httpx.Response(422, json={"message": "Invalid"})
+            return httpx.Response(202, headers={"x-message-id": "id"})
+
+        def emails():
+            for index in range(6):
+                email = make_email()
+                email.subject = f"Email {index}"
+                yield email
+
+        async def run():
+            async with make_client(handler) as client:
+                return [
+                    result
+                    async for result in client.emails.send_many(
+                        emails(), max_in_flight=3
+                    )
+                ]
+
+        results = asyncio.run(run())
+
+        assert sorted(result.index for result in results) == list(range(6))
+        assert [result.index for result in results if not result.success] == [2]
+        assert all(r.message_id == "id" for r in results if r.success)
+        assert 1 < in_flight["peak"] <= 3
+
+    @pytest.mark.parametrize(
+        "status_code,exception",
+        [(401, AuthenticationError), (404, ResourceNotFoundError)],
+    )
+    def test_error_mapping(self, status_code, exception):
+        def handler(request):
+            return httpx.Response(status_code, json={"message": "nope"})
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.messages.get_message(MessageGetRequest(message_id="x"))
+
+        with pytest.raises(exception) as exc_info:
+            asyncio.run(run())
+        assert exc_info.value.message == "nope"
+        # Not raised while handling the captured resource call
+        assert exc_info.value.__context__ is None
+
+    def test_retries_transient_status(self):
+        statuses = iter([503, 200])
+
+        def handler(request):
+            return httpx.Response(next(statuses), json={"data": []})
+
+        async def run():
+            async with make_client(handler, retry_policy=NO_WAIT) as client:
+                return await client.messages.get_message(
+                    MessageGetRequest(message_id="x")
+                )
+
+        assert asyncio.run(run()).status_code == 200
+
+    def test_rate_limit_after_retries(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429, json={"message": "slow down"})
+
+        async def run():
+            policy = NO_WAIT.replace(max_retries=2)
+            async with make_client(handler, retry_policy=policy) as client:
+                await client.messages.get_message(MessageGetRequest(message_id="x"))
+
+        with pytest.raises(RateLimitExceeded):
+            asyncio.run(run())
+        assert len(calls) == 3
+
+    def test_post_not_retried_after_server_error(self, make_email):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503, json={"message": "unavailable"})
+
+        async def run():
+            async with make_client(handler, retry_policy=NO_WAIT) as client:
+                await client.emails.send(make_email())
+
+        with pytest.raises(MailerSendError):
+            asyncio.run(run())
+        assert len(calls) == 1
+
+    def test_transport_error(self, monkeypatch):
+        def handler(request):
+            raise httpx.ConnectError("boom", request=request)
+
+        async def run():
+            async with make_client(handler, max_retries=0) as client:
+                await client.messages.get_message(MessageGetRequest(message_id="x"))
+
+        with pytest.raises(MailerSendError) as exc_info:
+            asyncio.run(run())
+        assert "Request failed" in str(exc_info.value)
+
+    def test_paginate(self):
+        def handler(request):
+            page = int(request.url.params.get("page", 1))
+            return httpx.Response(
+                200,
+                json={
+                    "data": [{"id": f"recipient-{page}"}],
+                    "meta": {"current_page": page, "last_page": 2},
+                },
+            )
+
+        async def run():
+            async with make_client(handler) as client:
+                paginator = client.recipients.paginate("list_recipients")
+                return [item["id"] async for item in paginator]
+
+        assert asyncio.run(run()) == ["recipient-1", "recipient-2"]
+
+    def test_activity_export(self):
+        day = 24 * 60 * 60
+
+        def handler(request):
+            params = request.url.params
+            date_from = int(params["date_from"])
+            return httpx.Response(
+                200,
+                json={
+                    "data": [{"id": f"a{date_from}", "created_at": str(date_from)}],
+                    "links": {"next": None},
+                },
+            )
+
+        async def run():
+            async with make_client(handler) as client:
+                return [
+                    record["id"]
+                    async for record in client.activities.export("d", 0, 10 * day)
+                ]
+
+        assert asyncio.run(run()) == ["a0", f"a{7 * day}"]
+
+    def test_activity_export_filters_every_window_by_events(self):
+        day = 24 * 60 * 60
+        filters = []
+
+        def handler(request):
+            filters.append(request.url.params.get_list("event[0]"))
+            return httpx.Response(200, json={"data": [], "links": {"next": None}})
+
+        async def run():
+            async with make_client(handler) as client:
+                events = (event for event in ["sent"])
+                async for _ in client.activities.export("d", 0, 20 * day, events):
+                    pass
+
+        asyncio.run(run())
+
+        assert filters == [["sent"]] * 3
@@ -0,0 +1,352 @@
+"""Tests for file attachments streamed into request bodies."""
+
+import asyncio
+import base64
+import gzip
+import json
+import os
+import threading
+import tracemalloc
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from mailersend.attachments import AttachmentFile
+from mailersend.bulk import BulkSender
+from mailersend.client import MailerSendClient
+from mailersend.compression import CompressedStream, RequestCompression
+from mailersend.exceptions import ValidationError
+from mailersend.idempotency import idempotency_key_for
+from mailersend.middleware import APIRequest
+from mailersend.models.email import EmailAttachment
+from mailersend.serialization import (
+    StreamingBody,
+    model_body,
+    model_json,
+    models_body_array,
+    models_json_array,
+)
+from mailersend.utils.files import process_file_attachments
+
+
+@pytest.fixture
+def make_file(tmp_path):
+    def make_file(size, name="file.bin"):
+        path = tmp_path / name
+        path.write_bytes(os.urandom(size))
+        return path
+
+    return make_file
+
+
+@pytest.fixture
+def make_email(make_email):
+    """Emails attaching each of ``files`` by reference."""
+
+    def make_attached_email(*files, subject="Report"):
+        return make_email(
+            subject=subject,
+            attachments=[
+                EmailAttachment(
+                    content=AttachmentFile(path),
+                    filename=path.name,
+                    disposition="attachment",
+                )
+                for path in files
+            ],
+        )
+
+    return make_attached_email
+
+
+class TestAttachmentFile:
+    @pytest.mark.parametrize("size", [0, 1, 2, 3, 100, 1000])
+    def test_encodes_like_b64encode(self, make_file, size):
+        path = make_file(size)
+        attachment = AttachmentFile(path)
+
+        expected = base64.b64encode(path.read_bytes())
+        assert b"".join(attachment.iter_base64(chunk_size=6)) == expected
+        assert attachment.read_base64() == expected.decode()
+        assert attachment.encoded_size == len(expected)
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            AttachmentFile(tmp_path / "missing.pdf")
+
+    def test_changed_file_is_rejected(self, make_file):
+        path = make_file(10)
+        attachment = AttachmentFile(path)
+        path.write_bytes(b"longer content than before")
+
+        with pytest.raises(ValidationError):
+            attachment.read_base64()
+
+    def test_chunk_size_must_be_a_multiple_of_three(self, make_file):
+        with pytest.raises(ValueError):
+            next(AttachmentFile(make_file(10)).iter_base64(chunk_size=4))
+
+    def test_model_dump_reads_the_file(self, make_file, make_email):
+        path = make_file(10)
+
+        dumped = make_email(path).model_dump(by_alias=True)
+
+        content = dumped["attachments"][0]["content"]
+        assert content == base64.b64encode(path.read_bytes()).decode()
+
+    def test_process_file_attachments(self, make_file):
+        path = make_file(10, "notes.txt")
+
+        (attachment,) = process_file_attachments([{"file_path": str(path)}])
+
+        assert attachment.content == AttachmentFile(path)
+        assert attachment.filename == "notes.txt"
+        with pytest.raises(ValidationError):
+            process_file_attachments([{"file_path": str(path) + ".missing"}])
+
+
+class TestStreamingBody:
+    def test_body_matches_full_encoding(self, make_file, make_email):
+        email = make_email(make_file(1000, "a.pdf"), make_file(5, "b.pdf"))
+
+        body = model_body(email)
+
+        assert isinstance(body, StreamingBody)
+        assert bytes(body) == model_json(email)
+        assert len(body) == len(model_json(email))
+        # Iterable once per attempt
+        assert b"".join(body) == b"".join(body)
+
+    def test_bodies_without_files_stay_bytes(self, make_email):
+        email = make_email()
+        email.attachments = [
+            EmailAttachment(content="SGk=", filename="a.txt", disposition="inline")
+        ]
+
+        assert model_body(email) == model_json(email)
+
+    def test_array_body(self, make_file, make_email):
+        emails = [make_email(make_file(10, "a")), make_email(make_file(20, "b"))]
+
+        body = models_body_array(emails)
+
+        assert bytes(body) == models_json_array(emails)
+
+    def test_text_looking_like_a_placeholder_is_kept(self, make_file, make_email):
+        email = make_email(make_file(10), subject='"0123456789abcdef:0"')
+
+        assert json.loads(bytes(model_body(email)))["subject"] == email.subject
+
+    def test_encoding_does_not_load_the_file(self, make_file, make_email):
+        email = make_email(make_file(8 * 1024 * 1024))
+
+        tracemalloc.start()
+        try:
+            body = model_body(email)
+            for _ in body:
+                pass
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < 4 * 1024 * 1024
+
+    def test_idempotency_key_identifies_files_without_reading_them(
+        self, make_file, monkeypatch, make_email
+    ):
+        path = make_file(100)
+        email = make_email(path)
+        key = idempotency_key_for("POST", "email", model_body(email))
+        os.utime(path, ns=(0, 1_000_000_000))
+        changed = make_email(path)
+
+        monkeypatch.setattr(AttachmentFile, "iter_base64", None)
+        assert idempotency_key_for("POST", "email", model_body(email)) == key
+        assert idempotency_key_for("POST", "email", model_body(changed)) != key
+
+    def test_compression_streams_the_body(self, make_file, make_email):
+        body = model_body(make_email(make_file(3000)))
+        compression = RequestCompression(threshold=0)
+        request = APIRequest("POST", "url", "email", body=body)
+
+        compressed = compression.on_request(request).body
+
+        assert isinstance(compressed, CompressedStream)
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(b"".join(compressed)) == bytes(body)
+        # Iterable once per attempt
+        assert gzip.decompress(b"".join(compressed)) == bytes(body)
+        assert compression.stats()["requests_compressed"] == 2
+        assert compression.stats()["bytes_before"] == 2 * len(body)
+
+    def test_small_streaming_bodies_are_not_compressed(self, make_file, make_email):
+        body = model_body(make_email(make_file(100)))
+        request = APIRequest("POST", "url", "email", body=body)
+
+        assert RequestCompression().on_request(request).body is body
+
+    def test_compressed_bodies_are_sent_chunked(self, make_file, make_email):
+        body = model_body(make_email(make_file(100)))
+        stream = (
+            RequestCompression(threshold=0)
+            .on_request(APIRequest("POST", "url", "email", body=body))
+            .body
+        )
+
+        prepared = requests.Request("POST", "http://api/", data=stream).prepare()
+
+        assert prepared.headers["Transfer-Encoding"] == "chunked"
+        assert "Content-Length" not in prepared.headers
+
+    def test_bulk_sizes_count_encoded_files(self, make_file, make_email):
+        email = make_email(make_file(3000))
+        # "[" + email + "]"
+        size = len(model_json(email)) + 2
+
+        (chunk,) = BulkSender(Mock(), max_request_bytes=size).iter_chunks([email])
+        assert chunk == [email]
+        with pytest.raises(ValidationError):
+            list(BulkSender(Mock(), max_request_bytes=size - 1).iter_chunks([email]))
+
+
+class EchoAPI:
+    """Local HTTP server recording the body and headers of each request."""
+
+    def __init__(self):
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                stub.requests.append((dict(self.headers), body))
+                self.send_response(202)
+                self.send_header("x-message-id", "msg-1")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(
+            target=self.server.serve_forever, args=(0.01,), daemon=True
+        ).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}/v1/"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestSending:
+    def test_sync_client_streams_the_body(self, make_file, make_email):
+        api = EchoAPI()
+        try:
+            client = MailerSendClient(api_key="test-key", base_url=api.base_url)
+            email = make_email(make_file(100_000))
+
+            response = client.emails.send(email)
+        finally:
+            api.close()
+
+        assert response["id"] == "msg-1"
+        ((headers, body),) = api.requests
+        assert body == model_json(email)
+        assert headers["Content-Length"] == str(len(body))
+        assert "Transfer-Encoding" not in headers
+
+    def test_files_are_read_once_per_send(self, make_file, monkeypatch, make_email):
+        reads = []
+        iter_base64 = AttachmentFile.iter_base64
+
+        def counting(self, *args, **kwargs):
+            reads.append(self.path)
+            return iter_base64(self, *args, **kwargs)
+
+        monkeypatch.setattr(AttachmentFile, "iter_base64", counting)
+        client = MailerSendClient(api_key="test-key")
+        response = Mock(status_code=202, headers=CaseInsensitiveDict(), content=b"")
+        client.session.request = Mock(
+            side_effect=lambda data=None, **kwargs: b"".join(data) and response
+        )
+
+        client.emails.send(make_email(make_file(100)))
+
+        assert len(reads) == 1
+
+    def test_sync_client_compresses_the_body(self, make_file, make_email):
+        client = MailerSendClient(
+            api_key="test-key", middleware=[RequestCompression(threshold=0)]
+        )
+        response = Mock(status_code=202, headers=CaseInsensitiveDict(), content=b"")
+        sent = []
+        client.session.request = Mock(
+            side_effect=lambda data=None, headers=None, **kwargs: (
+                sent.append((headers, b"".join(data))) or response
+            )
+        )
+        email = make_email(make_file(100_000))
+
+        client.emails.send(email)
+
+        ((headers, body),) = sent
+        assert headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(body) == model_json(email)
+
+    def test_async_client_compresses_the_body(self, make_file, make_email):
+        httpx = pytest.importorskip("httpx")
+        from mailersend.async_client import AsyncMailerSendClient
+
+        seen = []
+
+        async def handler(request):
+            seen.append((request.headers, await request.aread()))
+            return httpx.Response(202, headers={"x-message-id": "msg-1"})
+
+        email = make_email(make_file(100_000))
+
+        async def send():
+            async with AsyncMailerSendClient(
+                api_key="test-key",
+                http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                middleware=[RequestCompression(threshold=0, encoding="deflate")],
+            ) as client:
+                return await client.emails.send(email)
+
+        asyncio.run(send())
+
+        ((headers, body),) = seen
+        assert headers["Content-Encoding"] == "deflate"
+        assert headers["Transfer-Encoding"] == "chunked"
+        assert zlib.decompress(body) == model_json(email)
+
+    def test_async_client_streams_the_body(self, make_file, make_email):
+        httpx = pytest.importorskip("httpx")
+        from mailersend.async_client import AsyncMailerSendClient
+
+        seen = []
+
+        async def handler(request):
+            seen.append((request.headers, await request.aread()))
+            return httpx.Response(202, headers={"x-message-id": "msg-1"})
+
+        email = make_email(make_file(100_000))
+
+        async def send():
+            async with AsyncMailerSendClient(
+                api_key="test-key",
+                http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            ) as client:
+                return await client.emails.send(email)
+
+        response = asyncio.run(send())
+
+        assert response["id"] == "msg-1"
+        ((headers, body),) = seen
+        assert body == model_json(email)
+        assert headers["Content-Length"] == str(len(body))
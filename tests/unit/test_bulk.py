@@ -0,0 +1,312 @@
+"""Tests for the chunking bulk sender."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from mailersend.bulk import BulkSender, BulkSendResult, BulkStatusPoller
+from mailersend.client import MailerSendClient
+from mailersend.exceptions import ResourceNotFoundError, ServerError, ValidationError
+from mailersend.models.base import APIResponse
+from mailersend.models.email import EmailRequest
+from mailersend.retry import RetryPolicy, current_policy, retry_budget
+from mailersend.serialization import model_json, models_json_array
+
+
+def bulk_response(bulk_email_id: str) -> APIResponse:
+    return APIResponse(
+        data={
+            "message": "The bulk email is being processed.",
+            "bulk_email_id": bulk_email_id,
+        },
+        headers={},
+        status_code=202,
+    )
+
+
+@pytest.fixture
+def client():
+    client = Mock()
+    client.emails.send_bulk.side_effect = lambda chunk: bulk_response(
+        f"bulk-{chunk[0].subject}"
+    )
+    return client
+
+
+class TestBulkSenderChunking:
+    """Test how emails are grouped into bulk requests."""
+
+    def test_chunks_by_count(self, client, make_email):
+        sender = BulkSender(client, max_emails_per_request=3)
+
+        chunks = list(sender.iter_chunks(make_email(i) for i in range(7)))
+
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+
+    def test_chunks_by_serialized_size(self, client, make_email):
+        email_size = len(model_json(make_email(0)))
+        # Room for exactly two emails: "[" + email + "," + email + "]"
+        sender = BulkSender(client, max_request_bytes=2 * email_size + 3)
+
+        chunks = list(sender.iter_chunks(make_email(i) for i in range(5)))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        for chunk in chunks:
+            assert len(models_json_array(chunk)) <= sender.max_request_bytes
+
+    def test_oversized_email_raises_when_iterating(self, client, make_email):
+        sender = BulkSender(client, max_request_bytes=100)
+
+        with pytest.raises(ValidationError):
+            list(sender.iter_chunks([make_email(0, html="x" * 200)]))
+
+    def test_consumes_generator_lazily(self, client, make_email):
+        consumed = []
+
+        def emails():
+            for i in range(10):
+                consumed.append(i)
+                yield make_email(i)
+
+        sender = BulkSender(client, max_emails_per_request=2)
+        chunks = sender.iter_chunks(emails())
+
+        next(chunks)
+        assert consumed == [0, 1, 2]
+
+    def test_rejects_invalid_limits(self, client):
+        with pytest.raises(ValueError):
+            BulkSender(client, max_emails_per_request=0)
+        with pytest.raises(ValueError):
+            BulkSender(client, max_request_bytes=2)
+        with pytest.raises(ValueError):
+            BulkSender(client, max_in_flight=0)
+
+
+class TestBulkSenderSend:
+    """Test concurrent submission of chunks."""
+
+    def test_collects_bulk_ids_in_chunk_order(self, client, make_email):
+        sender = BulkSender(client, max_emails_per_request=2, max_in_flight=3)
+
+        result = sender.send(make_email(i) for i in range(5))
+
+        assert isinstance(result, BulkSendResult)
+        assert result.success
+        assert result.chunk_count == 3
+        assert result.email_count == 5
+        assert result.bulk_email_ids == ["bulk-Email 0", "bulk-Email 2", "bulk-Email 4"]
+        assert client.emails.send_bulk.call_count == 3
+
+    def test_failed_chunk_does_not_abort(self, client, make_email):
+        def send_bulk(chunk):
+            if chunk[0].subject == "Email 2":
+                raise ServerError("boom")
+            return bulk_response(chunk[0].subject)
+
+        client.emails.send_bulk.side_effect = send_bulk
+        sender = BulkSender(client, max_emails_per_request=2)
+
+        result = sender.send(make_email(i) for i in range(6))
+
+        assert not result.success
+        assert result.bulk_email_ids == ["Email 0", "Email 4"]
+        assert len(result.errors) == 1
+        assert result.errors[0].chunk_index == 1
+        assert result.errors[0].email_count == 2
+        assert isinstance(result.errors[0].error, ServerError)
+
+    def test_oversized_email_recorded_and_skipped(self, client, make_email):
+        sender = BulkSender(client, max_request_bytes=1000)
+
+        result = sender.send(
+            [make_email(0), make_email(1, html="x" * 2000), make_email(2)]
+        )
+
+        assert len(result.errors) == 1
+        assert isinstance(result.errors[0].error, ValidationError)
+        assert result.email_count == 3
+        sent = [
+            email.subject
+            for call in client.emails.send_bulk.call_args_list
+            for email in call.args[0]
+        ]
+        assert sent == ["Email 0", "Email 2"]
+
+    def test_bounds_chunks_in_flight(self, client, make_email):
+        lock = threading.Lock()
+        state = {"current": 0, "peak": 0}
+
+        def send_bulk(chunk):
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            time.sleep(0.01)
+            with lock:
+                state["current"] -= 1
+            return bulk_response(chunk[0].subject)
+
+        client.emails.send_bulk.side_effect = send_bulk
+        sender = BulkSender(client, max_emails_per_request=1, max_in_flight=2)
+
+        result = sender.send(make_email(i) for i in range(8))
+
+        assert len(result.bulk_email_ids) == 8
+        assert state["peak"] <= 2
+
+    def test_chunks_are_sent_in_the_callers_context(self, client, make_email):
+        budgets = []
+
+        def send_bulk(chunk):
+            budgets.append(current_policy(RetryPolicy()).max_retries)
+            return bulk_response(chunk[0].subject)
+
+        client.emails.send_bulk.side_effect = send_bulk
+        sender = BulkSender(client, max_emails_per_request=1)
+
+        with retry_budget(max_retries=0):
+            sender.send(make_email(i) for i in range(3))
+
+        assert budgets == [0, 0, 0]
+
+    def test_emails_are_encoded_once(self, monkeypatch, make_email):
+        serializer = EmailRequest.__pydantic_serializer__
+        encoded = []
+
+        class CountingSerializer:
+            def to_json(self, model, **kwargs):
+                encoded.append(model.subject)
+                return serializer.to_json(model, **kwargs)
+
+        monkeypatch.setattr(
+            EmailRequest, "__pydantic_serializer__", CountingSerializer()
+        )
+        bodies = []
+        response = Mock(
+            status_code=202,
+            headers=CaseInsensitiveDict(),
+            content=b'{"bulk_email_id": "bulk-1"}',
+        )
+        client = MailerSendClient(api_key="test-key")
+        client.session.request = Mock(
+            side_effect=lambda data=None, **kwargs: bodies.append(data) or response
+        )
+        emails = [make_email(i) for i in range(5)]
+
+        result = BulkSender(client, max_emails_per_request=2).send(emails)
+
+        assert result.bulk_email_ids == ["bulk-1"] * 3
+        assert sorted(encoded) == sorted(email.subject for email in emails)
+        monkeypatch.undo()
+        assert b"".join(bodies) == b"".join(
+            models_json_array(emails[i : i + 2]) for i in (0, 2, 4)
+        )
+
+
+def status_response(bulk_email_id: str, state: str) -> APIResponse:
+    return APIResponse(
+        data={"data": {"id": bulk_email_id, "state": state}},
+        headers={},
+        status_code=200,
+    )
+
+
+class TestBulkStatusPoller:
+    """Test polling bulk email status with per-job backoff."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch, fake_clock):
+        monkeypatch.setattr("mailersend.bulk.time", fake_clock)
+        return fake_clock
+
+    def scripted_client(self, clock, scripts):
+        """Client whose bulk status follows ``scripts[id]`` (one state per poll)."""
+        client = Mock()
+        polls = []
+        remaining = {key: list(states) for key, states in scripts.items()}
+
+        def get_bulk_status(bulk_email_id):
+            polls.append((clock.now, bulk_email_id))
+            state = remaining[bulk_email_id].pop(0)
+            if isinstance(state, Exception):
+                raise state
+            return status_response(bulk_email_id, state)
+
+        client.emails.get_bulk_status.side_effect = get_bulk_status
+        return client, polls
+
+    def test_yields_in_completion_order(self, clock):
+        client, _ = self.scripted_client(
+            clock,
+            {
+                "slow": ["queued", "processing", "processing", "completed"],
+                "fast": ["queued", "completed"],
+            },
+        )
+        poller = BulkStatusPoller(client, initial_delay=1, max_delay=10)
+
+        results = list(poller.watch(["slow", "fast"]))
+
+        assert [status.bulk_email_id for status in results] == ["fast", "slow"]
+        assert all(status.success for status in results)
+        assert results[1].polls == 4
+
+    def test_backs_off_exponentially_per_job(self, clock):
+        client, polls = self.scripted_client(
+            clock, {"job": ["queued"] * 5 + ["completed"]}
+        )
+        poller = BulkStatusPoller(client, initial_delay=1, max_delay=4, multiplier=2)
+
+        list(poller.watch(["job"]))
+
+        times = [when for when, _ in polls]
+        assert times == [0, 1, 3, 7, 11, 15]
+
+    def test_failed_state_is_terminal(self, clock):
+        client, _ = self.scripted_client(clock, {"job": ["failed"]})
+
+        (status,) = BulkStatusPoller(client).watch(["job"])
+
+        assert status.state == "failed"
+        assert not status.success
+
+    def test_transient_errors_are_retried(self, clock):
+        client, _ = self.scripted_client(
+            clock, {"job": [ServerError("down"), "completed"]}
+        )
+
+        (status,) = BulkStatusPoller(client).watch(["job"])
+
+        assert status.success
+        assert status.polls == 2
+
+    def test_permanent_errors_end_the_job(self, clock):
+        client, _ = self.scripted_client(
+            clock, {"job": [ResourceNotFoundError("missing")]}
+        )
+
+        (status,) = BulkStatusPoller(client).watch(["job"])
+
+        assert isinstance(status.error, ResourceNotFoundError)
+        assert status.state is None
+
+    def test_max_wait_gives_up(self, clock):
+        client, _ = self.scripted_client(clock, {"job": ["queued"] * 10})
+        poller = BulkStatusPoller(client, initial_delay=1, max_delay=1, max_wait=3)
+
+        (status,) = poller.watch(["job"])
+
+        assert status.timed_out
+        assert status.state == "queued"
+        assert status.polls == 4
+
+    def test_duplicate_ids_polled_once(self, clock):
+        client, polls = self.scripted_client(clock, {"job": ["completed"]})
+
+        results = list(BulkStatusPoller(client).watch(["job", "job"]))
+
+        assert len(results) == 1
+        assert len(polls) == 1
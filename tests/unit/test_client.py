@@ -4,7 +4,10 @@ import os
 import pytest
 from unittest.mock import patch
 
+from mailersend import constants
 from mailersend.client import MailerSendClient
+from mailersend.constants import PACKAGE_NAME, __version__
+from mailersend.utils.headers import _base_user_agent, user_agent
 
 
 class TestMailerSendClientInitialization:
@@ -100,3 +103,49 @@ class TestMailerSendClientInitialization:
             assert client.base_url == "https://custom.api.com"
             assert client.timeout == 30
             assert client.debug is True
+
+
+class TestUserAgent:
+    """Test the User-Agent header sent by the client."""
+
+    def test_default_user_agent(self):
+        """Test that the header names the SDK and the platform."""
+        client = MailerSendClient(api_key="test-api-key")
+
+        header = client.session.headers["User-Agent"]
+        assert header.startswith(f"{PACKAGE_NAME}/{__version__} (Python/")
+        assert header == client.user_agent == client.get_debug_info()["user_agent"]
+
+    def test_product_tokens_are_appended(self):
+        """Test that callers can append their own product tokens."""
+        client = MailerSendClient(
+            api_key="test-api-key", user_agent_products=["my-app/1.4", "worker"]
+        )
+
+        assert client.session.headers["User-Agent"] == (
+            f"{user_agent()} my-app/1.4 worker"
+        )
+
+    @pytest.mark.parametrize("token", ["", "my app/1.0", "app/1.0\r\nX-Evil: 1"])
+    def test_invalid_product_tokens_are_rejected(self, token):
+        """Test that tokens that would break the header are refused."""
+        with pytest.raises(ValueError):
+            MailerSendClient(api_key="test-api-key", user_agent_products=[token])
+
+    def test_platform_is_probed_once(self):
+        """Test that the platform is only probed when first needed, then cached."""
+        _base_user_agent.cache_clear()
+        with patch("mailersend.utils.headers.platform") as platform:
+            platform.python_version.return_value = "3.12.0"
+            platform.system.return_value = "Linux"
+            platform.release.return_value = "6.1"
+            platform.python_implementation.return_value = "CPython"
+
+            MailerSendClient(api_key="test-api-key")
+            MailerSendClient(api_key="test-api-key", user_agent_products=["x/1"])
+
+            assert constants.USER_AGENT.endswith(
+                "(Python/3.12.0; OS/Linux 6.1; Impl/CPython)"
+            )
+        assert platform.system.call_count == 1
+        _base_user_agent.cache_clear()
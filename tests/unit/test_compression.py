@@ -0,0 +1,150 @@
+"""Tests for request body compression."""
+
+import asyncio
+import gzip
+import json
+import os
+import zlib
+from unittest.mock import Mock
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from mailersend.client import MailerSendClient
+from mailersend.compression import RequestCompression
+from mailersend.middleware import APIRequest
+
+BIG_BODY = {"html": "<p>Hello {{ name }}</p>" * 2000}
+
+
+def make_request(body, **headers):
+    return APIRequest(
+        "POST",
+        "https://api/bulk-email",
+        "bulk-email",
+        None,
+        body,
+        CaseInsensitiveDict(headers),
+    )
+
+
+def make_response(status_code=202):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict()
+    return response
+
+
+class TestRequestCompression:
+    def test_gzip(self):
+        request = RequestCompression().on_request(make_request(BIG_BODY))
+
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(request.body)) == BIG_BODY
+
+    def test_deflate(self):
+        layer = RequestCompression(encoding="deflate", level=9)
+
+        request = layer.on_request(make_request(BIG_BODY))
+
+        assert request.headers["Content-Encoding"] == "deflate"
+        assert json.loads(zlib.decompress(request.body)) == BIG_BODY
+
+    def test_small_bodies_are_left_alone(self):
+        body = b'{"subject": "Hi"}'
+
+        request = RequestCompression(threshold=1024).on_request(make_request(body))
+
+        assert request.body == body
+        assert "Content-Encoding" not in request.headers
+
+    def test_incompressible_bodies_are_left_alone(self):
+        body = os.urandom(64 * 1024)
+        layer = RequestCompression()
+
+        request = layer.on_request(make_request(body))
+
+        assert request.body == body
+        assert layer.stats()["requests_compressed"] == 0
+
+    def test_encoded_bodies_are_not_compressed_twice(self):
+        body = b"x" * 100_000
+
+        request = RequestCompression().on_request(
+            make_request(body, **{"Content-Encoding": "br"})
+        )
+
+        assert request.body == body
+
+    def test_shared_headers_are_not_modified(self):
+        headers = CaseInsensitiveDict()
+        request = make_request(BIG_BODY)
+        request.headers = headers
+
+        RequestCompression().on_request(request)
+
+        assert "Content-Encoding" not in headers
+
+    def test_stats(self):
+        layer = RequestCompression(threshold=0)
+
+        assert layer.stats()["ratio"] is None
+        request = layer.on_request(make_request(BIG_BODY))
+
+        stats = layer.stats()
+        assert stats["requests_compressed"] == 1
+        assert stats["bytes_after"] == len(request.body)
+        assert stats["ratio"] == round(stats["bytes_after"] / stats["bytes_before"], 4)
+        assert stats["ratio"] < 0.1
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"encoding": "br"}, {"level": 0}, {"threshold": -1}]
+    )
+    def test_rejects_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            RequestCompression(**kwargs)
+
+
+class TestClientCompression:
+    def test_sync_client_sends_compressed_body(self, monkeypatch):
+        monkeypatch.setattr("mailersend.client.time", Mock())
+        client = MailerSendClient(
+            api_key="test-key", middleware=[RequestCompression(threshold=1024)]
+        )
+        client.session.request = Mock(side_effect=[make_response(503), make_response()])
+
+        client.request("PUT", "templates/abc123", body=BIG_BODY)
+
+        for call in client.session.request.call_args_list:
+            assert call.kwargs["headers"]["Content-Encoding"] == "gzip"
+            assert json.loads(gzip.decompress(call.kwargs["data"])) == BIG_BODY
+        compression = client.get_debug_info()["compression"]
+        assert compression["requests_compressed"] == 2
+        assert compression["ratio"] < 0.1
+
+    def test_debug_info_without_compression(self):
+        client = MailerSendClient(api_key="test-key")
+
+        assert client.get_debug_info()["compression"] is None
+
+    def test_async_client_sends_compressed_body(self):
+        httpx = pytest.importorskip("httpx")
+        from mailersend.async_client import AsyncMailerSendClient
+
+        received = []
+
+        def handler(request):
+            received.append(request)
+            return httpx.Response(202, json={})
+
+        client = AsyncMailerSendClient(
+            api_key="test-key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            middleware=[RequestCompression(encoding="deflate")],
+        )
+
+        asyncio.run(client.request("POST", "bulk-email", body=BIG_BODY))
+
+        (request,) = received
+        assert request.headers["Content-Encoding"] == "deflate"
+        assert json.loads(zlib.decompress(request.content)) == BIG_BODY
@@ -5,6 +5,7 @@ import os
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
+from mailersend.attachments import AttachmentFile
 from mailersend.builders.email import EmailBuilder
 from mailersend.models.email import (
     EmailRequest,
@@ -322,8 +323,9 @@ class TestEmailBuilder:
             attachment = email.attachments[0]
             assert attachment.filename == "custom_name.txt"
             assert attachment.disposition == "attachment"
-            # Verify content is base64 encoded
-            decoded_content = base64.b64decode(attachment.content)
+            # The file is referenced and base64 encoded when sent
+            assert isinstance(attachment.content, AttachmentFile)
+            decoded_content = base64.b64decode(attachment.content.read_base64())
             assert decoded_content == file_content
 
     def test_attach_file_default_filename(self):
@@ -0,0 +1,138 @@
+"""Tests for the Email resource."""
+
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from mailersend.client import MailerSendClient
+from mailersend.exceptions import BadRequestError
+from mailersend.rate_limit import RateLimiter
+from mailersend.resources.email import EmailSendResult
+from mailersend.retry import RetryPolicy, retry_budget
+
+
+def make_response(status_code=202, message_id=None, body=b""):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(
+        {"x-message-id": message_id} if message_id else {}
+    )
+    response.content = body
+    return response
+
+
+@pytest.fixture
+def client():
+    return MailerSendClient(api_key="test-key", retry_policy=RetryPolicy(max_retries=0))
+
+
+def answer_by_subject(delay=0.0):
+    """Session stub answering each email with ``msg-<subject index>``."""
+
+    def request(method, url, data=None, **kwargs):
+        subject = json.loads(data)["subject"]
+        time.sleep(delay)
+        if subject == "Email 2":
+            error = json.dumps({"message": "The to field is invalid."}).encode()
+            return make_response(422, body=error)
+        return make_response(message_id=f"msg-{subject.split()[-1]}")
+
+    return request
+
+
+class TestSendMany:
+    def test_streams_a_result_per_email(self, client, make_email):
+        client.session.request = Mock(side_effect=answer_by_subject())
+
+        results = list(client.emails.send_many(make_email(i) for i in range(5)))
+
+        assert sorted(result.index for result in results) == [0, 1, 2, 3, 4]
+        by_index = {result.index: result for result in results}
+        assert by_index[0].message_id == "msg-0"
+        assert by_index[4].response.status_code == 202
+        assert by_index[4].email.subject == "Email 4"
+
+    def test_failures_are_collected(self, client, make_email):
+        client.session.request = Mock(side_effect=answer_by_subject())
+
+        results = list(client.emails.send_many(make_email(i) for i in range(4)))
+
+        failed = [result for result in results if not result.success]
+        assert [result.index for result in failed] == [2]
+        assert isinstance(failed[0].error, BadRequestError)
+        assert failed[0].message_id is None
+        assert sum(result.success for result in results) == 3
+
+    def test_bounds_requests_in_flight(self, client, make_email):
+        lock = threading.Lock()
+        state = {"current": 0, "peak": 0}
+        answer = answer_by_subject(delay=0.01)
+
+        def request(*args, **kwargs):
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            try:
+                return answer(*args, **kwargs)
+            finally:
+                with lock:
+                    state["current"] -= 1
+
+        client.session.request = Mock(side_effect=request)
+
+        results = list(
+            client.emails.send_many((make_email(i) for i in range(12)), max_in_flight=3)
+        )
+
+        assert len(results) == 12
+        assert 1 < state["peak"] <= 3
+
+    def test_consumes_emails_lazily(self, client, make_email):
+        client.session.request = Mock(side_effect=answer_by_subject())
+        consumed = []
+
+        def emails():
+            for i in range(100):
+                consumed.append(i)
+                yield make_email(i)
+
+        results = client.emails.send_many(emails(), max_in_flight=2)
+        next(results)
+        results.close()
+
+        assert len(consumed) <= 3
+
+    def test_requests_are_rate_limited(self, client, make_email):
+        client.rate_limiter = RateLimiter(rate=1000, burst=1)
+        client.rate_limiter.acquire = Mock(wraps=client.rate_limiter.acquire)
+        client.session.request = Mock(side_effect=answer_by_subject())
+
+        list(client.emails.send_many(make_email(i) for i in range(4)))
+
+        assert client.rate_limiter.acquire.call_count == 4
+
+    def test_retry_budget_applies_to_every_send(self, make_email):
+        client = MailerSendClient(
+            api_key="test-key", retry_policy=RetryPolicy(base_delay=0, max_delay=0)
+        )
+        client.session.request = Mock(return_value=make_response(429))
+
+        with retry_budget(max_retries=0):
+            results = list(client.emails.send_many(make_email(i) for i in range(3)))
+
+        assert not any(result.success for result in results)
+        assert client.session.request.call_count == 3
+
+    def test_rejects_invalid_window(self, client, make_email):
+        with pytest.raises(ValueError):
+            next(client.emails.send_many([make_email()], max_in_flight=0))
+
+    def test_result_repr(self, make_email):
+        result = EmailSendResult(3, make_email(), error=BadRequestError("bad"))
+
+        assert "index=3" in repr(result)
+        assert not result.success
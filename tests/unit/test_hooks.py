@@ -0,0 +1,293 @@
+"""Tests for request hooks and the in-process metrics collector."""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from mailersend.client import MailerSendClient
+from mailersend.exceptions import MailerSendError
+from mailersend.hooks import RequestEvent, RequestHooks, endpoint_template
+from mailersend.metrics import MetricsCollector
+from mailersend.retry import RetryPolicy
+from mailersend.serialization import model_json
+
+NO_WAIT = RetryPolicy(base_delay=0, max_delay=0)
+
+
+class Recorder(RequestHooks):
+    def __init__(self):
+        self.calls = []
+
+    def on_request_start(self, event):
+        self.calls.append(("start", event.endpoint, event.attempt))
+
+    def on_response(self, event):
+        self.calls.append(("response", event.status_code, event.attempt))
+
+    def on_error(self, event):
+        self.calls.append(("error", type(event.error).__name__, event.attempt))
+
+    def on_retry(self, event):
+        self.calls.append(("retry", event.retry_delay, event.attempt))
+
+
+def make_response(status_code=200, sent=b"", received=b"{}", **header_values):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(header_values)
+    response.request.body = sent
+    response.content = received
+    response.json.return_value = {"message": "error"}
+    return response
+
+
+def make_client(responses, **kwargs):
+    kwargs.setdefault("retry_policy", NO_WAIT)
+    client = MailerSendClient(api_key="test-key", **kwargs)
+    client.session.request = Mock(side_effect=responses)
+    return client
+
+
+class TestEndpointTemplate:
+    @pytest.mark.parametrize(
+        "path,template",
+        [
+            ("email", "email"),
+            ("/bulk-email/614470d1588b866d0454f3e2", "bulk-email/{id}"),
+            ("domains/7nxe3yjmeq28vp0k/smtp-users", "domains/{id}/smtp-users"),
+            ("identities/email/sender@example.com", "identities/email/{id}"),
+            (
+                "dmarc-monitoring/abc123/report/1.2.3.4",
+                "dmarc-monitoring/{id}/report/{id}",
+            ),
+            ("suppressions/on-hold-list", "suppressions/on-hold-list"),
+        ],
+    )
+    def test_parameters_become_placeholders(self, path, template):
+        assert endpoint_template(path) == template
+
+
+class TestClientHooks:
+    def test_events_for_a_retried_call(self):
+        hooks = Recorder()
+        client = make_client([make_response(503), make_response(200)], hooks=[hooks])
+
+        client.request("GET", "domains/abc123")
+
+        assert hooks.calls == [
+            ("start", "domains/{id}", 0),
+            ("response", 503, 0),
+            ("retry", 0, 0),
+            ("start", "domains/{id}", 1),
+            ("response", 200, 1),
+        ]
+
+    def test_network_errors_are_reported(self):
+        hooks = Recorder()
+        client = make_client(
+            [requests.ConnectionError("boom")],
+            hooks=[hooks],
+            retry_policy=NO_WAIT.replace(max_retries=0),
+        )
+
+        with pytest.raises(MailerSendError):
+            client.request("GET", "domains")
+
+        assert hooks.calls == [
+            ("start", "domains", 0),
+            ("error", "ConnectionError", 0),
+        ]
+
+    def test_event_describes_the_attempt(self):
+        events = []
+
+        class Capture(RequestHooks):
+            def on_response(self, event):
+                events.append(event)
+
+        client = make_client(
+            [
+                make_response(
+                    202,
+                    sent=b'{"a": 1}',
+                    received=b"",
+                    **{"x-apiquota-remaining": "99"},
+                )
+            ],
+            hooks=[Capture()],
+        )
+
+        client.request("POST", "email", body={"a": 1})
+
+        (event,) = events
+        assert isinstance(event, RequestEvent)
+        assert (event.method, event.endpoint) == ("POST", "email")
+        # Size of the body as encoded and sent
+        assert event.bytes_sent == len(b'{"a":1}')
+        assert event.bytes_received == 0
+        assert event.quota_remaining == 99
+        assert event.duration >= 0
+        assert event.request_id
+
+    def test_failing_hook_does_not_break_the_request(self):
+        broken = Mock(spec=RequestHooks)
+        broken.on_request_start.side_effect = RuntimeError("hook bug")
+        hooks = Recorder()
+        client = make_client([make_response(200)], hooks=[broken, hooks])
+
+        response = client.request("GET", "domains")
+
+        assert response.status_code == 200
+        assert ("response", 200, 0) in hooks.calls
+
+    def test_no_events_without_hooks(self, monkeypatch):
+        monkeypatch.setattr(
+            "mailersend.client.RequestEvent", Mock(side_effect=AssertionError)
+        )
+        client = make_client([make_response(200)])
+
+        client.request("GET", "domains")
+
+
+class TestMetricsCollector:
+    def test_aggregates_per_endpoint(self):
+        metrics = MetricsCollector(latency_buckets=(1.0, 5.0))
+        client = make_client(
+            [
+                make_response(429, sent=b"", received=b"{}", **{"retry-after": "0"}),
+                make_response(200, received=b'{"data": []}'),
+                make_response(200, received=b"{}", **{"x-apiquota-remaining": "41"}),
+            ],
+            hooks=[metrics],
+        )
+
+        client.request("GET", "domains/abc123")
+        client.request("GET", "domains/def456")
+
+        snapshot = metrics.snapshot()
+        endpoint = snapshot["endpoints"]["GET domains/{id}"]
+        assert endpoint["requests"] == 3
+        assert endpoint["retries"] == 1
+        assert endpoint["status_codes"] == {"200": 2, "429": 1}
+        assert endpoint["bytes_received"] == 16
+        assert endpoint["latency_seconds"]["count"] == 3
+        assert endpoint["latency_seconds"]["buckets"]["+Inf"] == 3
+        assert endpoint["quota_remaining"] == 41
+        assert snapshot["quota_remaining"] == 41
+
+    def test_prometheus_exposition(self):
+        metrics = MetricsCollector()
+        client = make_client([make_response(202)], hooks=[metrics])
+
+        client.request("POST", "email", body={})
+
+        text = metrics.to_prometheus()
+        assert "# TYPE mailersend_requests_total counter" in text
+        assert 'mailersend_requests_total{method="POST",endpoint="email"} 1' in text
+        assert (
+            'mailersend_responses_total{method="POST",endpoint="email",status="202"} 1'
+            in text
+        )
+        assert (
+            'mailersend_request_duration_seconds_bucket{method="POST",'
+            'endpoint="email",le="+Inf"} 1' in text
+        )
+        assert "mailersend_quota_remaining" not in text
+
+    def test_reset(self):
+        metrics = MetricsCollector()
+        client = make_client([make_response(200)], hooks=[metrics])
+        client.request("GET", "domains")
+
+        metrics.reset()
+
+        assert metrics.snapshot() == {"quota_remaining": None, "endpoints": {}}
+
+
+class TestAsyncClientHooks:
+    def test_async_client_reports_events(self):
+        httpx = pytest.importorskip("httpx")
+        from mailersend.async_client import AsyncMailerSendClient
+
+        responses = iter([503, 200])
+
+        def handler(request):
+            return httpx.Response(next(responses), json={"data": []})
+
+        hooks = Recorder()
+        metrics = MetricsCollector()
+        client = AsyncMailerSendClient(
+            api_key="test-key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            retry_policy=NO_WAIT,
+            hooks=[hooks, metrics],
+        )
+
+        asyncio.run(client.request("GET", "templates/xyz789"))
+
+        assert [call[0] for call in hooks.calls] == [
+            "start",
+            "response",
+            "retry",
+            "start",
+            "response",
+        ]
+        endpoint = metrics.snapshot()["endpoints"]["GET templates/{id}"]
+        assert endpoint["status_codes"] == {"200": 1, "503": 1}
+        assert endpoint["bytes_received"] == 2 * len(b'{"data":[]}')
+
+    def test_async_streamed_body_over_a_socket(self, tmp_path):
+        # httpx.MockTransport reads streamed bodies before the hooks run, so
+        # only a real connection shows what the hooks can access
+        httpx = pytest.importorskip("httpx")
+        from mailersend.async_client import AsyncMailerSendClient
+        from mailersend.builders.email import EmailBuilder
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                self.send_response(202)
+                self.send_header("x-message-id", "msg-1")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True).start()
+        attachment = tmp_path / "report.pdf"
+        attachment.write_bytes(b"%PDF" * 1000)
+        email = (
+            EmailBuilder()
+            .from_email("sender@example.com")
+            .to("recipient@example.com")
+            .subject("Report")
+            .text("Attached")
+            .attach_file(attachment)
+            .build()
+        )
+        metrics = MetricsCollector()
+
+        async def send():
+            async with AsyncMailerSendClient(
+                api_key="test-key",
+                base_url=f"http://127.0.0.1:{server.server_port}/v1/",
+                hooks=[metrics],
+            ) as client:
+                return await client.emails.send(email)
+
+        try:
+            response = asyncio.run(send())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert response["id"] == "msg-1"
+        endpoint = metrics.snapshot()["endpoints"]["POST email"]
+        assert endpoint["bytes_sent"] == len(model_json(email))
@@ -0,0 +1,159 @@
+"""Tests for idempotency keys on send requests."""
+
+from unittest.mock import Mock
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from mailersend.client import MailerSendClient
+from mailersend.exceptions import BadRequestError, ServerError
+from mailersend.idempotency import (
+    IdempotencyStore,
+    idempotency_key_for,
+    resolve_idempotency_key,
+)
+from mailersend.retry import RetryPolicy
+
+
+def make_response(status_code=202, **header_values):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(header_values)
+    response.json.return_value = {"message": "error"}
+    return response
+
+
+class TestIdempotencyKeys:
+    def test_key_is_stable_for_the_same_content(self):
+        first = idempotency_key_for("POST", "email", {"b": 1, "a": [1, 2]})
+        second = idempotency_key_for("post", "/email", {"a": [1, 2], "b": 1})
+
+        assert first == second
+        assert first.startswith("ms-")
+
+    def test_key_differs_for_different_content(self):
+        assert idempotency_key_for("POST", "email", {"a": 1}) != idempotency_key_for(
+            "POST", "email", {"a": 2}
+        )
+
+    @pytest.mark.parametrize("path", ["email", "bulk-email", "sms"])
+    def test_send_requests_get_a_key(self, path):
+        assert resolve_idempotency_key("POST", path, {"a": 1}, None) is not None
+
+    @pytest.mark.parametrize(
+        "method,path", [("GET", "email"), ("POST", "domains"), ("DELETE", "sms")]
+    )
+    def test_other_requests_get_no_key(self, method, path):
+        assert resolve_idempotency_key(method, path, {"a": 1}, None) is None
+
+    def test_caller_supplied_key_wins(self):
+        headers = {"idempotency-key": "order-42"}
+
+        assert resolve_idempotency_key("POST", "email", {}, headers) == "order-42"
+        assert resolve_idempotency_key("GET", "domains", None, headers) == "order-42"
+
+
+class TestIdempotencyStore:
+    @pytest.fixture
+    def clock(self, monkeypatch, fake_clock):
+        monkeypatch.setattr("mailersend.idempotency.time", fake_clock)
+        return fake_clock
+
+    def test_entries_expire(self, clock):
+        store = IdempotencyStore(ttl=10)
+        store.put("key", "response")
+
+        clock.now = 9
+        assert store.get("key") == "response"
+        clock.now = 10
+        assert store.get("key") is None
+        assert len(store) == 0
+
+    def test_oldest_entries_are_evicted(self, clock):
+        store = IdempotencyStore(max_size=2)
+        for key in ("a", "b", "c"):
+            store.put(key, key)
+
+        assert store.get("a") is None
+        assert store.get("b") == "b"
+        assert store.get("c") == "c"
+
+    def test_discard(self, clock):
+        store = IdempotencyStore()
+        store.put("key", "response")
+        store.discard("key")
+
+        assert store.get("key") is None
+
+
+class TestClientIdempotency:
+    def make_client(self, responses, **kwargs):
+        client = MailerSendClient(api_key="test-key", **kwargs)
+        client.session.request = Mock(side_effect=responses)
+        return client
+
+    def sent_keys(self, client):
+        return [
+            call.kwargs["headers"].get("Idempotency-Key")
+            for call in client.session.request.call_args_list
+        ]
+
+    def test_key_is_stable_across_retries(self, monkeypatch, make_email):
+        monkeypatch.setattr("mailersend.client.time", Mock())
+        client = self.make_client(
+            [make_response(503), make_response(202)],
+            retry_policy=RetryPolicy(retry_keyed_requests=True),
+        )
+
+        client.emails.send(make_email())
+
+        keys = self.sent_keys(client)
+        assert len(keys) == 2
+        assert keys[0] is not None and keys[0] == keys[1]
+
+    def test_keyed_send_is_not_retried_by_default(self, make_email):
+        client = self.make_client([make_response(503), make_response(202)])
+
+        with pytest.raises(ServerError):
+            client.emails.send(make_email())
+        assert client.session.request.call_count == 1
+
+    def test_duplicate_submission_is_answered_from_store(self, make_email):
+        client = self.make_client(
+            [make_response(202, **{"x-message-id": "msg-1"})] * 2,
+            idempotency_store=IdempotencyStore(),
+        )
+
+        first = client.emails.send(make_email())
+        second = client.emails.send(make_email())
+        client.emails.send(make_email(subject="Other"))
+
+        assert first["id"] == second["id"] == "msg-1"
+        assert client.session.request.call_count == 2
+
+    def test_failed_send_is_not_stored(self, make_email):
+        store = IdempotencyStore()
+        client = self.make_client(
+            [make_response(422), make_response(202)], idempotency_store=store
+        )
+
+        with pytest.raises(BadRequestError):
+            client.emails.send(make_email())
+        client.emails.send(make_email())
+
+        assert client.session.request.call_count == 2
+        assert len(store) == 1
+
+    def test_explicit_key(self, make_email):
+        client = self.make_client([make_response(202)])
+
+        client.emails.send(make_email(), idempotency_key="welcome-42")
+
+        assert self.sent_keys(client) == ["welcome-42"]
+
+    def test_reads_carry_no_key(self):
+        client = self.make_client([make_response(200)])
+
+        client.request("GET", "domains")
+
+        assert self.sent_keys(client) == [None]
@@ -0,0 +1,108 @@
+"""Tests for lazy loading of builders, resources and models."""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+from mailersend.client import LazyResource, MailerSendClient
+from mailersend.resources.domains import Domains
+
+PACKAGES = [
+    "mailersend",
+    "mailersend.builders",
+    "mailersend.models",
+    "mailersend.resources",
+    "mailersend.utils",
+]
+
+
+def loaded_modules(code):
+    """Run ``code`` in a fresh interpreter and return the SDK modules it loaded."""
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            code + "\nimport sys; print(' '.join(sorted(sys.modules)))",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return {name for name in output.split() if name.startswith("mailersend.")}
+
+
+def submodules(modules, package):
+    prefix = f"mailersend.{package}."
+    return {name[len(prefix) :] for name in modules if name.startswith(prefix)}
+
+
+class TestColdStart:
+    def test_import_loads_no_builders_resources_or_models(self):
+        modules = loaded_modules("import mailersend")
+
+        assert modules <= {"mailersend.utils", "mailersend.utils.lazy"}
+
+    def test_sending_email_loads_only_what_it_needs(self):
+        modules = loaded_modules(
+            "from mailersend import MailerSendClient\n"
+            "MailerSendClient(api_key='key').emails"
+        )
+
+        assert submodules(modules, "resources") == {"base", "email"}
+        assert submodules(modules, "models") == {"base", "email"}
+        assert submodules(modules, "builders") == set()
+
+    def test_builder_import_loads_only_its_module(self):
+        modules = loaded_modules("from mailersend import EmailBuilder")
+
+        assert submodules(modules, "builders") == {"email"}
+        assert submodules(modules, "resources") == set()
+
+
+class TestLazyExports:
+    @pytest.mark.parametrize("package", PACKAGES)
+    def test_every_export_resolves(self, package):
+        module = importlib.import_module(package)
+
+        for name in module.__all__:
+            assert getattr(module, name) is not None
+        assert set(module.__all__) <= set(dir(module))
+
+    def test_aliases(self):
+        import mailersend
+        from mailersend.models.activity import Activity
+
+        assert mailersend.ActivityModel is Activity
+
+    def test_unknown_names_raise_attribute_error(self):
+        import mailersend
+
+        with pytest.raises(AttributeError):
+            mailersend.NoSuchThing
+
+
+class TestLazyResources:
+    def test_resources_are_built_once_on_access(self):
+        client = MailerSendClient(api_key="test-key")
+
+        assert "domains" not in vars(client)
+        domains = client.domains
+
+        assert isinstance(domains, Domains)
+        assert domains.client is client
+        assert client.domains is domains
+        assert isinstance(MailerSendClient.domains, LazyResource)
+
+    def test_async_client_wraps_resources(self):
+        pytest.importorskip("httpx")
+        from mailersend import async_client
+        from mailersend.async_client import AsyncMailerSendClient
+
+        client = AsyncMailerSendClient(api_key="test-key")
+
+        assert isinstance(client.emails, async_client.AsyncEmail)
+        assert isinstance(client.domains, async_client.AsyncResource)
+        assert client.domains.RESOURCE_CLASS is Domains
+        assert type(client.domains) is async_client.AsyncDomains
@@ -0,0 +1,276 @@
+"""Tests for request logging context."""
+
+import asyncio
+import logging
+import threading
+from unittest.mock import Mock
+
+from requests.structures import CaseInsensitiveDict
+
+from mailersend.logging import (
+    DebugFilter,
+    RequestLogger,
+    LOG_MAX_STRING_LENGTH,
+    SensitiveDataFormatter,
+    _is_sensitive_key,
+    current_request,
+    redact,
+)
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.addFilter(DebugFilter())
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def make_logger(name):
+    logger = logging.getLogger(name)
+    logger.handlers = []
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    handler = RecordingHandler()
+    logger.addHandler(handler)
+    return logger, handler
+
+
+class TestRequestContext:
+    def test_context_lasts_until_end_request(self):
+        logger, _ = make_logger("mailersend.test.context")
+        request_logger = RequestLogger(logger)
+
+        request_id = request_logger.start_request("GET", "https://api/domains")
+
+        assert current_request().request_id == request_id
+        assert request_logger.request_id == request_id
+        request_logger.end_request()
+        assert current_request() is None
+        assert request_logger.request_id is None
+
+    def test_filter_reads_the_current_context(self):
+        logger, handler = make_logger("mailersend.test.filter")
+        request_logger = RequestLogger(logger)
+
+        request_id = request_logger.start_request("GET", "https://api/domains")
+        logger.info("inside")
+        request_logger.end_request()
+        logger.info("outside")
+
+        assert [r.request_id for r in handler.records] == [
+            request_id,
+            request_id,
+            "unknown",
+        ]
+        assert not hasattr(handler.filters[0], "_current_request_id")
+
+    def test_threads_keep_their_own_context(self):
+        logger, handler = make_logger("mailersend.test.threads")
+        request_logger = RequestLogger(logger)
+        started = threading.Barrier(4)
+        seen = {}
+
+        def call(n):
+            request_id = request_logger.start_request("GET", f"https://api/{n}")
+            started.wait()
+            logger.info(f"call {n}")
+            seen[n] = (request_id, request_logger.request_id)
+            request_logger.end_request()
+
+        threads = [threading.Thread(target=call, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(started_id == current for started_id, current in seen.values())
+        assert len({started_id for started_id, _ in seen.values()}) == 4
+        for record in handler.records:
+            if record.msg.startswith("call "):
+                assert record.request_id == seen[int(record.msg[5:])][0]
+
+    def test_tasks_keep_their_own_context(self):
+        logger, _ = make_logger("mailersend.test.tasks")
+        request_logger = RequestLogger(logger)
+
+        async def call(n):
+            request_id = request_logger.start_request("GET", f"https://api/{n}")
+            await asyncio.sleep(0)
+            try:
+                return request_id, request_logger.request_id
+            finally:
+                request_logger.end_request()
+
+        async def main():
+            return await asyncio.gather(*(call(n) for n in range(4)))
+
+        results = asyncio.run(main())
+
+        assert all(started_id == current for started_id, current in results)
+        assert len({started_id for started_id, _ in results}) == 4
+
+
+class TestLoggingCost:
+    def make_response(self):
+        response = Mock()
+        response.status_code = 202
+        response.headers = CaseInsensitiveDict({"x-request-id": "abc"})
+        response.json.return_value = {"data": []}
+        return response
+
+    def test_nothing_is_formatted_when_disabled(self, monkeypatch):
+        logger, handler = make_logger("mailersend.test.disabled")
+        logger.setLevel(logging.WARNING)
+        dumps = Mock(side_effect=AssertionError("serialized while disabled"))
+        redact = Mock(side_effect=AssertionError("sanitized while disabled"))
+        monkeypatch.setattr("mailersend.logging.json.dumps", dumps)
+        monkeypatch.setattr("mailersend.logging.redact", redact)
+        request_logger = RequestLogger(logger)
+        response = self.make_response()
+
+        request_logger.start_request("POST", "https://api/email", {"a": 1}, {"b": 2})
+        request_logger.log_response(response)
+        request_logger.end_request()
+
+        assert handler.records == []
+        response.json.assert_not_called()
+
+    def test_debug_logs_sanitized_body(self):
+        logger, handler = make_logger("mailersend.test.debug")
+        logger.setLevel(logging.DEBUG)
+        request_logger = RequestLogger(logger)
+
+        request_logger.start_request(
+            "POST", "https://api/email", body={"api_key": "secret", "to": "a@b.c"}
+        )
+        request_logger.log_response(self.make_response())
+        request_logger.end_request()
+
+        messages = [record.getMessage() for record in handler.records]
+        assert any("a@b.c" in message for message in messages)
+        assert not any("secret" in message for message in messages)
+        assert any(message.startswith("📥 Response body") for message in messages)
+
+    def test_formatter_sanitizes_a_lone_dict_argument(self):
+        record = logging.LogRecord(
+            "mailersend",
+            logging.DEBUG,
+            __file__,
+            1,
+            "Payload: %s",
+            ({"api_key": "secret", "subject": "Hi"},),
+            None,
+        )
+
+        message = SensitiveDataFormatter("%(message)s").format(record)
+
+        assert "secret" not in message
+        assert "Hi" in message
+
+    def test_formatter_keeps_large_rendered_bodies(self):
+        logger, handler = make_logger("mailersend.test.large")
+        logger.setLevel(logging.DEBUG)
+        handler.setFormatter(SensitiveDataFormatter("%(message)s"))
+        request_logger = RequestLogger(logger)
+        recipients = [{"email": f"user{i}@example.com"} for i in range(30)]
+
+        request_logger.start_request(
+            "POST",
+            "https://api/email",
+            body={"from": {"email": "a@b.c"}, "to": recipients, "api_key": "secret"},
+        )
+        request_logger.end_request()
+
+        (body,) = [
+            handler.format(record)
+            for record in handler.records
+            if record.msg.startswith("📦")
+        ]
+        assert "truncated" not in body
+        assert "user29@example.com" in body
+        assert "secret" not in body
+
+    def test_formatter_masks_tokens_in_text_arguments(self):
+        record = logging.LogRecord(
+            "mailersend",
+            logging.DEBUG,
+            __file__,
+            1,
+            "Headers: %s",
+            ("Authorization: Bearer abc123 " + "x" * 2000,),
+            None,
+        )
+
+        message = SensitiveDataFormatter("%(message)s").format(record)
+
+        assert "abc123" not in message
+        assert len(message) > 2000
+
+
+class TestRedact:
+    def test_sensitive_keys_are_redacted_at_any_depth(self):
+        data = {
+            "Authorization": "Bearer abc",
+            "personalization": [{"data": {"api_key": "k", "name": "Ann"}}],
+            "settings": ({"password": "p"},),
+        }
+
+        assert redact(data) == {
+            "Authorization": "[REDACTED]",
+            "personalization": [{"data": {"api_key": "[REDACTED]", "name": "Ann"}}],
+            "settings": [{"password": "[REDACTED]"}],
+        }
+
+    def test_secrets_in_text_are_masked(self):
+        text = 'header Bearer abc.def and {"api_key": "xyz"}'
+
+        assert redact(text) == (
+            'header Bearer [REDACTED] and {"api_key": "[REDACTED]"}'
+        )
+
+    def test_large_base64_content_is_truncated(self):
+        content = "QUJD" * 1_000_000
+        attachment = {"filename": "big.pdf", "content": content}
+
+        logged = redact({"attachments": [attachment]})["attachments"][0]
+
+        assert logged["filename"] == "big.pdf"
+        assert len(logged["content"]) < 200
+        assert logged["content"].startswith(content[:64])
+        assert "base64 4000000 chars truncated" in logged["content"]
+
+    def test_strings_up_to_the_limit_are_kept(self):
+        text = "x" * LOG_MAX_STRING_LENGTH
+
+        assert redact(text) == text
+
+    def test_long_text_is_kept(self):
+        email = {
+            "html": "<p>Hello {{ name }}</p>" * 1000,
+            "text": "Hello " * 1000,
+            "personalization": [{"data": {"bio": "word " * 1000}}],
+        }
+
+        assert redact(email) == email
+
+    def test_bytes_are_summarized(self):
+        assert redact({"body": b"\x00" * 10}) == {"body": "[10 bytes]"}
+
+    def test_key_classification_is_cached(self):
+        _is_sensitive_key.cache_clear()
+
+        redact([{"subject": "a", "token": "b"}] * 100)
+
+        info = _is_sensitive_key.cache_info()
+        assert info.misses == 2
+        assert info.hits == 198
+
+    def test_original_is_not_modified(self):
+        data = {"token": "t", "nested": {"secret": "s"}}
+
+        redact(data)
+
+        assert data == {"token": "t", "nested": {"secret": "s"}}
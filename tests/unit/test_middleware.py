@@ -0,0 +1,172 @@
+"""Tests for the request middleware pipeline."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from mailersend.client import MailerSendClient
+from mailersend.middleware import APIRequest, Middleware, MiddlewareChain
+
+
+class Tag(Middleware):
+    """Appends its name to a header, and to a list on the way back."""
+
+    def __init__(self, name, seen):
+        self.name = name
+        self.seen = seen
+
+    def on_request(self, request):
+        request.headers["X-Layers"] = request.headers.get("X-Layers", "") + self.name
+        return request
+
+    def on_response(self, request, response):
+        self.seen.append(self.name)
+        return response
+
+
+class ShortCircuit(Middleware):
+    def __init__(self, response):
+        self.response = response
+
+    def __call__(self, request, call_next):
+        return self.response
+
+    async def call_async(self, request, call_next):
+        return self.response
+
+
+def make_response(status_code=200):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict()
+    return response
+
+
+def make_client(**kwargs):
+    client = MailerSendClient(api_key="test-key", **kwargs)
+    client.session.request = Mock(return_value=make_response())
+    return client
+
+
+class TestMiddlewareChain:
+    def test_layers_run_in_order(self):
+        seen = []
+        chain = MiddlewareChain([Tag("a", seen), Tag("b", seen)])
+        send = Mock(return_value="response")
+
+        result = chain.handler(send)(APIRequest("GET", "url", "domains"))
+
+        assert result == "response"
+        assert send.call_args.args[0].headers["X-Layers"] == "ab"
+        assert seen == ["b", "a"]
+
+    def test_add_before_and_after(self):
+        chain = MiddlewareChain([Tag("a", []), Tag("c", [])])
+
+        chain.add(Tag("b", []), after="a")
+        chain.add(Tag("z", []), name="first", before="a")
+
+        assert chain.names() == ["first", "a", "b", "c"]
+
+    def test_move_and_remove(self):
+        layers = [Tag(name, []) for name in "abc"]
+        chain = MiddlewareChain(layers)
+
+        chain.move("c", before="a")
+        removed = chain.remove("b")
+
+        assert chain.names() == ["c", "a"]
+        assert removed is layers[1]
+        assert "b" not in chain
+        assert chain.get("a") is layers[0]
+
+    def test_invalid_changes(self):
+        chain = MiddlewareChain([Tag("a", [])])
+
+        with pytest.raises(ValueError):
+            chain.add(Tag("a", []))
+        with pytest.raises(ValueError):
+            chain.add(Tag("b", []), before="missing")
+        with pytest.raises(KeyError):
+            chain.remove("missing")
+
+    def test_pipeline_is_rebuilt_after_changes(self):
+        seen = []
+        chain = MiddlewareChain([Tag("a", seen)])
+        send = Mock(return_value="response")
+        first = chain.handler(send)
+
+        assert chain.handler(send) is first
+        chain.add(Tag("b", seen))
+        chain.handler(send)(APIRequest("GET", "url", "domains"))
+
+        assert seen == ["b", "a"]
+
+
+class TestClientMiddleware:
+    def test_requests_pass_through_the_chain(self):
+        seen = []
+        client = make_client(middleware=[Tag("a", seen)])
+        client.middleware.add(Tag("b", seen))
+
+        client.request("GET", "domains")
+
+        headers = client.session.request.call_args.kwargs["headers"]
+        assert headers["X-Layers"] == "ab"
+        assert seen == ["b", "a"]
+        assert client.get_debug_info()["middleware"] == ["a", "b"]
+
+    def test_middleware_can_answer_without_sending(self):
+        cached = make_response(200)
+        client = make_client(middleware=[ShortCircuit(cached)])
+
+        assert client.request("GET", "domains") is cached
+        client.session.request.assert_not_called()
+
+    def test_bytes_bodies_are_sent_as_data(self):
+        class Encode(Middleware):
+            def on_request(self, request):
+                request.body = b'{"encoded": true}'
+                return request
+
+        client = make_client(middleware=[Encode()])
+
+        client.request("POST", "email", body={"a": 1})
+
+        kwargs = client.session.request.call_args.kwargs
+        assert kwargs["data"] == b'{"encoded": true}'
+        assert "json" not in kwargs
+
+    def test_retries_pass_through_the_chain_each_time(self, monkeypatch):
+        monkeypatch.setattr("mailersend.client.time", Mock())
+        seen = []
+        client = make_client(middleware=[Tag("a", seen)])
+        client.session.request.side_effect = [make_response(503), make_response(200)]
+
+        client.request("GET", "domains")
+
+        assert seen == ["a", "a"]
+
+    def test_async_client(self):
+        httpx = pytest.importorskip("httpx")
+        from mailersend.async_client import AsyncMailerSendClient
+
+        received = []
+
+        def handler(request):
+            received.append(request)
+            return httpx.Response(200, json={"data": []})
+
+        seen = []
+        client = AsyncMailerSendClient(
+            api_key="test-key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            middleware=[Tag("a", seen), Tag("b", seen)],
+        )
+
+        asyncio.run(client.request("GET", "domains"))
+
+        assert received[0].headers["X-Layers"] == "ab"
+        assert seen == ["b", "a"]
@@ -0,0 +1,476 @@
+"""Tests for building response models, validated or trusted."""
+
+import asyncio
+import json
+from typing import Dict, List, Optional
+from unittest.mock import Mock
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from mailersend.client import MailerSendClient
+from mailersend.models.activity import (
+    Activity,
+    ActivityQueryParams,
+    ActivityRequest,
+)
+from mailersend.models.base import (
+    APIResponse,
+    BaseModel,
+    LazyItems,
+    ModelList,
+    parse_models,
+)
+from mailersend.models.sms_activity import (
+    SmsActivity,
+    SmsActivityListRequest,
+    SmsMessage,
+    SmsMessageGetRequest,
+)
+from mailersend.models.sms_inbounds import SmsInbound, SmsInboundsListRequest
+from mailersend.models.sms_messages import SmsMessagesListRequest
+from mailersend.models.sms_numbers import SmsNumber, SmsNumbersListRequest
+from mailersend.models.sms_recipients import SmsRecipient, SmsRecipientsListRequest
+from mailersend.models.sms_webhooks import (
+    SmsWebhook,
+    SmsWebhooksListQueryParams,
+    SmsWebhooksListRequest,
+)
+from mailersend.models.users import (
+    InviteGetRequest,
+    InvitesListRequest,
+    User,
+    UserGetRequest,
+    UserInvite,
+    UsersListRequest,
+)
+from mailersend.resources.base import BaseResource
+
+
+def make_activity(index=0, recipient="user@example.com"):
+    return {
+        "id": f"act{index}",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+        "type": "delivered",
+        "email": {
+            "id": f"email{index}",
+            "from": "sender@example.com",
+            "subject": "Hello",
+            "status": "delivered",
+            "tags": ["welcome"],
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "recipient": {
+                "id": f"rcpt{index}",
+                "email": recipient,
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-01T00:00:00Z",
+            },
+        },
+    }
+
+
+def make_request():
+    return ActivityRequest(
+        domain_id="domain123",
+        query_params=ActivityQueryParams(date_from=1700000000, date_to=1700086400),
+    )
+
+
+def make_page(count=3, page=1, last_page=1):
+    return {
+        "data": [make_activity(i) for i in range(count)],
+        "meta": {"current_page": page, "last_page": last_page, "total": count},
+        "links": {},
+    }
+
+
+class Child(BaseModel):
+    name: str
+
+
+class Parent(BaseModel):
+    id: str
+    kind: Optional[str] = None
+    child: Optional[Child] = None
+    children: List[Child] = []
+    by_key: Dict[str, Child] = {}
+
+
+class TestConstructTrusted:
+    def test_matches_validated_model(self):
+        data = make_activity()
+
+        assert Activity.construct_trusted(data) == Activity(**data)
+
+    def test_nested_models_are_built(self):
+        activity = Activity.construct_trusted(make_activity())
+
+        assert activity.email.from_email == "sender@example.com"
+        assert activity.email.recipient.id == "rcpt0"
+        assert type(activity.email.recipient).__name__ == "ActivityRecipient"
+
+    def test_containers_of_models(self):
+        parent = Parent.construct_trusted(
+            {
+                "id": "p",
+                "child": None,
+                "children": [{"name": "a"}, {"name": "b"}],
+                "by_key": {"x": {"name": "c"}},
+            }
+        )
+
+        assert parent.child is None
+        assert [child.name for child in parent.children] == ["a", "b"]
+        assert parent.by_key["x"] == Child(name="c")
+
+    def test_defaults_and_fields_set(self):
+        parent = Parent.construct_trusted({"id": "p", "unknown": 1})
+
+        assert parent.kind is None
+        assert parent.children == []
+        assert parent.model_fields_set == {"id"}
+        assert parent.model_dump(exclude_unset=True) == {"id": "p"}
+
+    def test_fields_are_read_by_name_too(self):
+        data = make_activity()
+        data["email"]["from_email"] = data["email"].pop("from")
+
+        activity = Activity.construct_trusted(data)
+
+        assert activity.email.from_email == "sender@example.com"
+
+    def test_server_data_is_not_validated(self):
+        activity = Activity.construct_trusted(make_activity(recipient="not-an-email"))
+
+        assert activity.email.recipient.email == "not-an-email"
+        with pytest.raises(ValueError):
+            Activity.from_api(make_activity(recipient="not-an-email"))
+
+    def test_from_api(self):
+        data = make_activity()
+
+        assert Activity.from_api(data, trusted=True) == Activity.from_api(data)
+
+
+class TestParseModels:
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_list_response(self, trusted):
+        page = parse_models(make_page(), Activity, trusted=trusted)
+
+        assert isinstance(page, ModelList)
+        assert [activity.id for activity in page] == ["act0", "act1", "act2"]
+        assert page.total == 3
+        assert page.meta["last_page"] == 1
+
+    def test_single_object_and_bare_list(self):
+        assert parse_models(make_activity(), Activity, trusted=True).id == "act0"
+        assert len(parse_models([make_activity()] * 2, Activity, trusted=True)) == 2
+        assert parse_models("text", Activity) == "text"
+
+    def test_api_response_as_models(self):
+        response = APIResponse(data=make_page(), headers={}, status_code=200)
+
+        page = response.as_models(Activity, trusted=True)
+
+        assert page[1].email.recipient.id == "rcpt1"
+        assert response.as_models(Activity, trusted=True) is page
+        assert response.as_models(Activity, lazy=False) is not page
+
+    def test_as_models_needs_a_model_class(self):
+        response = APIResponse(data=make_page(), headers={}, status_code=200)
+
+        with pytest.raises(ValueError):
+            response.as_models()
+
+
+class TestLazyResponses:
+    def make_response(self, body, **kwargs):
+        return APIResponse(
+            data=None, headers={}, status_code=200, content=body, **kwargs
+        )
+
+    def test_body_is_decoded_on_first_access(self, monkeypatch):
+        loads = Mock(side_effect=json.loads)
+        monkeypatch.setattr("mailersend.models.base.loads", loads)
+        response = self.make_response(json.dumps(make_page()).encode())
+
+        assert not response.is_decoded
+        assert response.status_code == 200
+        loads.assert_not_called()
+
+        assert response.meta["last_page"] == 1
+        assert response["data"][0]["id"] == "act0"
+        assert response.is_decoded
+        loads.assert_called_once()
+
+    def test_invalid_body_decodes_to_empty_dict(self):
+        assert self.make_response(b"<html>").data == {}
+
+    def test_data_can_be_replaced(self):
+        response = self.make_response(b'{"id": 1}')
+
+        response.data = {"id": 2}
+
+        assert response.id == 2
+
+    def test_items_are_built_on_first_access(self):
+        build = Mock(side_effect=Activity.construct_trusted)
+        items = LazyItems([make_activity(i) for i in range(3)], build)
+
+        assert len(items) == 3
+        build.assert_not_called()
+
+        assert items[1].id == "act1"
+        assert items[1] is items[1]
+        assert build.call_count == 1
+        assert [activity.id for activity in items[:2]] == ["act0", "act1"]
+        assert items[-1].id == "act2"
+        assert build.call_count == 3
+
+    def test_resource_responses_are_lazy_and_typed(self):
+        client = MailerSendClient(api_key="test-key", trust_server_data=True)
+        response = Mock()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict()
+        data = make_page()
+        data["data"][0]["email"]["recipient"]["email"] = "not-an-email"
+        response.content = json.dumps(data).encode()
+        client.session.request = Mock(return_value=response)
+
+        result = client.activities.get(make_request())
+
+        assert not result.is_decoded
+        page = result.as_models()
+        assert isinstance(page.items, LazyItems)
+        assert page[0].email.recipient.email == "not-an-email"
+        assert page.last_page == 1
+
+
+class TestClientTrust:
+    def make_response(self, data):
+        response = Mock()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict()
+        response.content = json.dumps(data).encode()
+        return response
+
+    def test_process_response_follows_client_setting(self):
+        client = MailerSendClient(api_key="test-key", trust_server_data=True)
+        resource = BaseResource(client)
+        data = make_page()
+        data["data"][0]["email"]["recipient"]["email"] = "not-an-email"
+
+        page = resource._process_response(data, Activity)
+
+        assert page[0].email.recipient.email == "not-an-email"
+        with pytest.raises(ValueError):
+            resource._process_response(data, Activity, trusted=False)
+
+    def test_paginate_yields_models(self):
+        client = MailerSendClient(api_key="test-key", trust_server_data=True)
+        client.session.request = Mock(
+            side_effect=[
+                self.make_response(make_page(2, page=1, last_page=2)),
+                self.make_response(make_page(1, page=2, last_page=2)),
+            ]
+        )
+        request = make_request()
+
+        activities = list(
+            client.activities.paginate(
+                "get", request, prefetch=False, model_class=Activity
+            )
+        )
+
+        assert [activity.id for activity in activities] == ["act0", "act1", "act0"]
+        assert all(isinstance(activity, Activity) for activity in activities)
+
+    def test_async_paginate_yields_models(self):
+        httpx = pytest.importorskip("httpx")
+        from mailersend.async_client import AsyncMailerSendClient
+
+        def handler(request):
+            return httpx.Response(200, json=make_page(2))
+
+        client = AsyncMailerSendClient(
+            api_key="test-key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            trust_server_data=True,
+        )
+        request = make_request()
+
+        async def collect():
+            paginator = client.activities.paginate("get", request, model_class=Activity)
+            return [activity async for activity in paginator]
+
+        activities = asyncio.run(collect())
+
+        assert [activity.email.recipient.id for activity in activities] == [
+            "rcpt0",
+            "rcpt1",
+        ]
+        assert client.activities._resource._trust_server_data()
+
+
+CREATED = {"created_at": "2024-01-01T00:00:00Z"}
+SMS_ACTIVITY = {
+    "from": "+1234567890",
+    "to": "+1987654321",
+    "content": "Hello",
+    "status": "delivered",
+    "sms_message_id": "sms1",
+    **CREATED,
+}
+INVITE = {
+    "id": "inv1",
+    "email": "user@example.com",
+    "role": "Admin",
+    **CREATED,
+    "updated_at": "2024-01-01T00:00:00Z",
+}
+
+RESOURCE_MODELS = [
+    ("sms_activity", "list", SmsActivityListRequest(), SMS_ACTIVITY, SmsActivity),
+    (
+        "sms_messages",
+        "list_sms_messages",
+        SmsMessagesListRequest(),
+        {
+            "id": "sms1",
+            "from": "+1234567890",
+            "to": ["+1987654321"],
+            "text": "Hello",
+            "paused": False,
+            "sms": [],
+            "sms_activity": [],
+            **CREATED,
+        },
+        SmsMessage,
+    ),
+    (
+        "sms_numbers",
+        "list",
+        SmsNumbersListRequest(),
+        {"id": "num1", "telephone_number": "+1234567890", "paused": False, **CREATED},
+        SmsNumber,
+    ),
+    (
+        "sms_recipients",
+        "list_sms_recipients",
+        SmsRecipientsListRequest(),
+        {"id": "rcpt1", "number": "+1234567890", "status": "active", **CREATED},
+        SmsRecipient,
+    ),
+    (
+        "sms_webhooks",
+        "list_sms_webhooks",
+        SmsWebhooksListRequest(
+            query_params=SmsWebhooksListQueryParams(sms_number_id="num1")
+        ),
+        {
+            "id": "hook1",
+            "url": "https://example.com/hook",
+            "name": "Hook",
+            "events": ["sms.sent"],
+            "enabled": True,
+            "sms_number_id": "num1",
+            **CREATED,
+        },
+        SmsWebhook,
+    ),
+    (
+        "sms_inbounds",
+        "list_sms_inbounds",
+        SmsInboundsListRequest(),
+        {
+            "id": "in1",
+            "name": "Inbound",
+            "forward_url": "https://example.com/inbound",
+            "enabled": True,
+            **CREATED,
+        },
+        SmsInbound,
+    ),
+    (
+        "users",
+        "list_users",
+        UsersListRequest(),
+        {
+            "id": "user1",
+            "email": "user@example.com",
+            "role": "Admin",
+            **CREATED,
+            "updated_at": "2024-01-01T00:00:00Z",
+        },
+        User,
+    ),
+    ("users", "list_invites", InvitesListRequest(), INVITE, UserInvite),
+]
+
+
+class TestResourceModels:
+    @pytest.mark.parametrize(
+        "resource, method, request_, item, model_class",
+        RESOURCE_MODELS,
+        ids=[f"{case[0]}.{case[1]}" for case in RESOURCE_MODELS],
+    )
+    def test_responses_know_their_model(
+        self, resource, method, request_, item, model_class
+    ):
+        client = MailerSendClient(api_key="test-key")
+        response = Mock()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict()
+        response.content = json.dumps({"data": [item]}).encode()
+        client.session.request = Mock(return_value=response)
+
+        page = getattr(getattr(client, resource), method)(request_).as_models()
+
+        assert isinstance(page[0], model_class)
+
+    @pytest.mark.parametrize(
+        "resource, method, request_, model_class",
+        [
+            (
+                "sms_activity",
+                "get",
+                SmsMessageGetRequest(sms_message_id="sms1"),
+                SmsMessage,
+            ),
+            ("users", "get_user", UserGetRequest(user_id="user1"), User),
+            ("users", "get_invite", InviteGetRequest(invite_id="inv1"), UserInvite),
+        ],
+    )
+    def test_methods_can_override_the_model(
+        self, resource, method, request_, model_class
+    ):
+        client = MailerSendClient(api_key="test-key")
+        response = Mock()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict()
+        response.content = b"{}"
+        client.session.request = Mock(return_value=response)
+
+        result = getattr(getattr(client, resource), method)(request_)
+
+        assert result.model_class is model_class
+
+    def test_async_responses_know_their_model(self):
+        httpx = pytest.importorskip("httpx")
+        from mailersend.async_client import AsyncMailerSendClient
+
+        def handler(request):
+            return httpx.Response(200, json={"data": [INVITE]})
+
+        async def list_invites():
+            async with AsyncMailerSendClient(
+                api_key="test-key",
+                http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            ) as client:
+                return await client.users.list_invites(InvitesListRequest())
+
+        page = asyncio.run(list_invites()).as_models()
+
+        assert isinstance(page[0], UserInvite)
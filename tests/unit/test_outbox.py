@@ -0,0 +1,218 @@
+"""Tests for the durable outbox, against a local stub of the API."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+
+from mailersend.client import MailerSendClient
+from mailersend.outbox import Outbox, OutboxDrainer
+from mailersend.retry import RetryPolicy
+from mailersend.serialization import model_json
+
+NO_RETRIES = RetryPolicy(max_retries=0)
+
+
+class StubAPI:
+    """Local HTTP server answering ``POST /v1/email`` from a list of statuses."""
+
+    def __init__(self):
+        self.requests = []
+        self.statuses = []
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                with stub.lock:
+                    stub.requests.append((self.path, dict(self.headers), body))
+                    status = stub.statuses.pop(0) if stub.statuses else 202
+                    message_id = f"msg-{len(stub.requests)}"
+                self.send_response(status)
+                if status == 202:
+                    self.send_header("x-message-id", message_id)
+                if status == 429:
+                    self.send_header("Retry-After", "30")
+                error = json.dumps({"message": f"status {status}"}).encode()
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(error)))
+                self.end_headers()
+                self.wfile.write(error)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, args=(0.01,), daemon=True
+        )
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}/v1/"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def api():
+    stub = StubAPI()
+    yield stub
+    stub.close()
+
+
+@pytest.fixture
+def client(api):
+    return MailerSendClient(
+        api_key="test-key", base_url=api.base_url, retry_policy=NO_RETRIES
+    )
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    with Outbox(str(tmp_path / "outbox.db"), retry_delay=10) as outbox:
+        yield outbox
+
+
+class TestOutbox:
+    def test_enqueue_and_drain(self, api, client, outbox, make_email):
+        emails = [make_email(i) for i in range(3)]
+        ids = outbox.enqueue_many(emails)
+
+        assert outbox.stats()["pending"] == 3
+        assert outbox.drain(client) == {"sent": 3, "retried": 0, "failed": 0}
+
+        assert [body for _, _, body in api.requests] == [model_json(e) for e in emails]
+        assert all(path == "/v1/email" for path, _, _ in api.requests)
+        entry = outbox.get(ids[0])
+        assert entry["status"] == "sent"
+        assert entry["message_id"] == "msg-1"
+        assert outbox.stats()["sent"] == 3
+        assert outbox.drain(client)["sent"] == 0
+
+    def test_idempotency_key_is_kept(self, api, client, outbox, make_email):
+        outbox.enqueue(make_email(), idempotency_key="order-42")
+        entry_id = outbox.enqueue(make_email(1))
+
+        outbox.drain(client)
+
+        keys = [headers["Idempotency-Key"] for _, headers, _ in api.requests]
+        assert keys[0] == "order-42"
+        assert keys[1] == outbox.get(entry_id)["idempotency_key"]
+
+    def test_transient_failures_are_retried_later(
+        self, api, client, outbox, monkeypatch, make_email
+    ):
+        api.statuses = [503, 429]
+        entry_id = outbox.enqueue(make_email())
+
+        assert outbox.drain(client)["retried"] == 1
+        entry = outbox.get(entry_id)
+        assert entry["status"] == "pending"
+        assert entry["attempts"] == 1
+        assert entry["next_attempt_at"] - entry["updated_at"] == pytest.approx(10)
+        assert outbox.drain(client)["retried"] == 0
+
+        now = time.time()
+        monkeypatch.setattr("mailersend.outbox.time", Mock(time=lambda: now + 11))
+        assert outbox.drain(client)["retried"] == 1
+        entry = outbox.get(entry_id)
+        # Retry-After of the 429 outweighs the 20 s backoff
+        assert entry["next_attempt_at"] - entry["updated_at"] == pytest.approx(30)
+
+        monkeypatch.setattr("mailersend.outbox.time", Mock(time=lambda: now + 50))
+        assert outbox.drain(client)["sent"] == 1
+        assert outbox.get(entry_id)["attempts"] == 3
+
+    def test_permanent_failures_are_not_retried(self, api, client, outbox, make_email):
+        api.statuses = [422]
+        entry_id = outbox.enqueue(make_email())
+
+        assert outbox.drain(client)["failed"] == 1
+
+        entry = outbox.get(entry_id)
+        assert entry["status"] == "failed"
+        assert "422" in entry["last_error"]
+        assert outbox.retry_failed() == 1
+        assert outbox.drain(client)["sent"] == 1
+
+    def test_attempts_are_limited(self, api, client, tmp_path, make_email):
+        api.statuses = [503, 503]
+
+        with Outbox(str(tmp_path / "o.db"), max_attempts=2, retry_delay=0) as outbox:
+            entry_id = outbox.enqueue(make_email())
+
+            assert outbox.drain(client) == {"sent": 0, "retried": 1, "failed": 1}
+            assert outbox.get(entry_id)["status"] == "failed"
+
+    def test_unexpected_errors_release_the_email(self, outbox, make_email):
+        client = Mock()
+        client.request.side_effect = OSError("attachment is gone")
+        entry_id = outbox.enqueue(make_email())
+
+        with pytest.raises(OSError):
+            outbox.drain(client)
+
+        entry = outbox.get(entry_id)
+        assert entry["status"] == "pending"
+        assert entry["attempts"] == 1
+        assert entry["last_error"] == "attachment is gone"
+        assert entry["next_attempt_at"] - entry["updated_at"] == pytest.approx(10)
+
+    def test_emails_survive_a_restart(self, api, client, tmp_path, make_email):
+        path = str(tmp_path / "outbox.db")
+        with Outbox(path) as outbox:
+            outbox.enqueue(make_email())
+
+        with Outbox(path) as outbox:
+            assert outbox.drain(client)["sent"] == 1
+
+    def test_claimed_emails_are_hidden_from_other_drainers(self, tmp_path, make_email):
+        path = str(tmp_path / "outbox.db")
+        with Outbox(path) as first, Outbox(path) as second:
+            first.enqueue_many([make_email(0), make_email(1)])
+
+            claimed = first.claim()
+
+            assert [row[0] for row in second.claim(10)] == [claimed[0][0] + 1]
+
+    def test_purge_sent(self, api, client, outbox, make_email):
+        outbox.enqueue_many([make_email(0), make_email(1)])
+        outbox.drain(client)
+
+        assert outbox.purge_sent(older_than=3600) == 0
+        assert outbox.purge_sent() == 2
+        assert outbox.stats()["sent"] == 0
+
+    def test_invalid_settings(self, tmp_path):
+        with pytest.raises(ValueError):
+            Outbox(str(tmp_path / "o.db"), max_attempts=0)
+        with pytest.raises(ValueError):
+            Outbox(str(tmp_path / "o.db"), synchronous="OFF")
+
+
+class TestOutboxDrainer:
+    def test_drains_in_the_background(self, api, client, outbox, make_email):
+        with OutboxDrainer(outbox, client, poll_interval=5) as drainer:
+            assert drainer.running
+            outbox.enqueue_many([make_email(i) for i in range(5)])
+
+            deadline = time.monotonic() + 5
+            while outbox.stats()["sent"] < 5 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert not drainer.running
+        assert outbox.stats()["sent"] == 5
+        assert len(api.requests) == 5
+
+    def test_cannot_start_twice(self, client, outbox):
+        drainer = OutboxDrainer(outbox, client).start()
+        try:
+            with pytest.raises(RuntimeError):
+                drainer.start()
+        finally:
+            drainer.stop()
@@ -0,0 +1,282 @@
+"""Tests for lazy pagination over list endpoints."""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from requests import Response
+
+from mailersend.models.base import APIResponse, ModelList
+from mailersend.models.messages import (
+    MessageGetRequest,
+    MessagesListQueryParams,
+    MessagesListRequest,
+)
+from mailersend.models.sms_activity import SmsActivityListRequest
+from mailersend.pagination import (
+    AsyncPaginator,
+    Paginator,
+    default_request,
+    has_next_page,
+    paginate,
+    with_page,
+)
+from mailersend.resources.messages import Messages
+from mailersend.resources.recipients import Recipients
+from mailersend.retry import RetryPolicy, current_policy, retry_budget
+
+
+def page_payload(page, last_page, per_page=2):
+    start = (page - 1) * per_page
+    return {
+        "data": [{"id": f"item-{start + i}"} for i in range(per_page)],
+        "links": {"next": f"?page={page + 1}" if page < last_page else None},
+        "meta": {"current_page": page, "last_page": last_page, "per_page": per_page},
+    }
+
+
+def http_response(payload):
+    response = Mock(spec=Response)
+    response.status_code = 200
+    response.headers = {}
+    response.content = json.dumps(payload).encode()
+    response.json.return_value = payload
+    return response
+
+
+def paged_client(last_page, per_page=2):
+    """Mock client serving ``last_page`` pages and recording requested pages."""
+    client = Mock()
+    client.requested_pages = []
+
+    def request(method, path, params=None, body=None):
+        page = (params or {}).get("page", 1)
+        client.requested_pages.append(page)
+        return http_response(page_payload(page, last_page, per_page))
+
+    client.request.side_effect = request
+    return client
+
+
+class TestPageHelpers:
+    """Test request rewriting and page boundary detection."""
+
+    def test_with_page_updates_nested_query_params(self):
+        request = MessagesListRequest(query_params=MessagesListQueryParams(limit=50))
+
+        updated = with_page(request, 4)
+
+        assert updated.to_query_params() == {"page": 4, "limit": 50}
+        assert request.query_params.page == 1
+
+    def test_with_page_updates_flat_request(self):
+        request = SmsActivityListRequest(sms_number_id="num")
+
+        assert with_page(request, 2).to_query_params()["page"] == 2
+
+    def test_with_page_rejects_unpaginated_request(self):
+        with pytest.raises(TypeError):
+            with_page(MessageGetRequest(message_id="msg-1"), 2)
+
+    def test_default_request_for_required_argument(self):
+        request = default_request(Messages(Mock()).list_messages)
+
+        assert isinstance(request, MessagesListRequest)
+        assert request.query_params.page == 1
+
+    def test_default_request_needs_explicit_request_when_required_fields(self):
+        from mailersend.resources.smtp_users import SmtpUsers
+
+        with pytest.raises(TypeError):
+            default_request(SmtpUsers(Mock()).list_smtp_users)
+
+    @pytest.mark.parametrize(
+        "links,meta,count,expected",
+        [
+            ({"next": "?page=2"}, {}, 2, True),
+            ({"next": None}, {"current_page": 1, "last_page": 5}, 2, False),
+            ({}, {"current_page": 1, "last_page": 2}, 2, True),
+            ({}, {"current_page": 2, "last_page": 2}, 2, False),
+            ({}, {"per_page": 2}, 2, True),
+            ({}, {"per_page": 2}, 1, False),
+            ({"next": "?page=2"}, {}, 0, False),
+        ],
+    )
+    def test_has_next_page(self, links, meta, count, expected):
+        page = ModelList(items=[{}] * count, meta=meta, links=links)
+
+        assert has_next_page(page) is expected
+
+
+class TestPaginator:
+    """Test synchronous pagination."""
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_yields_items_across_pages(self, prefetch):
+        client = paged_client(last_page=3)
+        resource = Recipients(client)
+
+        items = list(resource.paginate("list_recipients", prefetch=prefetch))
+
+        assert [item["id"] for item in items] == [f"item-{i}" for i in range(6)]
+        assert client.requested_pages == [1, 2, 3]
+
+    def test_is_lazy(self):
+        client = paged_client(last_page=50)
+        iterator = iter(paginate(Recipients(client).list_recipients, prefetch=False))
+
+        next(iterator)
+
+        assert client.requested_pages == [1]
+
+    def test_prefetches_next_page_while_consuming(self):
+        client = paged_client(last_page=3)
+        second_page_requested = threading.Event()
+
+        def request(method, path, params=None, body=None):
+            page = params["page"]
+            client.requested_pages.append(page)
+            if page == 2:
+                second_page_requested.set()
+            return http_response(page_payload(page, 3))
+
+        client.request.side_effect = request
+        iterator = iter(Recipients(client).paginate("list_recipients"))
+
+        next(iterator)
+
+        # Page 2 is fetched while the caller still works on page 1
+        assert second_page_requested.wait(timeout=1)
+
+    def test_starts_from_request_page(self):
+        client = paged_client(last_page=3)
+        request = MessagesListRequest(query_params=MessagesListQueryParams(page=2))
+
+        pages = list(Paginator(Messages(client).list_messages, request).pages())
+
+        assert len(pages) == 2
+        assert all(isinstance(page, APIResponse) for page in pages)
+        assert client.requested_pages == [2, 3]
+
+    def test_stops_on_empty_page(self):
+        client = Mock()
+        client.request.return_value = http_response({"data": [], "meta": {}})
+
+        assert list(Recipients(client).paginate("list_recipients")) == []
+        assert client.request.call_count == 1
+
+
+class TestAsyncPaginator:
+    """Test asyncio pagination."""
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_yields_items_across_pages(self, prefetch):
+        requested = []
+
+        async def list_messages(request: MessagesListRequest) -> APIResponse:
+            page = request.query_params.page
+            requested.append(page)
+            return APIResponse(page_payload(page, 3), {}, 200)
+
+        async def run():
+            paginator = AsyncPaginator(list_messages, prefetch=prefetch)
+            return [item["id"] async for item in paginator]
+
+        items = asyncio.run(run())
+
+        assert items == [f"item-{i}" for i in range(6)]
+        assert requested == [1, 2, 3]
+
+
+class TestParallelFanOut:
+    """Test concurrent fetching once the last page is known."""
+
+    def test_fetches_pages_concurrently_in_order(self):
+        lock = threading.Lock()
+        state = {"current": 0, "peak": 0}
+        client = Mock()
+
+        def request(method, path, params=None, body=None):
+            page = params["page"]
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            # Later pages answer faster, so completion order differs from page order
+            time.sleep(0.002 * (12 - page))
+            with lock:
+                state["current"] -= 1
+            return http_response(page_payload(page, last_page=10))
+
+        client.request.side_effect = request
+        paginator = Recipients(client).paginate("list_hard_bounces", max_in_flight=4)
+
+        items = [item["id"] for item in paginator]
+
+        assert items == [f"item-{i}" for i in range(20)]
+        assert 1 < state["peak"] <= 4
+
+    def test_falls_back_to_sequential_without_last_page(self):
+        client = Mock()
+        requested = []
+
+        def request(method, path, params=None, body=None):
+            page = params["page"]
+            requested.append(page)
+            payload = page_payload(page, last_page=3)
+            del payload["meta"]["last_page"]
+            return http_response(payload)
+
+        client.request.side_effect = request
+
+        items = list(Recipients(client).paginate("list_recipients", max_in_flight=4))
+
+        assert len(items) == 6
+        assert requested == [1, 2, 3]
+
+    @pytest.mark.parametrize("max_in_flight", [1, 4])
+    def test_pages_are_fetched_in_the_callers_context(self, max_in_flight):
+        client = Mock()
+        budgets = []
+
+        def request(method, path, params=None, body=None):
+            budgets.append(current_policy(RetryPolicy()).max_retries)
+            return http_response(page_payload(params["page"], last_page=5))
+
+        client.request.side_effect = request
+
+        with retry_budget(max_retries=0):
+            items = list(
+                Recipients(client).paginate(
+                    "list_hard_bounces", max_in_flight=max_in_flight
+                )
+            )
+
+        assert len(items) == 10
+        assert budgets == [0] * 5
+
+    def test_rejects_invalid_max_in_flight(self):
+        with pytest.raises(ValueError):
+            Recipients(Mock()).paginate("list_recipients", max_in_flight=0)
+
+    def test_async_fan_out(self):
+        in_flight = {"current": 0, "peak": 0}
+
+        async def list_messages(request: MessagesListRequest) -> APIResponse:
+            page = request.query_params.page
+            in_flight["current"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+            await asyncio.sleep(0.001 * (12 - page))
+            in_flight["current"] -= 1
+            return APIResponse(page_payload(page, 10), {}, 200)
+
+        async def run():
+            paginator = AsyncPaginator(list_messages, max_in_flight=3)
+            return [item["id"] async for item in paginator]
+
+        items = asyncio.run(run())
+
+        assert items == [f"item-{i}" for i in range(20)]
+        assert 1 < in_flight["peak"] <= 3
@@ -0,0 +1,243 @@
+"""Tests for the client-side rate limiter."""
+
+import multiprocessing
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import Mock
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from mailersend.client import MailerSendClient
+from mailersend.exceptions import RateLimitExceeded
+from mailersend.rate_limit import (
+    FileBackend,
+    LocalBackend,
+    RateLimiter,
+    fcntl,
+    parse_retry_after,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch, fake_clock):
+    monkeypatch.setattr("mailersend.rate_limit.time", fake_clock)
+    return fake_clock
+
+
+def headers(**values):
+    return CaseInsensitiveDict(
+        {name.replace("_", "-"): str(value) for name, value in values.items()}
+    )
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("12") == 12.0
+
+    def test_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 25 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_invalid(self, value):
+        assert parse_retry_after(value) is None
+
+
+class TestRateLimiter:
+    @pytest.mark.parametrize("kwargs", [{"rate": 0}, {"burst": 0}])
+    def test_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            RateLimiter(**kwargs)
+
+    def test_burst_then_steady_rate(self, clock):
+        limiter = RateLimiter(rate=2, burst=3)
+
+        for _ in range(5):
+            limiter.acquire()
+
+        assert clock.sleeps == [0.5, 0.5]
+
+    def test_concurrent_reservations_queue_up(self, clock):
+        limiter = RateLimiter(rate=1, burst=1)
+
+        delays = [limiter.reserve() for _ in range(3)]
+
+        assert delays == [0.0, 1.0, 2.0]
+
+    def test_refill_is_capped_at_burst(self, clock):
+        limiter = RateLimiter(rate=1, burst=2)
+        clock.now += 100
+
+        assert limiter.tokens == 2
+
+    def test_remaining_header_caps_tokens(self, clock):
+        limiter = RateLimiter(rate=1, burst=10)
+
+        limiter.update(200, headers(x_ratelimit_remaining=0))
+
+        assert limiter.reserve() == 1.0
+
+    def test_retry_after_pauses_requests(self, clock):
+        limiter = RateLimiter(rate=1, burst=10)
+
+        limiter.update(429, headers(retry_after=30))
+
+        assert limiter.reserve() == 30.0
+        assert limiter.reserve() == 31.0
+
+    def test_429_without_retry_after_drains_bucket(self, clock):
+        limiter = RateLimiter(rate=4, burst=10)
+
+        limiter.update(429, headers())
+
+        assert limiter.reserve() == 0.25
+
+    def test_exhausted_quota_waits_for_reset(self, clock):
+        limiter = RateLimiter(rate=1, burst=10)
+        reset = datetime.now(timezone.utc) + timedelta(seconds=60)
+
+        limiter.update(
+            200,
+            headers(x_apiquota_remaining=0, x_apiquota_reset=reset.isoformat()),
+        )
+
+        assert 55 < limiter.reserve() <= 60
+
+    def test_exhausted_quota_without_reset_is_ignored(self, clock):
+        limiter = RateLimiter(rate=1, burst=10)
+
+        limiter.update(200, headers(x_apiquota_remaining=0))
+
+        assert limiter.reserve() == 0.0
+
+    def test_max_wait_fails_fast_without_taking_a_token(self, clock):
+        limiter = RateLimiter(rate=1, burst=10, max_wait=5)
+        limiter.update(429, headers(retry_after=30))
+
+        with pytest.raises(RateLimitExceeded):
+            limiter.reserve()
+
+        clock.now += 30
+        assert limiter.reserve() == 0.0
+
+
+def reserve_many(limiter, count, queue):
+    """Reserve ``count`` tokens in a child process."""
+    queue.put([limiter.reserve() for _ in range(count)])
+
+
+@pytest.mark.skipif(fcntl is None, reason="fcntl is not available")
+class TestFileBackend:
+    def test_default_backend_is_local(self):
+        assert isinstance(RateLimiter().backend, LocalBackend)
+
+    def test_limiters_sharing_a_file_share_the_budget(self, clock, tmp_path):
+        path = str(tmp_path / "bucket")
+        first = RateLimiter(rate=1, burst=2, backend=FileBackend(path))
+        second = RateLimiter(rate=1, burst=2, backend=FileBackend(path))
+
+        assert first.reserve() == 0.0
+        assert second.reserve() == 0.0
+        assert first.reserve() == 1.0
+        assert second.reserve() == 2.0
+
+    def test_headers_seen_by_one_limiter_apply_to_all(self, clock, tmp_path):
+        path = str(tmp_path / "bucket")
+        first = RateLimiter(rate=1, burst=10, backend=FileBackend(path))
+        second = RateLimiter(rate=1, burst=10, backend=FileBackend(path))
+
+        first.update(429, headers(retry_after=30))
+
+        assert second.reserve() == 30.0
+
+    def test_state_from_before_a_reboot_is_a_full_bucket(self, clock, tmp_path):
+        path = tmp_path / "bucket"
+        # Saved when the monotonic clock was far ahead of the current one
+        path.write_bytes(FileBackend._FORMAT.pack(-6.0, 1_000_000.0))
+        limiter = RateLimiter(rate=1, burst=5, backend=FileBackend(str(path)))
+
+        assert limiter.reserve() == 0.0
+        clock.now += 1
+        assert limiter.tokens == 5
+
+    def test_threads_open_the_file_once(self, tmp_path, monkeypatch):
+        opened = []
+        real_open = os.open
+
+        def slow_open(*args, **kwargs):
+            opened.append(args[0])
+            time.sleep(0.01)
+            return real_open(*args, **kwargs)
+
+        monkeypatch.setattr(os, "open", slow_open)
+        backend = FileBackend(str(tmp_path / "bucket"))
+        limiter = RateLimiter(backend=backend)
+        threads = [threading.Thread(target=limiter.reserve) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        backend.close()
+
+        assert len(opened) == 1
+
+    def test_budget_is_shared_across_processes(self, tmp_path):
+        path = str(tmp_path / "bucket")
+        # Open the file before forking: children must not share its lock
+        limiter = RateLimiter(rate=0.001, burst=10, backend=FileBackend(path))
+        assert limiter.tokens == 10
+
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        workers = [
+            context.Process(target=reserve_many, args=(limiter, 5, queue))
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        delays = sorted(delay for _ in workers for delay in queue.get(timeout=10))
+        for worker in workers:
+            worker.join()
+
+        # Burst of 10 immediately, then one token every 1000s for the rest
+        assert sum(delay < 1 for delay in delays) == 10
+        waits = [round(delay / 1000) for delay in delays[10:]]
+        assert waits == list(range(1, 11))
+
+
+class TestClientIntegration:
+    def make_response(self, status_code=200, **header_values):
+        response = Mock()
+        response.status_code = status_code
+        response.headers = headers(**header_values)
+        response.json.return_value = {}
+        return response
+
+    def test_client_paces_and_learns(self, clock):
+        limiter = RateLimiter(rate=1, burst=1)
+        client = MailerSendClient(api_key="test-key", rate_limiter=limiter)
+        client.session.request = Mock(
+            return_value=self.make_response(x_ratelimit_remaining=0)
+        )
+
+        client.request("GET", "domains")
+        client.request("GET", "domains")
+
+        assert client.session.request.call_count == 2
+        assert clock.sleeps == [1.0]
+        assert client.get_debug_info()["rate_limiter"]["rate"] == 1
+
+    def test_client_does_not_send_when_wait_exceeds_max_wait(self, clock):
+        limiter = RateLimiter(rate=1, burst=1, max_wait=0)
+        client = MailerSendClient(api_key="test-key", rate_limiter=limiter)
+        client.session.request = Mock(return_value=self.make_response())
+
+        client.request("GET", "domains")
+        with pytest.raises(RateLimitExceeded):
+            client.request("GET", "domains")
+
+        assert client.session.request.call_count == 1
@@ -0,0 +1,200 @@
+"""Tests for the retry policy and the client retry loop."""
+
+from unittest.mock import Mock
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from mailersend.client import MailerSendClient
+from mailersend.exceptions import MailerSendError, RateLimitExceeded, ServerError
+from mailersend.retry import RetryPolicy, current_policy, retry_budget
+
+
+@pytest.fixture
+def clock(monkeypatch, fake_clock):
+    monkeypatch.setattr("mailersend.retry.time", fake_clock)
+    monkeypatch.setattr("mailersend.client.time", fake_clock)
+    return fake_clock
+
+
+def headers(**values):
+    return CaseInsensitiveDict(
+        {name.replace("_", "-"): str(value) for name, value in values.items()}
+    )
+
+
+class TestRetryPolicy:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"max_retries": -1}, {"base_delay": -1}, {"base_delay": 5, "max_delay": 1}],
+    )
+    def test_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            RetryPolicy(**kwargs)
+
+    def test_replace_keeps_other_settings(self):
+        policy = RetryPolicy(max_retries=5, base_delay=1).replace(max_retries=1)
+
+        assert policy.max_retries == 1
+        assert policy.base_delay == 1
+
+    def test_decorrelated_jitter_stays_within_bounds(self, clock):
+        policy = RetryPolicy(
+            max_retries=50, base_delay=1, max_delay=10, max_total_time=None
+        )
+        retry = policy.start("GET")
+
+        previous = 1
+        for _ in range(50):
+            delay = retry.delay_for_response(503, headers())
+            assert 1 <= delay <= min(10, previous * 3)
+            previous = delay
+
+    def test_delays_are_not_synchronized(self, clock):
+        policy = RetryPolicy(base_delay=1, max_delay=30)
+
+        delays = {
+            policy.start("GET").delay_for_response(500, headers()) for _ in range(20)
+        }
+
+        assert len(delays) > 1
+
+    def test_stops_after_max_retries(self, clock):
+        retry = RetryPolicy(max_retries=2).start("GET")
+
+        assert retry.delay_for_response(500, headers()) is not None
+        assert retry.delay_for_response(500, headers()) is not None
+        assert retry.delay_for_response(500, headers()) is None
+        assert retry.attempt == 2
+
+    @pytest.mark.parametrize("status_code", [200, 400, 404, 422])
+    def test_non_retryable_status(self, clock, status_code):
+        assert (
+            RetryPolicy().start("GET").delay_for_response(status_code, headers())
+            is None
+        )
+
+    @pytest.mark.parametrize("status_code", [429, 503])
+    def test_retry_after_is_honoured(self, clock, status_code):
+        retry = RetryPolicy(base_delay=0.5).start("GET")
+
+        delay = retry.delay_for_response(status_code, headers(retry_after=7))
+
+        assert 7 <= delay <= 7.5
+
+    def test_total_time_cap(self, clock):
+        retry = RetryPolicy(max_total_time=10).start("GET")
+        clock.now += 5
+
+        assert retry.delay_for_response(429, headers(retry_after=6)) is None
+        assert retry.delay_for_response(429, headers(retry_after=4)) is not None
+
+    def test_post_is_only_retried_when_unprocessed(self, clock):
+        assert RetryPolicy().start("POST").delay_for_response(503, headers()) is None
+        assert (
+            RetryPolicy().start("POST").delay_for_response(429, headers()) is not None
+        )
+        assert RetryPolicy().start("POST").delay_for_error(reached_server=True) is None
+        assert (
+            RetryPolicy().start("POST").delay_for_error(reached_server=False)
+            is not None
+        )
+
+
+class TestRetryBudget:
+    def test_overrides_apply_inside_block_only(self):
+        policy = RetryPolicy(max_retries=3)
+
+        with retry_budget(max_retries=1):
+            assert current_policy(policy).max_retries == 1
+            with retry_budget(max_total_time=5):
+                assert current_policy(policy).max_retries == 1
+                assert current_policy(policy).max_total_time == 5
+
+        assert current_policy(policy) is policy
+
+    def test_invalid_override_is_rejected(self):
+        with pytest.raises(TypeError):
+            with retry_budget(retries=1):
+                pass
+
+
+class TestClientRetries:
+    def make_client(self, responses, **kwargs):
+        client = MailerSendClient(api_key="test-key", **kwargs)
+        client.session.request = Mock(side_effect=responses)
+        return client
+
+    def make_response(self, status_code, **header_values):
+        response = Mock()
+        response.status_code = status_code
+        response.headers = headers(**header_values)
+        response.json.return_value = {"message": "error"}
+        return response
+
+    def test_retries_then_succeeds(self, clock):
+        client = self.make_client(
+            [
+                self.make_response(503),
+                self.make_response(429, retry_after=2),
+                self.make_response(200),
+            ]
+        )
+        client.request_logger = Mock()
+
+        response = client.request("GET", "domains")
+
+        assert response.status_code == 200
+        assert client.session.request.call_count == 3
+        assert 2 <= clock.sleeps[1] <= 2.5
+        assert [
+            call.args[0] for call in client.request_logger.log_retry.call_args_list
+        ] == [1, 2]
+
+    def test_raises_last_error_when_budget_is_exhausted(self, clock):
+        client = self.make_client([self.make_response(500)] * 3, max_retries=2)
+
+        with pytest.raises(ServerError):
+            client.request("GET", "domains")
+        assert client.session.request.call_count == 3
+
+    def test_send_is_not_retried_after_server_error(self, clock):
+        client = self.make_client([self.make_response(502), self.make_response(202)])
+
+        with pytest.raises(ServerError):
+            client.request("POST", "email", body={})
+        assert client.session.request.call_count == 1
+
+    def test_send_is_retried_after_connection_failure(self, clock):
+        refused = requests.ConnectionError(
+            MaxRetryError(None, "/email", NewConnectionError(None, "refused"))
+        )
+        client = self.make_client([refused, self.make_response(202)])
+
+        assert client.request("POST", "email", body={}).status_code == 202
+
+    def test_send_is_not_retried_after_read_timeout(self, clock):
+        client = self.make_client(
+            [requests.ReadTimeout("timed out"), self.make_response(202)]
+        )
+
+        with pytest.raises(MailerSendError):
+            client.request("POST", "email", body={})
+        assert client.session.request.call_count == 1
+
+    def test_per_call_policy(self, clock):
+        client = self.make_client([self.make_response(429)] * 2)
+
+        with pytest.raises(RateLimitExceeded):
+            client.request("GET", "domains", retry_policy=RetryPolicy(max_retries=0))
+        assert client.session.request.call_count == 1
+
+    def test_retry_budget_block(self, clock):
+        client = self.make_client([self.make_response(429)] * 5)
+
+        with retry_budget(max_retries=1):
+            with pytest.raises(RateLimitExceeded):
+                client.request("GET", "domains")
+        assert client.session.request.call_count == 2
@@ -0,0 +1,131 @@
+"""Tests for JSON encoding of request bodies and decoding of responses."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from mailersend import serialization
+from mailersend.client import MailerSendClient
+from mailersend.serialization import (
+    dumps,
+    loads,
+    model_json,
+    models_json_array,
+    response_json,
+)
+
+
+@pytest.fixture
+def make_email(make_email):
+    """Emails with non-ASCII text and nested data to exercise the encoder."""
+
+    def make_rich_email(index=0):
+        return make_email(
+            index,
+            **{
+                "from": {"email": "sender@example.com", "name": "Zoë"},
+                "html": "<p>Hi</p>",
+                "personalization": [
+                    {"email": f"recipient{index}@example.com", "data": {"n": index}}
+                ],
+            },
+        )
+
+    return make_rich_email
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+class TestCodec:
+    def test_round_trip(self, backend):
+        data = {"subject": "Zoë", "to": [{"email": "a@b.c"}], "n": 1.5, "ok": True}
+
+        encoded = dumps(data)
+
+        assert isinstance(encoded, bytes)
+        assert b" " not in encoded
+        assert loads(encoded) == data
+        assert json.loads(encoded) == data
+
+    def test_model_json_matches_model_dump(self, make_email):
+        email = make_email()
+
+        encoded = model_json(email)
+
+        assert json.loads(encoded) == email.model_dump(by_alias=True, exclude_none=True)
+        assert b'"from"' in encoded
+        assert b"null" not in encoded
+
+    def test_models_json_array(self, make_email):
+        emails = [make_email(i) for i in range(3)]
+
+        assert json.loads(models_json_array(emails)) == [
+            email.model_dump(by_alias=True, exclude_none=True) for email in emails
+        ]
+        assert models_json_array([]) == b"[]"
+
+    def test_response_json_decodes_content(self, backend):
+        response = Mock()
+        response.content = b'{"data": [1, 2]}'
+
+        assert response_json(response) == {"data": [1, 2]}
+        response.json.assert_not_called()
+
+
+class TestClientBodies:
+    def make_client(self):
+        client = MailerSendClient(api_key="test-key")
+        response = Mock()
+        response.status_code = 202
+        response.headers = CaseInsensitiveDict({"x-message-id": "msg-1"})
+        client.session.request = Mock(return_value=response)
+        return client
+
+    def test_email_is_sent_as_encoded_bytes(self, make_email):
+        client = self.make_client()
+        email = make_email()
+
+        client.emails.send(email)
+
+        kwargs = client.session.request.call_args.kwargs
+        assert kwargs["data"] == model_json(email)
+
+    def test_bulk_body_is_a_json_array(self, make_email):
+        client = self.make_client()
+        emails = [make_email(i) for i in range(2)]
+
+        client.emails.send_bulk(emails)
+
+        body = client.session.request.call_args.kwargs["data"]
+        assert json.loads(body)[1]["subject"] == "Email 1"
+
+    def test_dict_bodies_are_encoded_once(self, backend):
+        client = self.make_client()
+
+        client.request("POST", "domains", body={"name": "example.com"})
+
+        kwargs = client.session.request.call_args.kwargs
+        assert json.loads(kwargs["data"]) == {"name": "example.com"}
+        assert "json" not in kwargs
+
+    def test_idempotency_key_is_stable_for_encoded_bodies(self, make_email):
+        client = self.make_client()
+
+        client.emails.send(make_email())
+        client.emails.send(make_email())
+        client.emails.send(make_email(1))
+
+        keys = [
+            call.kwargs["headers"]["Idempotency-Key"]
+            for call in client.session.request.call_args_list
+        ]
+        assert keys[0] == keys[1] != keys[2]
@@ -101,4 +101,6 @@ class TestSmsActivity:
             method="GET", path="sms-messages/62134a2d7de3253bf10d6642"
         )
         assert result == self.mock_api_response
-        self.resource._create_response.assert_called_once_with(mock_response)
+        self.resource._create_response.assert_called_once_with(
+            mock_response, method="get"
+        )
@@ -160,7 +160,9 @@ class TestUsers:
         result = self.resource.list_invites(request)
 
         assert result == self.mock_api_response
-        self.resource._create_response.assert_called_once_with(mock_response)
+        self.resource._create_response.assert_called_once_with(
+            mock_response, method="list_invites"
+        )
 
     def test_get_invite_returns_api_response(self):
         """Test get_invite method returns APIResponse."""
@@ -175,7 +177,9 @@ class TestUsers:
             method="GET", path="invites/invite123"
         )
         assert result == self.mock_api_response
-        self.resource._create_response.assert_called_once_with(mock_response)
+        self.resource._create_response.assert_called_once_with(
+            mock_response, method="get_invite"
+        )
 
     def test_resend_invite_returns_api_response(self):
         """Test resend_invite method returns APIResponse."""
@@ -190,7 +194,9 @@ class TestUsers:
             method="POST", path="invites/invite123/resend"
         )
         assert result == self.mock_api_response
-        self.resource._create_response.assert_called_once_with(mock_response)
+        self.resource._create_response.assert_called_once_with(
+            mock_response, method="resend_invite"
+        )
 
     def test_cancel_invite_returns_api_response(self):
         """Test cancel_invite method returns APIResponse."""